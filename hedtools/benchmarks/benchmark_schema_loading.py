@@ -0,0 +1,131 @@
+"""
+Times loading the bundled HED7.1.1.xml schema.
+
+The single pass used by HedDictionary is compared with the per-attribute XPath scans it replaced, which are repeated
+here through the public get_tags_by_attribute and get_all_tags functions. Snapshot loading is timed for reference.
+
+Run from the hedtools directory:
+    python benchmarks/benchmark_schema_loading.py [--repeat N] [--hed-xml PATH]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from hed.util import schema_loader  # noqa: E402
+from hed.util.hed_dictionary import HedDictionary  # noqa: E402
+from hed.util.schema_node_map import SchemaNodeMap  # noqa: E402
+
+DEFAULT_HED_XML = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'data', 'HED7.1.1.xml')
+DEFAULT_REPEAT = 20
+
+
+def scan_tags_by_attribute(hed_dictionary):
+    """Finds the tags of every tag dictionary key with one XPath scan per key, as the dictionaries used to be loaded.
+
+    Parameters
+    ----------
+    hed_dictionary: HedDictionary
+        A HedDictionary whose root element has not been parsed yet.
+
+    Returns
+    -------
+    int
+        The number of tags found.
+
+    """
+    tag_count = 0
+    for attribute_name in HedDictionary.TAG_DICTIONARY_KEYS:
+        if attribute_name == HedDictionary.TAGS_DICTIONARY_KEY:
+            tags = hed_dictionary.get_all_tags()[0]
+        else:
+            tags = hed_dictionary.get_tags_by_attribute(attribute_name)[0]
+        tag_count += len(tags)
+    return tag_count
+
+
+def time_function(function, repeat):
+    """Times a function.
+
+    Parameters
+    ----------
+    function: function
+        The function to time. It is called without arguments.
+    repeat: int
+        The number of times to call the function.
+
+    Returns
+    -------
+    tuple
+        A tuple containing the best and the median time of one call, in seconds.
+
+    """
+    times = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start_time)
+    return min(times), statistics.median(times)
+
+
+def run_benchmarks(hed_xml_file_path, repeat=DEFAULT_REPEAT):
+    """Times each way of loading a HED XML file.
+
+    Parameters
+    ----------
+    hed_xml_file_path: str
+        The path to a HED XML file.
+    repeat: int
+        The number of times to load the file with each method.
+
+    Returns
+    -------
+    dict
+        A dictionary which associates the name of each benchmark with its best and median times in seconds.
+
+    """
+    temp_directory = tempfile.mkdtemp()
+    try:
+        snapshot_xml_file_path = os.path.join(temp_directory, os.path.basename(hed_xml_file_path))
+        shutil.copyfile(hed_xml_file_path, snapshot_xml_file_path)
+        HedDictionary(snapshot_xml_file_path).save_snapshot()
+
+        def load_schema_for_both():
+            schema_contents = schema_loader.read_schema(hed_xml_file_path)
+            HedDictionary(hed_xml_file_path, use_snapshot=False, schema_contents=schema_contents)
+            SchemaNodeMap(schema_contents=schema_contents)
+
+        benchmarks = {
+            'read_schema': lambda: schema_loader.read_schema(hed_xml_file_path),
+            'HedDictionary (single pass)': lambda: HedDictionary(hed_xml_file_path, use_snapshot=False),
+            'HedDictionary (snapshot)': lambda: HedDictionary(snapshot_xml_file_path),
+            'SchemaNodeMap': lambda: SchemaNodeMap(hed_xml_file_path),
+            'HedDictionary + SchemaNodeMap (shared pass)': load_schema_for_both,
+            'XPath scans per attribute (old loading)':
+                lambda: scan_tags_by_attribute(HedDictionary(snapshot_xml_file_path)),
+        }
+        return {name: time_function(function, repeat) for name, function in benchmarks.items()}
+    finally:
+        shutil.rmtree(temp_directory)
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description='Times loading a HED XML schema.')
+    parser.add_argument('--hed-xml', default=DEFAULT_HED_XML, help='The HED XML file to load.')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='The number of times to load the file.')
+    parsed_arguments = parser.parse_args(arguments)
+    results = run_benchmarks(parsed_arguments.hed_xml, parsed_arguments.repeat)
+    print(f'{os.path.basename(parsed_arguments.hed_xml)}, {parsed_arguments.repeat} runs (ms)')
+    print(f'{"benchmark":<46}{"best":>10}{"median":>10}')
+    for name, (best_time, median_time) in results.items():
+        print(f'{name:<46}{best_time * 1000:>10.2f}{median_time * 1000:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,406 @@
+"""
+Benchmark suite for the HED string delimiter, the tag validator, the tag converter, file validation, and schema
+loading.
+
+The benchmarks use the bundled schemas in tests/data and synthetic event files made by synthetic_events, so every
+run times the same work. The results are written as JSON and can be compared between commits:
+
+    python benchmarks/benchmark_suite.py run -o before.json
+    (change the code)
+    python benchmarks/benchmark_suite.py run -o after.json
+    python benchmarks/benchmark_suite.py compare before.json after.json --threshold 0.2
+
+compare exits with status 1 if any benchmark is slower than the baseline by more than the threshold. The profile
+sets the dataset sizes: quick runs 1k and 10k rows, standard adds 100k rows, and full adds 1M rows.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+import statistics
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIRECTORY, '..'))
+
+import synthetic_events  # noqa: E402
+from benchmark_schema_loading import time_function  # noqa: E402
+from hed.tools.tag_format import TagFormat  # noqa: E402
+from hed.util.hed_dictionary import HedDictionary  # noqa: E402
+from hed.util.hed_file_input import HedFileInput  # noqa: E402
+from hed.util.hed_parse_tree import scan_hed_string  # noqa: E402
+from hed.util.hed_string_delimiter import HedStringDelimiter  # noqa: E402
+from hed.util.schema_node_map import SchemaNodeMap  # noqa: E402
+from hed.validator.hed_validator import HedValidator  # noqa: E402
+from hed.validator.tag_validator import TagValidator  # noqa: E402
+
+RESULTS_FORMAT_VERSION = 1
+SCHEMA_DATA_DIRECTORY = os.path.join(BENCHMARKS_DIRECTORY, '..', 'tests', 'data')
+VALIDATION_SCHEMA = 'HED7.1.1.xml'
+CONVERSION_SCHEMA = 'reduced_no_dupe.xml'
+LOADING_SCHEMAS = ['HED7.1.1.xml', 'HED7.0.4.xml', 'reduced_no_dupe.xml']
+PROFILE_ROW_COUNTS = {'quick': [1000, 10000],
+                      'standard': [1000, 10000, 100000],
+                      'full': [1000, 10000, 100000, 1000000]}
+DEFAULT_PROFILE = 'standard'
+DEFAULT_REPEAT = 3
+SINGLE_RUN_ROW_COUNT = 1000000
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+COMPONENTS = ['delimiter', 'tag_validator', 'tag_format', 'hed_validator', 'schema_loading']
+
+
+def split_hed_strings(hed_strings):
+    """Splits HED strings with the HedStringDelimiter.
+
+    Parameters
+    ----------
+    hed_strings: list
+        The HED strings.
+
+    Returns
+    -------
+
+    """
+    for hed_string in hed_strings:
+        HedStringDelimiter(hed_string)
+
+
+def run_tag_validators(hed_dictionary, hed_strings):
+    """Runs the TagValidator validators on HED strings in the same order as HedValidator.
+
+    Each HED string is scanned once in the timed sections, as HedValidator does, and split outside of them, so only
+    the time spent in the scanner and the run_*_validators functions is counted.
+
+    Parameters
+    ----------
+    hed_dictionary: HedDictionary
+        The HedDictionary of the schema.
+    hed_strings: list
+        The HED strings.
+
+    Returns
+    -------
+    float
+        The time spent in the validators, in seconds.
+
+    """
+    tag_validator = TagValidator(hed_dictionary=hed_dictionary)
+    validator_time = 0
+    for hed_string in hed_strings:
+        start_time = time.perf_counter()
+        hed_string_scan = scan_hed_string(hed_string)
+        validation_issues = tag_validator.run_hed_string_validators(hed_string, hed_string_scan)
+        validator_time += time.perf_counter() - start_time
+        if validation_issues:
+            continue
+        parse_tree = HedStringDelimiter(hed_string, hed_string_scan).get_parse_tree()
+        start_time = time.perf_counter()
+        tag_validator.run_top_level_validators([tag.formatted_tag for tag in parse_tree.top_level_tags])
+        for tag_group in parse_tree.groups:
+            tag_validator.run_tag_level_validators(tag_group.original_tags, tag_group.formatted_tags)
+        tag_validator.run_tag_level_validators([tag.original_tag for tag in parse_tree.top_level_tags],
+                                               [tag.formatted_tag for tag in parse_tree.top_level_tags])
+        previous_original_tag = ''
+        previous_formatted_tag = ''
+        for tag in parse_tree.tags:
+            tag_validator.run_individual_tag_validators(tag.original_tag, tag.formatted_tag,
+                                                        previous_original_tag=previous_original_tag,
+                                                        previous_formatted_tag=previous_formatted_tag)
+            previous_original_tag = tag.original_tag
+            previous_formatted_tag = tag.formatted_tag
+        for tag_group in parse_tree.groups:
+            tag_validator.run_tag_group_validators(tag_group.original_tags, tag_group.text)
+        validator_time += time.perf_counter() - start_time
+    return validator_time
+
+
+def convert_hed_strings(tag_format, hed_strings):
+    """Converts HED strings to the short form and back to the long form.
+
+    Parameters
+    ----------
+    tag_format: TagFormat
+        The tag converter.
+    hed_strings: list
+        The HED strings in the long form.
+
+    Returns
+    -------
+
+    """
+    short_hed_strings = [short_hed_string for short_hed_string, _ in tag_format.convert_many(hed_strings)]
+    tag_format.convert_many(short_hed_strings, to_short=False)
+
+
+def validate_events_file(hed_dictionary, events_file_path):
+    """Validates a synthetic events file with the HedValidator.
+
+    Parameters
+    ----------
+    hed_dictionary: HedDictionary
+        The HedDictionary of the schema.
+    events_file_path: str
+        The path to the events file.
+
+    Returns
+    -------
+
+    """
+    with HedFileInput(events_file_path, tag_columns=[synthetic_events.EVENTS_FILE_HED_COLUMN],
+                      read_only=True) as hed_file_input:
+        HedValidator(hed_file_input, hed_dictionary=hed_dictionary)
+
+
+def time_sections(function, repeat):
+    """Times a benchmark function that returns the time of its own timed section.
+
+    Parameters
+    ----------
+    function: function
+        The benchmark function. It is called without arguments and returns a time in seconds.
+    repeat: int
+        The number of times to call the function.
+
+    Returns
+    -------
+    tuple
+        A tuple containing the best and the median time of one call, in seconds.
+
+    """
+    times = sorted(function() for _ in range(repeat))
+    return times[0], statistics.median(times)
+
+
+def make_result(component, dataset, rows, times):
+    """Makes the result of a benchmark.
+
+    Parameters
+    ----------
+    component: str
+        The component that was timed.
+    dataset: str
+        The name of the dataset or schema.
+    rows: int
+        The number of rows, or None if the benchmark does not process rows.
+    times: tuple
+        The best and median time of one run, in seconds.
+
+    Returns
+    -------
+    tuple
+        A tuple containing the name of the benchmark and its result dictionary.
+
+    """
+    best_time, median_time = times
+    name = f'{component}/{dataset}' if rows is None else f'{component}/{dataset}/{rows}'
+    result = {'component': component, 'dataset': dataset, 'rows': rows,
+              'best_seconds': best_time, 'median_seconds': median_time}
+    if rows:
+        result['rows_per_second'] = rows / best_time if best_time else None
+    return name, result
+
+
+def run_suite(row_counts, components=None, repeat=DEFAULT_REPEAT, data_directory=None, progress=print):
+    """Runs the benchmarks.
+
+    Parameters
+    ----------
+    row_counts: list
+        The numbers of rows of the synthetic datasets.
+    components: list
+        The components to time. All of them by default.
+    repeat: int
+        The number of times each benchmark is run. Datasets of SINGLE_RUN_ROW_COUNT rows or more are run once.
+    data_directory: str
+        The directory the synthetic event files are written to. A temporary directory is used and removed if not
+        given.
+    progress: function
+        A function that is passed a line of text as each benchmark finishes.
+
+    Returns
+    -------
+    dict
+        A dictionary which associates the name of each benchmark with its result.
+
+    """
+    if components is None:
+        components = COMPONENTS
+    results = {}
+    temp_directory = None
+    if data_directory is None:
+        data_directory = temp_directory = tempfile.mkdtemp()
+    try:
+        if 'schema_loading' in components:
+            for schema_file in LOADING_SCHEMAS:
+                hed_xml_file_path = os.path.join(SCHEMA_DATA_DIRECTORY, schema_file)
+                for name, function in [('HedDictionary', lambda path=hed_xml_file_path: HedDictionary(
+                                            path, use_snapshot=False)),
+                                       ('SchemaNodeMap', lambda path=hed_xml_file_path: SchemaNodeMap(path))]:
+                    name, result = make_result(f'schema_loading/{name}', schema_file, None,
+                                               time_function(function, max(repeat, DEFAULT_REPEAT) * 3))
+                    results[name] = result
+                    progress(_format_result(name, result))
+
+        row_components = [component for component in components if component != 'schema_loading']
+        if not row_components:
+            return results
+        hed_dictionary = HedDictionary(os.path.join(SCHEMA_DATA_DIRECTORY, VALIDATION_SCHEMA), use_snapshot=False)
+        schema_tags = synthetic_events.get_schema_tags(hed_dictionary)
+        conversion_xml_file_path = os.path.join(SCHEMA_DATA_DIRECTORY, CONVERSION_SCHEMA)
+        conversion_tags = synthetic_events.get_schema_tags(HedDictionary(conversion_xml_file_path,
+                                                                         use_snapshot=False))
+        tag_format = TagFormat(conversion_xml_file_path)
+        for row_count in row_counts:
+            row_repeat = 1 if row_count >= SINGLE_RUN_ROW_COUNT else repeat
+            for variant in synthetic_events.DATASET_VARIANTS:
+                benchmarks = []
+                hed_strings = synthetic_events.generate_hed_strings(schema_tags, row_count, variant)
+                if 'delimiter' in row_components:
+                    benchmarks.append(('delimiter', lambda strings=hed_strings: split_hed_strings(strings)))
+                if 'tag_validator' in row_components:
+                    benchmarks.append(('tag_validator',
+                                       lambda strings=hed_strings: run_tag_validators(hed_dictionary, strings)))
+                if 'tag_format' in row_components:
+                    conversion_hed_strings = synthetic_events.generate_hed_strings(conversion_tags, row_count,
+                                                                                   variant)
+                    benchmarks.append(('tag_format', lambda strings=conversion_hed_strings: convert_hed_strings(
+                        tag_format, strings)))
+                if 'hed_validator' in row_components:
+                    events_file_path = synthetic_events.write_events_file(
+                        os.path.join(data_directory, f'{variant.name}_{row_count}_events.tsv'), hed_strings)
+                    benchmarks.append(('hed_validator', lambda path=events_file_path: validate_events_file(
+                        hed_dictionary, path)))
+                for component, function in benchmarks:
+                    if component == 'tag_validator':
+                        times = time_sections(function, row_repeat)
+                    else:
+                        times = time_function(function, row_repeat)
+                    name, result = make_result(component, variant.name, row_count, times)
+                    results[name] = result
+                    progress(_format_result(name, result))
+    finally:
+        if temp_directory is not None:
+            shutil.rmtree(temp_directory)
+    return results
+
+
+def compare_results(baseline_results, current_results, threshold=DEFAULT_REGRESSION_THRESHOLD,
+                    statistic='best_seconds'):
+    """Compares the results of two runs of the suite.
+
+    Parameters
+    ----------
+    baseline_results: dict
+        The results of the baseline run.
+    current_results: dict
+        The results of the current run.
+    threshold: float
+        The fraction by which a benchmark may be slower than the baseline before it counts as a regression.
+    statistic: str
+        The time that is compared, either 'best_seconds' or 'median_seconds'.
+
+    Returns
+    -------
+    list
+        A list of (name, baseline time, current time, ratio, is regression) tuples for the benchmarks in both runs.
+
+    """
+    comparisons = []
+    for name, current_result in current_results.items():
+        baseline_result = baseline_results.get(name)
+        if baseline_result is None or not baseline_result[statistic]:
+            continue
+        ratio = current_result[statistic] / baseline_result[statistic]
+        comparisons.append((name, baseline_result[statistic], current_result[statistic], ratio,
+                            ratio > 1 + threshold))
+    return comparisons
+
+
+def _format_result(name, result):
+    line = f'{name:<60}{result["best_seconds"] * 1000:>12.2f} ms'
+    if result.get('rows_per_second'):
+        line += f'{result["rows_per_second"]:>14.0f} rows/s'
+    return line
+
+
+def _get_git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=BENCHMARKS_DIRECTORY, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _run_command(parsed_arguments):
+    row_counts = PROFILE_ROW_COUNTS[parsed_arguments.profile]
+    if parsed_arguments.rows:
+        row_counts = [int(row_count) for row_count in parsed_arguments.rows.split(',')]
+    components = parsed_arguments.components.split(',') if parsed_arguments.components else None
+    results = run_suite(row_counts, components, parsed_arguments.repeat, parsed_arguments.data_dir)
+    output = {'format_version': RESULTS_FORMAT_VERSION,
+              'metadata': {'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                           'git_commit': _get_git_commit(),
+                           'python_version': platform.python_version(),
+                           'platform': platform.platform(),
+                           'profile': parsed_arguments.profile,
+                           'row_counts': row_counts,
+                           'repeat': parsed_arguments.repeat},
+              'results': results}
+    if parsed_arguments.output:
+        with open(parsed_arguments.output, 'w') as output_file:
+            json.dump(output, output_file, indent=2)
+        print(f'Results written to {parsed_arguments.output}')
+    return 0
+
+
+def _compare_command(parsed_arguments):
+    with open(parsed_arguments.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    with open(parsed_arguments.current) as current_file:
+        current = json.load(current_file)
+    statistic = parsed_arguments.statistic + '_seconds'
+    comparisons = compare_results(baseline['results'], current['results'], parsed_arguments.threshold, statistic)
+    regression_count = 0
+    for name, baseline_time, current_time, ratio, is_regression in comparisons:
+        regression_count += is_regression
+        marker = '  REGRESSION' if is_regression else ''
+        print(f'{name:<60}{baseline_time * 1000:>12.2f}{current_time * 1000:>12.2f}{ratio:>8.2f}x{marker}')
+    print(f'{len(comparisons)} benchmarks compared, {regression_count} slower than the baseline by more than '
+          f'{parsed_arguments.threshold:.0%}')
+    return 1 if regression_count else 0
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description='Runs the HED tools benchmark suite.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    run_parser = subparsers.add_parser('run', help='Run the benchmarks.')
+    run_parser.add_argument('-o', '--output', help='The JSON file to write the results to.')
+    run_parser.add_argument('--profile', choices=sorted(PROFILE_ROW_COUNTS), default=DEFAULT_PROFILE,
+                            help='The dataset sizes to run.')
+    run_parser.add_argument('--rows', help='Comma-separated dataset sizes. Overrides the profile.')
+    run_parser.add_argument('--components', help='Comma-separated components to run, from %s.' %
+                                                 ', '.join(COMPONENTS))
+    run_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                            help='The number of times each benchmark is run.')
+    run_parser.add_argument('--data-dir', help='The directory to write the synthetic event files to.')
+    compare_parser = subparsers.add_parser('compare', help='Compare two result files.')
+    compare_parser.add_argument('baseline', help='The JSON results of the baseline run.')
+    compare_parser.add_argument('current', help='The JSON results of the current run.')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                                help='The fraction by which a benchmark may be slower than the baseline.')
+    compare_parser.add_argument('--statistic', choices=['best', 'median'], default='best',
+                                help='The time that is compared.')
+    parsed_arguments = parser.parse_args(arguments)
+    if parsed_arguments.command == 'run':
+        return _run_command(parsed_arguments)
+    return _compare_command(parsed_arguments)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+Generates synthetic HED event files for the benchmarks.
+
+The HED strings are built from the tags of a schema with a seeded random number generator, so the same arguments
+always give the same strings. A dataset varies in its number of rows, its tag diversity, which is the number of schema
+tags used and the number of distinct HED strings, and the nesting depth of the tag groups in each string.
+"""
+
+import os
+import random
+
+from hed.util.hed_dictionary import HedDictionary
+
+EVENTS_FILE_COLUMN_NAMES = ['onset', 'duration', 'HED']
+EVENTS_FILE_HED_COLUMN = 3
+DEFAULT_TAGS_PER_STRING = 8
+DEFAULT_SEED = 0
+
+
+class DatasetVariant:
+    """The tag diversity and nesting depth of a synthetic dataset.
+
+       vocabulary_size is the number of schema tags used, or None for all of them. distinct_strings is the number of
+       distinct HED strings, or None for a different string in every row. nesting_depth is the number of nested tag
+       groups in each string.
+    """
+    __slots__ = ('name', 'vocabulary_size', 'distinct_strings', 'nesting_depth')
+
+    def __init__(self, name, vocabulary_size, distinct_strings, nesting_depth):
+        self.name = name
+        self.vocabulary_size = vocabulary_size
+        self.distinct_strings = distinct_strings
+        self.nesting_depth = nesting_depth
+
+
+DATASET_VARIANTS = [DatasetVariant('low-diversity-flat', 50, 100, 0),
+                    DatasetVariant('low-diversity-nested', 50, 100, 3),
+                    DatasetVariant('high-diversity-flat', None, None, 0),
+                    DatasetVariant('high-diversity-nested', None, None, 3)]
+
+
+def get_schema_tags(hed_dictionary):
+    """Gets the tags of a schema that can be used in a HED string on their own.
+
+    Tags that require a child are left out, and each tag that takes a value is given a value, with a unit if the tag
+    has unit classes.
+
+    Parameters
+    ----------
+    hed_dictionary: HedDictionary
+        The HedDictionary of the schema.
+
+    Returns
+    -------
+    list
+        The tags in their long form, in schema order.
+
+    """
+    schema_tags = []
+    for lowercase_tag, tag in hed_dictionary.dictionaries[HedDictionary.TAGS_DICTIONARY_KEY].items():
+        if hed_dictionary.tag_has_attribute(lowercase_tag, HedDictionary.REQUIRE_CHILD_ATTRIBUTE):
+            continue
+        if tag.endswith('/' + HedDictionary.TAKES_VALUE_CHILD):
+            tag_record = hed_dictionary.tag_records[lowercase_tag[:-2]]
+            if tag_record.default_unit:
+                tag = tag[:-1] + '3 ' + tag_record.default_unit
+            elif tag_record.unit_classes:
+                tag = tag[:-1] + '3'
+            else:
+                tag = tag[:-1] + 'Label text'
+        schema_tags.append(tag)
+    return schema_tags
+
+
+def generate_hed_string(rng, vocabulary, tag_count, nesting_depth):
+    """Generates a HED string.
+
+    Parameters
+    ----------
+    rng: random.Random
+        The random number generator.
+    vocabulary: list
+        The tags to choose from.
+    tag_count: int
+        The number of tags in the string.
+    nesting_depth: int
+        The number of nested tag groups. Each group is placed between two tags of the enclosing level and holds the
+        next group.
+
+    Returns
+    -------
+    str
+        The HED string.
+
+    """
+    tags = [rng.choice(vocabulary) for _ in range(tag_count)]
+    return _join_nested_tags(tags, nesting_depth)
+
+
+def _join_nested_tags(tags, nesting_depth):
+    """Joins tags into a HED string with nested tag groups.
+
+    Parameters
+    ----------
+    tags: list
+        The tags to join.
+    nesting_depth: int
+        The number of nested tag groups.
+
+    Returns
+    -------
+    str
+        The HED string.
+
+    """
+    if nesting_depth <= 0 or len(tags) < 3:
+        return ', '.join(tags)
+    group_string = _join_nested_tags(tags[1:-1], nesting_depth - 1)
+    return f'{tags[0]}, ({group_string}), {tags[-1]}'
+
+
+def generate_hed_strings(schema_tags, row_count, variant, tags_per_string=DEFAULT_TAGS_PER_STRING,
+                         seed=DEFAULT_SEED):
+    """Generates the HED strings of a synthetic dataset.
+
+    Parameters
+    ----------
+    schema_tags: list
+        The tags of the schema, as returned by get_schema_tags.
+    row_count: int
+        The number of HED strings.
+    variant: DatasetVariant
+        The tag diversity and nesting depth of the dataset.
+    tags_per_string: int
+        The number of tags in each HED string.
+    seed: int
+        The seed of the random number generator.
+
+    Returns
+    -------
+    list
+        The HED strings.
+
+    """
+    rng = random.Random(seed)
+    vocabulary = schema_tags
+    if variant.vocabulary_size is not None and variant.vocabulary_size < len(schema_tags):
+        vocabulary = rng.sample(schema_tags, variant.vocabulary_size)
+    if variant.distinct_strings is None or variant.distinct_strings >= row_count:
+        return [generate_hed_string(rng, vocabulary, tags_per_string, variant.nesting_depth)
+                for _ in range(row_count)]
+    distinct_hed_strings = [generate_hed_string(rng, vocabulary, tags_per_string, variant.nesting_depth)
+                            for _ in range(variant.distinct_strings)]
+    return [rng.choice(distinct_hed_strings) for _ in range(row_count)]
+
+
+def write_events_file(events_file_path, hed_strings):
+    """Writes HED strings to a tab-separated events file with onset, duration, and HED columns.
+
+    Parameters
+    ----------
+    events_file_path: str
+        The path to the events file.
+    hed_strings: list
+        The HED string of each row.
+
+    Returns
+    -------
+    str
+        The path to the events file.
+
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(events_file_path)), exist_ok=True)
+    with open(events_file_path, 'w', encoding='utf-8') as events_file:
+        events_file.write('\t'.join(EVENTS_FILE_COLUMN_NAMES) + '\n')
+        for row_number, hed_string in enumerate(hed_strings):
+            events_file.write(f'{row_number * 0.5:.1f}\t0.1\t{hed_string}\n')
+    return events_file_path
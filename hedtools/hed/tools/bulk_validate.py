@@ -0,0 +1,535 @@
+"""
+Command-line tool that validates a directory tree or glob of .tsv/.xlsx files with HedValidator.
+
+Files are validated in parallel by a pool of worker processes. Each worker builds the schema for a HED version once
+through the schema registry and reuses it for every file that uses that version. The HED version of a file is taken
+from the command line, or otherwise from the HEDVersion field of the nearest BIDS dataset_description.json above it,
+or otherwise the latest version in the HED cache is used.
+
+The issues of each file are written to the output directory under the relative path of the file, so a large dataset
+is spread over the same directory tree as its input. A summary.json in the output directory records the counts and
+content hash of every file and of its HED XML file. With --resume, files whose content, HED schema content, and
+validation settings are unchanged since the last summary are skipped.
+
+Example:
+    hed-validate /data/bids_dataset --tag-column-names HED --workers 8 --output-dir /data/hed_issues --resume
+"""
+
+import argparse
+import concurrent.futures
+import glob
+import hashlib
+import json
+import os
+import sys
+import traceback
+
+from hed.util import hed_cache
+from hed.util import schema_registry
+from hed.util import schema_snapshot
+from hed.util.hed_file_input import HedFileInput
+from hed.validator.hed_validator import HedValidator
+
+VALIDATED_EXTENSIONS = ('.tsv', '.xlsx')
+DATASET_DESCRIPTION_FILENAME = 'dataset_description.json'
+HED_VERSION_FIELD = 'HEDVersion'
+SUMMARY_FILENAME = 'summary.json'
+ISSUES_FILE_SUFFIX = '.issues.txt'
+HASH_BLOCK_SIZE = 1024 * 1024
+SUMMARY_CHECKPOINT_INTERVAL = 100
+STATUS_VALIDATED = 'validated'
+STATUS_SKIPPED = 'skipped'
+STATUS_FAILED = 'failed'
+STATUS_NO_TAG_COLUMNS = 'no_tag_columns'
+
+
+def main(arguments=None):
+    """Runs the bulk validation command.
+
+    Parameters
+    ----------
+    arguments: list
+        The command-line arguments. The arguments of the process are used if not given.
+    Returns
+    -------
+    int
+        The exit status. 0 if no file has validation errors or failed to validate, 1 otherwise.
+
+    """
+    options = _get_argument_parser().parse_args(arguments)
+    input_files = find_input_files(options.inputs)
+    if not input_files:
+        print('No %s files were found.' % ' or '.join(VALIDATED_EXTENSIONS), file=sys.stderr)
+        return 1
+    summary = validate_files(input_files, options.output_dir, hed_xml_file=options.hed_xml,
+                             hed_version=options.hed_version, tag_columns=options.tag_columns,
+                             tag_column_names=options.tag_column_names,
+                             has_column_names=not options.no_column_names, worksheet_name=options.worksheet,
+                             check_for_warnings=options.check_for_warnings, workers=options.workers,
+                             resume=options.resume)
+    totals = summary['totals']
+    print('%(files)d files: %(validated)d validated, %(skipped)d skipped, %(failed)d failed. '
+          '%(errors)d errors, %(warnings)d warnings.' % totals)
+    return 1 if totals['errors'] or totals['failed'] else 0
+
+
+def find_input_files(inputs):
+    """Finds the files to validate.
+
+    Parameters
+    ----------
+    inputs: list
+        A list of files, directories, and glob patterns. Directories are searched recursively.
+    Returns
+    -------
+    list
+        A sorted list of the absolute paths of the .tsv and .xlsx files that were found.
+
+    """
+    input_files = set()
+    for input_path in inputs:
+        if os.path.isdir(input_path):
+            for directory_path, _, filenames in os.walk(input_path):
+                input_files.update(os.path.join(directory_path, filename) for filename in filenames
+                                   if filename.lower().endswith(VALIDATED_EXTENSIONS))
+        elif os.path.isfile(input_path):
+            input_files.add(input_path)
+        else:
+            input_files.update(path for path in glob.glob(input_path, recursive=True)
+                               if os.path.isfile(path) and path.lower().endswith(VALIDATED_EXTENSIONS))
+    return sorted(os.path.abspath(input_file) for input_file in input_files)
+
+
+def validate_files(input_files, output_dir, hed_xml_file=None, hed_version=None, tag_columns=None,
+                   tag_column_names=None, has_column_names=True, worksheet_name=None, check_for_warnings=False,
+                   workers=None, resume=False):
+    """Validates files and writes their issues and a summary to the output directory.
+
+    Parameters
+    ----------
+    input_files: list
+        The absolute paths of the files to validate.
+    output_dir: str
+        The directory the issue files and the summary are written to.
+    hed_xml_file: str
+        The HED XML file used for every file. Takes precedence over hed_version.
+    hed_version: str
+        The HED version in the HED cache used for every file. If neither this nor hed_xml_file is given, the version
+        is found in the BIDS dataset_description.json of each file.
+    tag_columns: list
+        The columns that contain HED tags, starting at 1.
+    tag_column_names: list
+        The names of the columns that contain HED tags. Used instead of tag_columns when the file has column names.
+    has_column_names: bool
+        True if the files have a header row.
+    worksheet_name: str
+        The worksheet of the Excel files to validate.
+    check_for_warnings: bool
+        True if warnings should be reported.
+    workers: int
+        The number of worker processes. The number of processors is used if not given. With 1 the files are
+        validated in this process.
+    resume: bool
+        True if files that are unchanged since the summary in the output directory should be skipped.
+    Returns
+    -------
+    dict
+        The summary that was written to summary.json.
+
+    """
+    settings = {'tag_columns': tag_columns or [2], 'tag_column_names': tag_column_names or [],
+                'has_column_names': has_column_names, 'worksheet_name': worksheet_name,
+                'check_for_warnings': check_for_warnings}
+    previous_entries = _read_previous_entries(output_dir, settings) if resume else {}
+    root_directory = _get_root_directory(input_files)
+    summary = {'settings': settings, 'files': {}}
+    version_paths = {}
+    schema_hashes = {}
+    pending_tasks = []
+    for input_file in input_files:
+        relative_path = os.path.relpath(input_file, root_directory)
+        entry = {'path': input_file, 'sha256': _calculate_sha256(input_file)}
+        try:
+            entry['hed_xml_file'] = _get_hed_xml_file(input_file, hed_xml_file, hed_version, version_paths)
+            if entry['hed_xml_file'] not in schema_hashes:
+                schema_hashes[entry['hed_xml_file']] = schema_snapshot.calculate_xml_hash(entry['hed_xml_file'])
+            entry['hed_xml_hash'] = schema_hashes[entry['hed_xml_file']]
+        except (ValueError, OSError) as e:
+            summary['files'][relative_path] = dict(entry, status=STATUS_FAILED, error=str(e))
+            continue
+        previous_entry = previous_entries.get(relative_path)
+        if previous_entry and previous_entry.get('status') != STATUS_FAILED and \
+                previous_entry.get('sha256') == entry['sha256'] and \
+                previous_entry.get('hed_xml_hash') == entry['hed_xml_hash']:
+            summary['files'][relative_path] = dict(previous_entry, status=STATUS_SKIPPED)
+            continue
+        output_file = os.path.join(output_dir, relative_path + ISSUES_FILE_SUFFIX)
+        pending_tasks.append((relative_path, entry, (input_file, entry['hed_xml_file'], output_file, settings)))
+
+    os.makedirs(output_dir, exist_ok=True)
+    for completed_count, (relative_path, entry) in enumerate(_run_tasks(pending_tasks, workers), 1):
+        summary['files'][relative_path] = entry
+        if completed_count % SUMMARY_CHECKPOINT_INTERVAL == 0:
+            _write_summary(output_dir, summary)
+    _write_summary(output_dir, summary)
+    return summary
+
+
+def find_dataset_hed_version(file_path, version_cache=None):
+    """Finds the HED version of a file in the BIDS dataset_description.json of its dataset.
+
+    Parameters
+    ----------
+    file_path: str
+        The path of a file in a BIDS dataset.
+    version_cache: dict
+        A dictionary used to remember the version found for each directory.
+    Returns
+    -------
+    str
+        The HEDVersion of the nearest dataset_description.json above the file, without any 'HED' prefix. None if
+        there is no dataset_description.json with a HEDVersion.
+
+    """
+    if version_cache is None:
+        version_cache = {}
+    searched_directories = []
+    directory = os.path.dirname(os.path.abspath(file_path))
+    hed_version = None
+    while True:
+        if directory in version_cache:
+            hed_version = version_cache[directory]
+            break
+        searched_directories.append(directory)
+        hed_version = _read_dataset_hed_version(os.path.join(directory, DATASET_DESCRIPTION_FILENAME))
+        parent_directory = os.path.dirname(directory)
+        if hed_version is not None or parent_directory == directory:
+            break
+        directory = parent_directory
+    for searched_directory in searched_directories:
+        version_cache[searched_directory] = hed_version
+    return hed_version
+
+
+def _read_dataset_hed_version(dataset_description_file):
+    """Reads the HED version from a dataset_description.json file.
+
+    Parameters
+    ----------
+    dataset_description_file: str
+        The path of the dataset_description.json file.
+    Returns
+    -------
+    str
+        The HED version. None if the file does not exist or has no HEDVersion.
+
+    """
+    if not os.path.isfile(dataset_description_file):
+        return None
+    with open(dataset_description_file, 'r', encoding='utf-8') as opened_file:
+        hed_version = json.load(opened_file).get(HED_VERSION_FIELD)
+    if not hed_version:
+        return None
+    if hed_version.startswith(hed_cache.HED_XML_PREFIX):
+        hed_version = hed_version[len(hed_cache.HED_XML_PREFIX):]
+    return hed_version
+
+
+def _get_hed_xml_file(input_file, hed_xml_file, hed_version, version_paths):
+    """Gets the HED XML file used to validate a file.
+
+    Parameters
+    ----------
+    input_file: str
+        The path of the file.
+    hed_xml_file: str
+        The HED XML file given on the command line.
+    hed_version: str
+        The HED version given on the command line.
+    version_paths: dict
+        A dictionary used to remember the HED XML file of each version and the version of each directory.
+    Returns
+    -------
+    str
+        The absolute path of the HED XML file.
+
+    """
+    if hed_xml_file:
+        return os.path.abspath(hed_xml_file)
+    if not hed_version:
+        hed_version = find_dataset_hed_version(input_file, version_paths.setdefault('directories', {}))
+    versions = version_paths.setdefault('versions', {})
+    if hed_version not in versions:
+        version_file = hed_cache.get_latest_hed_version_path(get_specific_version=hed_version)
+        if not version_file or not os.path.isfile(version_file):
+            raise ValueError('HED version %s is not in the HED cache' % (hed_version or 'latest'))
+        versions[hed_version] = os.path.abspath(version_file)
+    return versions[hed_version]
+
+
+def _run_tasks(tasks, workers):
+    """Validates files in this process or in a pool of worker processes.
+
+    Parameters
+    ----------
+    tasks: list
+        A list of (relative path, summary entry, validation arguments) tuples.
+    workers: int
+        The number of worker processes.
+    Yields
+    -------
+    tuple
+        The relative path and completed summary entry of each file, in the order they finish.
+
+    """
+    if workers == 1 or len(tasks) <= 1:
+        for relative_path, entry, validation_arguments in tasks:
+            yield relative_path, dict(entry, **_validate_file(*validation_arguments))
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_validate_file, *validation_arguments): (relative_path, entry)
+                   for relative_path, entry, validation_arguments in tasks}
+        for future in concurrent.futures.as_completed(futures):
+            relative_path, entry = futures[future]
+            yield relative_path, dict(entry, **future.result())
+
+
+def _validate_file(input_file, hed_xml_file, output_file, settings):
+    """Validates a file and writes its issues. Runs in a worker process.
+
+    Parameters
+    ----------
+    input_file: str
+        The path of the file.
+    hed_xml_file: str
+        The path of the HED XML file.
+    output_file: str
+        The path of the file the issues are written to. It is removed if there are no issues.
+    settings: dict
+        The validation settings.
+    Returns
+    -------
+    dict
+        The status and issue counts of the file.
+
+    """
+    try:
+        hed_dictionary = schema_registry.get_hed_dictionary(hed_xml_file)
+        tag_columns = _get_tag_columns(input_file, settings)
+        if not tag_columns:
+            _remove_file_if_it_exists(output_file)
+            return {'status': STATUS_NO_TAG_COLUMNS, 'issues': 0, 'errors': 0, 'warnings': 0}
+        hed_validator = HedValidator([], check_for_warnings=settings['check_for_warnings'],
+                                     hed_dictionary=hed_dictionary)
+        with HedFileInput(input_file, worksheet_name=settings['worksheet_name'], tag_columns=tag_columns,
+                          has_column_names=settings['has_column_names'], read_only=True) as hed_file_input:
+            error_count, warning_count = _write_issues(hed_validator.iter_validation_issues(hed_file_input),
+                                                       output_file)
+        result = {'status': STATUS_VALIDATED, 'issues': error_count + warning_count, 'errors': error_count,
+                  'warnings': warning_count}
+        if result['issues']:
+            result['output_file'] = output_file
+        return result
+    except Exception:
+        return {'status': STATUS_FAILED, 'error': traceback.format_exc(limit=1).strip()}
+
+
+def _get_tag_columns(input_file, settings):
+    """Gets the columns of a file that contain HED tags.
+
+    Parameters
+    ----------
+    input_file: str
+        The path of the file.
+    settings: dict
+        The validation settings.
+    Returns
+    -------
+    list
+        The columns that contain HED tags, starting at 1.
+
+    """
+    if not settings['tag_column_names'] or not settings['has_column_names']:
+        return settings['tag_columns']
+    with HedFileInput(input_file, worksheet_name=settings['worksheet_name'], read_only=True) as hed_file_input:
+        column_names = hed_file_input.get_column_names()
+    return [column_index + 1 for column_index, column_name in enumerate(column_names)
+            if column_name in settings['tag_column_names']]
+
+
+def _write_issues(validation_issues, output_file):
+    """Writes the messages of validation issues to a file as they are found, counting the errors and warnings.
+
+    The counts come from the issues themselves, so string-level errors such as extra delimiters and unbalanced
+    parentheses are counted too. The row and column issues giving the location of other issues are not counted.
+
+    Parameters
+    ----------
+    validation_issues: iterable
+        The validation issues.
+    output_file: str
+        The path of the file. It is only created if there are issues, and is removed otherwise.
+    Returns
+    -------
+    tuple
+        The number of errors and the number of warnings written.
+
+    """
+    opened_file = None
+    error_count = 0
+    warning_count = 0
+    try:
+        for validation_issue in validation_issues:
+            if opened_file is None:
+                os.makedirs(os.path.dirname(output_file), exist_ok=True)
+                opened_file = open(output_file, 'w', encoding='utf-8')
+            opened_file.write(validation_issue['message'])
+            if HedValidator.count_errors((validation_issue,)):
+                error_count += 1
+            elif validation_issue['code'] not in HedValidator.ISSUE_LOCATION_CODES:
+                warning_count += 1
+    finally:
+        if opened_file is not None:
+            opened_file.close()
+    if opened_file is None:
+        _remove_file_if_it_exists(output_file)
+    return error_count, warning_count
+
+
+def _remove_file_if_it_exists(file_path):
+    """Removes a file if it exists.
+
+    Parameters
+    ----------
+    file_path: str
+        The path of the file.
+    Returns
+    -------
+
+    """
+    if os.path.isfile(file_path):
+        os.remove(file_path)
+
+
+def _calculate_sha256(file_path):
+    """Calculates the SHA-256 hash of the content of a file.
+
+    Parameters
+    ----------
+    file_path: str
+        The path of the file.
+    Returns
+    -------
+    str
+        The hexadecimal digest of the file.
+
+    """
+    sha256 = hashlib.sha256()
+    with open(file_path, 'rb') as opened_file:
+        for block in iter(lambda: opened_file.read(HASH_BLOCK_SIZE), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def _get_root_directory(input_files):
+    """Gets the directory that the issue files are placed relative to.
+
+    Parameters
+    ----------
+    input_files: list
+        The absolute paths of the files to validate.
+    Returns
+    -------
+    str
+        The deepest directory containing all of the files.
+
+    """
+    return os.path.commonpath([os.path.dirname(input_file) for input_file in input_files])
+
+
+def _read_previous_entries(output_dir, settings):
+    """Reads the file entries of the summary of a previous run.
+
+    Parameters
+    ----------
+    output_dir: str
+        The output directory of the previous run.
+    settings: dict
+        The validation settings of this run.
+    Returns
+    -------
+    dict
+        The file entries of the previous summary. Empty if there is no summary or it used different settings.
+
+    """
+    summary_file = os.path.join(output_dir, SUMMARY_FILENAME)
+    if not os.path.isfile(summary_file):
+        return {}
+    with open(summary_file, 'r', encoding='utf-8') as opened_file:
+        previous_summary = json.load(opened_file)
+    if previous_summary.get('settings') != settings:
+        return {}
+    return previous_summary.get('files', {})
+
+
+def _write_summary(output_dir, summary):
+    """Adds the totals to a summary and writes it to summary.json in the output directory.
+
+    Parameters
+    ----------
+    output_dir: str
+        The output directory.
+    summary: dict
+        The summary.
+    Returns
+    -------
+
+    """
+    entries = summary['files'].values()
+    summary['totals'] = {'files': len(summary['files']),
+                         'validated': sum(entry['status'] == STATUS_VALIDATED for entry in entries),
+                         'skipped': sum(entry['status'] == STATUS_SKIPPED for entry in entries),
+                         'failed': sum(entry['status'] == STATUS_FAILED for entry in entries),
+                         'issues': sum(entry.get('issues', 0) for entry in entries),
+                         'errors': sum(entry.get('errors', 0) for entry in entries),
+                         'warnings': sum(entry.get('warnings', 0) for entry in entries)}
+    summary_file = os.path.join(output_dir, SUMMARY_FILENAME)
+    temporary_summary_file = summary_file + '.tmp'
+    with open(temporary_summary_file, 'w', encoding='utf-8') as opened_file:
+        json.dump(summary, opened_file, indent=2, sort_keys=True)
+    os.replace(temporary_summary_file, summary_file)
+
+
+def _get_argument_parser():
+    """Creates the parser for the command-line arguments.
+
+    Returns
+    -------
+    ArgumentParser
+        The argument parser.
+
+    """
+    parser = argparse.ArgumentParser(description='Validate the HED tags in .tsv and .xlsx files.')
+    parser.add_argument('inputs', nargs='+', help='Files, directories, or glob patterns of files to validate.')
+    parser.add_argument('-o', '--output-dir', default='hed_validation',
+                        help='Directory for the issue files and summary.json.')
+    parser.add_argument('--hed-xml', help='HED XML file used to validate every file.')
+    parser.add_argument('--hed-version',
+                        help='HED version in the HED cache used to validate every file. By default the HEDVersion in '
+                             'the BIDS dataset_description.json of each file or the latest version is used.')
+    parser.add_argument('--tag-columns', type=int, nargs='+', default=[2],
+                        help='Columns containing HED tags, starting at 1.')
+    parser.add_argument('--tag-column-names', nargs='+',
+                        help='Names of the columns containing HED tags. Overrides --tag-columns.')
+    parser.add_argument('--no-column-names', action='store_true', help='The files have no header row.')
+    parser.add_argument('--worksheet', help='Worksheet of the Excel files to validate.')
+    parser.add_argument('--check-for-warnings', action='store_true', help='Report warnings as well as errors.')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='Number of worker processes. Defaults to the number of processors.')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip files that are unchanged since the summary.json in the output directory.')
+    return parser
+
+
+if __name__ == '__main__':
+    sys.exit(main())
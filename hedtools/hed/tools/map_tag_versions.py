@@ -196,7 +196,8 @@ def create_out_tag(org_tag, new_tag, remainder):
     return new_tag
 
 
-def upgrade_file_hed_version(input_file, mapping_filename_or_dict, tag_columns_to_upgrade=None):
+def upgrade_file_hed_version(input_file, mapping_filename_or_dict, tag_columns_to_upgrade=None,
+                             output_filename=None):
     """
 
     Parameters
@@ -207,6 +208,9 @@ def upgrade_file_hed_version(input_file, mapping_filename_or_dict, tag_columns_t
     tag_columns_to_upgrade : list of column numbers
         If passed in and non empty, ONLY upgrade these column numbers.  You can also filter out
         which columns you want to upgrade via the HedFileInput object.
+    output_filename : str
+        The file to write the upgraded rows to, without extension.  The rows are written as they are upgraded.
+        Defaults to the input filename with "_test_hed3_upgrade" appended.
 
     Returns
     -------
@@ -215,8 +219,11 @@ def upgrade_file_hed_version(input_file, mapping_filename_or_dict, tag_columns_t
     mapping_dict = mapping_filename_or_dict
     if isinstance(mapping_filename_or_dict, str):
         mapping_dict = read_version_map(mapping_filename_or_dict)
+    if output_filename is None:
+        output_filename = f"{input_file.filename}_test_hed3_upgrade"
 
-    for row_number, row_hed_string, column_to_hed_tags_dictionary in input_file:
+    def upgrade_row(row_number, row_hed_string, column_to_hed_tags_dictionary):
+        new_cells = {}
         for column_number in column_to_hed_tags_dictionary:
             if tag_columns_to_upgrade and column_number not in tag_columns_to_upgrade:
                 continue
@@ -235,11 +242,10 @@ def upgrade_file_hed_version(input_file, mapping_filename_or_dict, tag_columns_t
                     new_text += new_tag
                 else:
                     new_text += tag
-            input_file.set_cell(row_number, column_number, new_text,
-                                include_column_prefix_if_exist=False)
-
-    input_file.save(f"{input_file.filename}_test_hed3_upgrade")
+            new_cells[column_number] = new_text
+        return new_cells
 
+    input_file.stream_to_file(output_filename, upgrade_row)
 
 if __name__ == '__main__':
     hed2_xml_file = "tests/data/HED7.1.1.xml"
@@ -1,13 +1,20 @@
 from hed.tools import error_reporter
+from hed.util import column_util
 from hed.util import hed_string_util
+from hed.util import schema_registry
 from hed.util.schema_node_map import SchemaNodeMap
 
 
 class TagFormat:
     """     Class to convert hed3 tags between short and long form.
        """
+    MAX_CACHED_STRING_CONVERSIONS = 100000
+
     def __init__(self, hed_xml_file=None, hed_tree=None):
-        self.map_schema = SchemaNodeMap(hed_xml_file, hed_tree)
+        if hed_tree is None and hed_xml_file:
+            self.map_schema = schema_registry.get_schema_node_map(hed_xml_file)
+        else:
+            self.map_schema = SchemaNodeMap(hed_xml_file, hed_tree)
 
     def convert_hed_string_to_short(self, hed_string):
         """ Convert a hed string from any form to the shortest.
@@ -23,33 +30,7 @@ class TagFormat:
             -------
                 str: The converted string
         """
-        if not self.map_schema.no_duplicate_tags:
-            error = error_reporter.report_error_type(error_reporter.INVALID_SCHEMA, hed_string, 0, len(hed_string))
-            return hed_string, [error]
-
-        hed_string = hed_string_util.remove_slashes_and_spaces(hed_string)
-
-        errors = []
-        if hed_string == "":
-            errors.append(error_reporter.report_error_type(error_reporter.EMPTY_TAG_FOUND, ""))
-            return hed_string, errors
-
-        hed_tags = hed_string_util.split_hed_string(hed_string)
-        final_string = ""
-
-        for is_hed_tag, (startpos, endpos) in hed_tags:
-            tag = hed_string[startpos:endpos]
-            if is_hed_tag:
-                short_tag_string, single_error = self._convert_to_short_tag(tag)
-                if single_error:
-                    errors.append(single_error)
-                final_string += short_tag_string
-            else:
-                final_string += tag
-                # no_spaces_delimeter = tag.replace(" ", "")
-                # final_string += no_spaces_delimeter
-
-        return final_string, errors
+        return self._convert_hed_string(hed_string, self._convert_to_short_tag)
 
     def convert_hed_string_to_long(self, hed_string):
         """ Convert a hed string from any form to the longest.
@@ -65,6 +46,102 @@ class TagFormat:
             -------
                 str: The converted string
         """
+        return self._convert_hed_string(hed_string, self._convert_to_long_tag)
+
+    def convert_many(self, hed_strings, to_short=True):
+        """ Convert many hed strings from any form to the shortest or longest.
+
+            Each distinct hed string is split and converted once, and each distinct tag is converted once across all
+            of the strings, so batches with repeated strings and tags are much faster than converting each string on
+            its own.
+
+         Parameters
+            ----------
+            hed_strings: iterable of str
+                the hed strings to convert
+            to_short: bool
+                True to convert to the short form, False to convert to the long form
+            Returns
+            -------
+                list: A (converted string, error list) tuple for each hed string, in order.
+        """
+        convert_hed_string = self._create_cached_converter(to_short)
+        return [convert_hed_string(hed_string) for hed_string in hed_strings]
+
+    def convert_column(self, hed_strings, to_short=True):
+        """ Convert a column of hed strings from any form to the shortest or longest.
+
+            Each unique hed string in the column is converted once and the result is given to every row with that
+            string. Values that are not strings, such as missing cells, are returned unchanged with no errors.
+
+         Parameters
+            ----------
+            hed_strings: list, NumPy array, or pandas Series
+                the column of hed strings to convert
+            to_short: bool
+                True to convert to the short form, False to convert to the long form
+            Returns
+            -------
+                tuple: The column of converted strings and the column of error lists, in the same kind of container as
+                hed_strings. Rows with the same string share the same error list.
+        """
+        unique_strings, row_codes, _ = column_util.factorize_column(hed_strings)
+        convert_hed_string = self._create_cached_converter(to_short)
+        unique_conversions = [convert_hed_string(hed_string) if isinstance(hed_string, str) else (hed_string, [])
+                              for hed_string in unique_strings]
+        converted_strings = column_util.broadcast_to_column(
+            hed_strings, [converted_string for converted_string, _ in unique_conversions], row_codes)
+        errors = column_util.broadcast_to_column(hed_strings, [errors for _, errors in unique_conversions],
+                                                 row_codes)
+        return converted_strings, errors
+
+    def _create_cached_converter(self, to_short=True):
+        """ Create a function that converts hed strings and remembers the conversion of each distinct string and tag.
+
+         Parameters
+            ----------
+            to_short: bool
+                True to convert to the short form, False to convert to the long form
+            Returns
+            -------
+                function: A function that takes a hed string and returns the converted string and its error list. The
+                errors are copies that can be modified.
+        """
+        convert_tag = self._convert_to_short_tag if to_short else self._convert_to_long_tag
+        tag_conversions = {}
+        string_conversions = {}
+
+        def convert_cached_tag(hed_tag):
+            tag_conversion = tag_conversions.get(hed_tag)
+            if tag_conversion is None:
+                tag_conversion = tag_conversions[hed_tag] = convert_tag(hed_tag)
+            return tag_conversion
+
+        def convert_cached_hed_string(hed_string):
+            string_conversion = string_conversions.get(hed_string)
+            if string_conversion is None:
+                if len(string_conversions) >= self.MAX_CACHED_STRING_CONVERSIONS:
+                    string_conversions.clear()
+                string_conversion = string_conversions[hed_string] = \
+                    self._convert_hed_string(hed_string, convert_cached_tag)
+            converted_string, errors = string_conversion
+            return converted_string, [dict(error) for error in errors]
+
+        return convert_cached_hed_string
+
+    def _convert_hed_string(self, hed_string, convert_tag):
+        """ Convert a hed string by converting each tag in it.
+
+         Parameters
+            ----------
+            hed_string: str
+                a hed string containing any number of tags
+            convert_tag: function
+                a function that takes a tag and returns the converted tag and an error or None
+            Returns
+            -------
+                tuple: The converted string and the list of errors.
+        """
         if not self.map_schema.no_duplicate_tags:
             error = error_reporter.report_error_type(error_reporter.INVALID_SCHEMA, hed_string, 0, len(hed_string))
             return hed_string, [error]
@@ -77,20 +154,18 @@ class TagFormat:
             return hed_string, errors
 
         hed_tags = hed_string_util.split_hed_string(hed_string)
-        final_string = ""
+        converted_parts = []
         for is_hed_tag, (startpos, endpos) in hed_tags:
             tag = hed_string[startpos:endpos]
             if is_hed_tag:
-                converted_tag, single_error = self._convert_to_long_tag(tag)
+                converted_tag, single_error = convert_tag(tag)
                 if single_error:
                     errors.append(single_error)
-                final_string += converted_tag
+                converted_parts.append(converted_tag)
             else:
-                final_string += tag
-                # no_spaces_delimeter = tag.replace(" ", "")
-                # final_string += no_spaces_delimeter
+                converted_parts.append(tag)
 
-        return final_string, errors
+        return "".join(converted_parts), errors
 
     def _convert_to_long_tag(self, hed_tag):
         """This takes a hed tag(short or long form) and converts it to the long form
@@ -121,12 +196,15 @@ class TagFormat:
 
         clean_tag = hed_tag.lower()
         split_tags = clean_tag.split("/")
+        tag_dict = self.map_schema.tag_dict
 
         index_end = 0
         found_unknown_extension = False
         found_index_end = 0
         found_tag_entry = None
-        # Iterate over tags left to right keeping track of current index
+        # Walk the tag path trie left to right keeping track of current index.  Each step checks that the tag has the
+        # correct path above it.
+        trie_children = self.map_schema.tag_path_trie
         for tag in split_tags:
             tag_len = len(tag)
             # Skip slashes
@@ -137,7 +215,14 @@ class TagFormat:
 
             # If we already found an unknown tag, it's implicitly an extension.  No known tags can follow it.
             if not found_unknown_extension:
-                if tag not in self.map_schema.tag_dict:
+                trie_node = trie_children.get(tag)
+                if trie_node is None:
+                    # A known tag that cannot be reached from the path above it has the wrong parent
+                    if tag in tag_dict:
+                        error = error_reporter.report_error_type(error_reporter.INVALID_PARENT_NODE, hed_tag,
+                                                                 index_start, index_end,
+                                                                 tag_dict[tag].long_org_tag)
+                        return hed_tag, error
                     found_unknown_extension = True
                     if not found_tag_entry:
                         error = error_reporter.report_error_type(error_reporter.NO_VALID_TAG_FOUND, hed_tag,
@@ -145,24 +230,15 @@ class TagFormat:
                         return hed_tag, error
                     continue
 
-                tag_entry = self.map_schema.tag_dict[tag]
-                tag_string = tag_entry.long_clean_tag
-                main_hed_portion = clean_tag[:index_end]
-
-                # Verify the tag has the correct path above it.
-                if not tag_string.endswith(main_hed_portion):
-                    error = error_reporter.report_error_type(error_reporter.INVALID_PARENT_NODE, hed_tag,
-                                                             index_start, index_end,
-                                                             tag_entry.long_org_tag)
-                    return hed_tag, error
+                trie_children = trie_node.children
                 found_index_end = index_end
-                found_tag_entry = tag_entry
+                found_tag_entry = trie_node.entry
             else:
                 # These means we found a known tag in the remainder/extension section, which is an error
-                if tag in self.map_schema.tag_dict:
+                if tag in tag_dict:
                     error = error_reporter.report_error_type(error_reporter.INVALID_PARENT_NODE, hed_tag,
                                                              index_start, index_end,
-                                                             self.map_schema.tag_dict[tag].long_org_tag)
+                                                             tag_dict[tag].long_org_tag)
                     return hed_tag, error
 
         remainder = hed_tag[found_index_end:]
@@ -199,15 +275,19 @@ class TagFormat:
 
         clean_tag = hed_tag.lower()
         split_tag = clean_tag.split("/")
+        tag_dict = self.map_schema.tag_dict
 
         found_tag_entry = None
+        found_tag_count = 0
         index = len(hed_tag)
         last_found_index = index
         # Iterate over tags right to left keeping track of current character index
-        for tag in reversed(split_tag):
+        for tag_position in range(len(split_tag) - 1, -1, -1):
+            tag = split_tag[tag_position]
             # As soon as we find a non extension tag, mark down the index and bail.
-            if tag in self.map_schema.tag_dict:
-                found_tag_entry = self.map_schema.tag_dict[tag]
+            if tag in tag_dict:
+                found_tag_entry = tag_dict[tag]
+                found_tag_count = tag_position + 1
                 last_found_index = index
                 index -= len(tag)
                 break
@@ -223,9 +303,7 @@ class TagFormat:
             return hed_tag, error
 
         # Verify the tag has the correct path above it.
-        main_hed_portion = clean_tag[:last_found_index]
-        tag_string = found_tag_entry.long_clean_tag
-        if not tag_string.endswith(main_hed_portion):
+        if self.map_schema.find_tag_path(split_tag[:found_tag_count]) is not found_tag_entry:
             error = error_reporter.report_error_type(error_reporter.INVALID_PARENT_NODE, hed_tag, index, last_found_index,
                                                      found_tag_entry.long_org_tag)
             return hed_tag, error
@@ -234,12 +312,15 @@ class TagFormat:
         short_tag_string = found_tag_entry.short_org_tag + remainder
         return short_tag_string, None
 
-    def _convert_file(self, input_file, conversion_function):
+    def _convert_file(self, input_file, conversion_function, output_filename=None):
         """  Runs a passed in conversion function over a given HedFileInput object
         Parameters
         ----------
         input_file : HedFileInput object
         conversion_function : function that takes a string and returns a string and errors.
+        output_filename : str
+            If given, the converted rows are written to this file (without extension) as they are converted,
+            and the input file is not modified.  This works with read only input files.
         Returns
         -------
         (modified input file, error_list)
@@ -247,41 +328,57 @@ class TagFormat:
             error_list is a list of dicts of errors.
         """
         error_list = []
-        for row_number, row_hed_string, column_to_hed_tags_dictionary in input_file:
+
+        def convert_row(row_number, row_hed_string, column_to_hed_tags_dictionary):
+            new_cells = {}
             for column_number in column_to_hed_tags_dictionary:
                 old_text = column_to_hed_tags_dictionary[column_number]
                 new_text, errors = conversion_function(old_text)
-                input_file.set_cell(row_number, column_number, new_text,
-                                    include_column_prefix_if_exist=False)
+                new_cells[column_number] = new_text
 
                 for error in errors:
                     error_reporter.add_row_and_column(error, row_number, column_number)
                     error_list.append(error)
+            return new_cells
+
+        if output_filename:
+            input_file.stream_to_file(output_filename, convert_row)
+            return input_file, error_list
+
+        for row_number, row_hed_string, column_to_hed_tags_dictionary in input_file:
+            new_cells = convert_row(row_number, row_hed_string, column_to_hed_tags_dictionary)
+            for column_number, new_text in new_cells.items():
+                input_file.set_cell(row_number, column_number, new_text,
+                                    include_column_prefix_if_exist=False)
 
         return input_file, error_list
 
-    def convert_file_to_short_tags(self, input_file):
+    def convert_file_to_short_tags(self, input_file, output_filename=None):
         """Takes an input file and iterates over each cell with tags and converts to short.
         Parameters
         ----------
         input_file : a HedFileInput object
+        output_filename : str
+            If given, the converted rows are streamed to this file (without extension) instead of modifying input_file.
         Returns
         -------
         (modified input file, error_list)
             Modified input file is NOT a copy.
             error_list is a list of dicts of errors.
         """
-        return self._convert_file(input_file, self.convert_hed_string_to_short)
+        return self._convert_file(input_file, self._create_cached_converter(to_short=True), output_filename)
 
-    def convert_file_to_long_tags(self, input_file):
+    def convert_file_to_long_tags(self, input_file, output_filename=None):
         """Takes an input file and iterates over each cell with tags and converts to long.
         Parameters
         ----------
         input_file : a HedFileInput object
+        output_filename : str
+            If given, the converted rows are streamed to this file (without extension) instead of modifying input_file.
         Returns
         -------
         (modified input file, error_list)
             Modified input file is NOT a copy.
             error_list is a list of dicts of errors.
         """
-        return self._convert_file(input_file, self.convert_hed_string_to_long)
+        return self._convert_file(input_file, self._create_cached_converter(to_short=False), output_filename)
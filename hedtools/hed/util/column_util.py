@@ -0,0 +1,68 @@
+"""
+This module contains functions for working on a column of HED strings by its unique values. A column can be a list or
+other iterable, a NumPy object array, or a pandas Series. Tabular HED data usually repeats a small number of strings
+across many rows, so each unique string is processed once and the results are broadcast back to every row. NumPy and
+pandas are not required. Results are returned in the same kind of container as the column.
+
+"""
+
+
+def factorize_column(column):
+    """Finds the unique values of a column and the position of each row's value among them.
+
+    Parameters
+    ----------
+    column: iterable
+        A list, NumPy array, pandas Series, or other iterable of values. The values must be hashable.
+    Returns
+    -------
+    tuple
+        A tuple containing the list of unique values in the order they first appear, a list containing the index in
+        the unique values of each row's value, and a list containing the number of rows with each unique value.
+
+    """
+    unique_positions = {}
+    unique_values = []
+    value_counts = []
+    row_codes = []
+    for value in column:
+        unique_position = unique_positions.get(value)
+        if unique_position is None:
+            unique_position = unique_positions[value] = len(unique_values)
+            unique_values.append(value)
+            value_counts.append(0)
+        value_counts[unique_position] += 1
+        row_codes.append(unique_position)
+    return unique_values, row_codes, value_counts
+
+
+def broadcast_to_column(column, unique_results, row_codes):
+    """Gives each row of a column the result of its unique value.
+
+    Parameters
+    ----------
+    column: iterable
+        The column that was factorized.
+    unique_results: list
+        The result for each unique value.
+    row_codes: list
+        The index in the unique values of each row's value.
+    Returns
+    -------
+    list, NumPy array, or pandas Series
+        The result of each row. A pandas Series keeps the index and name of the column, a NumPy array has the object
+        type, and any other column gives a list. Rows with the same value share the same result object.
+
+    """
+    row_results = [unique_results[row_code] for row_code in row_codes]
+    column_module = type(column).__module__.split('.')[0]
+    if column_module == 'pandas' and hasattr(column, 'index'):
+        return type(column)(row_results, index=column.index, name=getattr(column, 'name', None), dtype=object)
+    if column_module == 'numpy':
+        import numpy
+        column_results = numpy.empty(len(row_results), dtype=object)
+        for row_index, row_result in enumerate(row_results):
+            column_results[row_index] = row_result
+        return column_results
+    return row_results
+
@@ -1,7 +1,26 @@
+"""
+This module caches HED XML files downloaded from GitHub, a URL, or a local directory.
+
+Each XML file is stored once under blobs/ by its git blob SHA-1, the hash GitHub lists for it, and a version index maps
+each cached version to its SHA-1. The file of each version is also installed as HED<version>.xml in the cache folder.
+Every file is written to a temporary file in its destination folder first and then renamed over the destination, so
+readers never see a partly written file and never need a lock. Only one process at a time updates the cache. It holds
+a writer lease, which other writers wait for up to CACHE_LOCK_TIMEOUT seconds.
+
+For machines without network access, a cache can be exported as a single compressed bundle with its XML files,
+compiled snapshots, and a manifest of their hashes, and imported elsewhere in one sequential read. The versions of a
+cache folder with a version index are kept in memory, and the folder is only listed again when it changes.
+"""
+
+import io
 import os
+import pathlib
+import tarfile
+import tempfile
 import urllib.request
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha1
 from shutil import copyfile
 from collections import OrderedDict
@@ -9,6 +28,7 @@ import re
 from distutils.version import StrictVersion
 import portalocker
 import time
+from hed.util import schema_snapshot
 from hed.util.file_util import url_to_file
 
 HED_VERSION_EXPRESSION = r'HED(\d+.\d+.\d+)'
@@ -18,6 +38,25 @@ DEFAULT_HED_LIST_VERSIONS_URL = """https://api.github.com/repos/hed-standard/hed
 HED_CACHE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../validator/hed_cache/')
 TIMESTAMP_FILENAME = "last_update.txt"
 CACHE_TIME_THRESHOLD = 300
+CACHE_LOCK_FILENAME = "cache_lock.lock"
+CACHE_LOCK_TIMEOUT = 30
+CACHE_VERIFY_WORKERS = 8
+BLOB_DIRECTORY_NAME = "blobs"
+VERSION_INDEX_FILENAME = "version_index.json"
+TEMP_FILE_SUFFIX = ".tmp"
+BUNDLE_MANIFEST_FILENAME = "manifest.json"
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_FORMAT_VERSION_KEY = "format_version"
+BUNDLE_VERSIONS_KEY = "versions"
+BUNDLE_XML_KEY = "xml"
+BUNDLE_SHA_KEY = "sha"
+BUNDLE_SNAPSHOT_KEY = "snapshot"
+BUNDLE_SNAPSHOT_SHA_KEY = "snapshot_sha"
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# The sorted versions of each cache folder with a version index, keyed by the absolute folder path. Each entry keeps
+# the modification time of the folder when it was listed.
+_indexed_versions = {}
 
 
 def set_cache_directory(new_cache_dir):
@@ -35,7 +74,8 @@ def set_cache_directory(new_cache_dir):
 
 
 def get_all_hed_versions(local_hed_directory=None):
-    """Get all the HED versions in the hed directory.
+    """Get all the HED versions in the hed directory. The versions of a cache folder with a version index are kept in
+       memory until the folder changes, and other directories are searched for HED XML files on every call.
 
     Parameters
     ----------
@@ -50,12 +90,15 @@ def get_all_hed_versions(local_hed_directory=None):
     """
     if not local_hed_directory:
         local_hed_directory = HED_CACHE_DIRECTORY
+    indexed_versions = _get_indexed_versions(local_hed_directory)
+    if indexed_versions is not None:
+        return list(indexed_versions)
     hed_versions = []
     compiled_expression = re.compile(HED_VERSION_EXPRESSION)
     for _, _, hed_files in os.walk(local_hed_directory):
         for hed_file in hed_files:
             expression_match = compiled_expression.match(hed_file)
-            if expression_match is not None:
+            if expression_match is not None and hed_file.endswith(HED_XML_EXTENSION):
                 hed_versions.append(expression_match.group(1))
     return sorted(hed_versions, key=StrictVersion, reverse=True)
 
@@ -86,9 +129,11 @@ def get_local_file(hed_xml_file, get_specific_version=None):
     return final_hed_xml_file
 
 
-def cache_specific_url(hed_xml_url, get_specific_version=None, cache_folder=None):
+def cache_specific_url(hed_xml_url, get_specific_version=None, cache_folder=None, lock_timeout=None):
     """Cache a file from a URL.
 
+    The file is installed and added to the version index while holding the cache writer lease.
+
     Parameters
     ----------
     hed_xml_url: str
@@ -97,10 +142,16 @@ def cache_specific_url(hed_xml_url, get_specific_version=None, cache_folder=None
         If not None and hed_xml_url is a directory, return this version or None.
     cache_folder:
         hed cache folder: Defaults to HED_CACHE_DIRECTORY
+    lock_timeout: float
+        The number of seconds to wait for another process to finish updating the cache. Defaults to CACHE_LOCK_TIMEOUT.
     Returns
     -------
     string
         Path to local hed XML file to use.
+    Raises
+    ------
+    portalocker.exceptions.LockException
+        If another process is still updating the cache after lock_timeout seconds.
     """
     if not cache_folder:
         cache_folder = HED_CACHE_DIRECTORY
@@ -109,7 +160,8 @@ def cache_specific_url(hed_xml_url, get_specific_version=None, cache_folder=None
         return None
 
     if _check_if_api_url(hed_xml_url):
-        return _download_latest_hed_xml_version_from_url(hed_xml_url, get_specific_version=get_specific_version, cache_folder=cache_folder)
+        return _download_latest_hed_xml_version_from_url(hed_xml_url, get_specific_version=get_specific_version,
+                                                         cache_folder=cache_folder, lock_timeout=lock_timeout)
 
     if not _check_if_specific_xml(hed_xml_url):
         return None
@@ -119,11 +171,20 @@ def cache_specific_url(hed_xml_url, get_specific_version=None, cache_folder=None
 
     os.makedirs(cache_folder, exist_ok=True)
     temp_hed_xml_file = url_to_file(hed_xml_url)
-    if temp_hed_xml_file:
-        cache_filename = _safe_copy_tmp_to_folder(temp_hed_xml_file, cache_filename)
-        return cache_filename
-    else:
+    if not temp_hed_xml_file:
         return None
+    try:
+        with _cache_writer_lease(cache_folder, lock_timeout):
+            sha_hash = _calculate_sha1(temp_hed_xml_file)
+            blob_filename = _install_blob(temp_hed_xml_file, sha_hash, cache_folder)
+            if not blob_filename or not _install_file(blob_filename, cache_filename):
+                return None
+            expression_match = re.match(HED_VERSION_EXPRESSION, filename)
+            if expression_match is not None:
+                _update_version_index(cache_folder, {expression_match.group(1): sha_hash})
+    finally:
+        os.remove(temp_hed_xml_file)
+    return cache_filename
 
 
 def get_latest_hed_version_path(local_hed_directory=None, get_specific_version=None):
@@ -173,40 +234,318 @@ def get_path_from_hed_version(hed_version, local_hed_directory=None):
     return _create_xml_filename(hed_version, local_hed_directory)
 
 
-def cache_all_hed_xml_versions(hed_base_url=DEFAULT_HED_LIST_VERSIONS_URL, cache_folder=None):
-    """Cache a file from a URL.
+def cache_all_hed_xml_versions(hed_base_url=DEFAULT_HED_LIST_VERSIONS_URL, cache_folder=None, lock_timeout=None):
+    """Cache all of the HED XML versions listed at a URL or in a local directory.
+
+    The listed versions are verified against their SHA-1 hashes in parallel, and only the missing or changed ones are
+    downloaded. If another process is updating the cache, this waits for it to finish and then skips caching if the
+    cache was updated less than CACHE_TIME_THRESHOLD seconds ago.
 
     Parameters
     ----------
-    hed_xml_url: str
-        Path to a directory on github API.
+    hed_base_url: str
+        A github API url to a directory, a file:// url or path to a JSON file in the same format, or a local directory
+        containing HED XML files.
     cache_folder:
         hed cache folder: Defaults to HED_CACHE_DIRECTORY
+    lock_timeout: float
+        The number of seconds to wait for another process to finish updating the cache. Defaults to CACHE_LOCK_TIMEOUT.
     Returns
     -------
+    dict
+        A dictionary which associates each listed version with the path to its cached XML file, or None if it could
+        not be cached. None if caching was skipped.
     """
     if not cache_folder:
         cache_folder = HED_CACHE_DIRECTORY
 
     os.makedirs(cache_folder, exist_ok=True)
+    if _cache_updated_recently(cache_folder):
+        return None
+
+    try:
+        with _cache_writer_lease(cache_folder, lock_timeout):
+            if _cache_updated_recently(cache_folder):
+                return None
+            current_timestamp = time.time()
+            hed_versions = _get_hed_xml_versions_from_url(hed_base_url)
+            with ThreadPoolExecutor(max_workers=CACHE_VERIFY_WORKERS) as executor:
+                cached_filenames = executor.map(lambda version: _cache_hed_version(version, hed_versions[version],
+                                                                                   cache_folder=cache_folder),
+                                                hed_versions)
+                cached_versions = OrderedDict(zip(hed_versions, cached_filenames))
+            _update_version_index(cache_folder, {version: hed_versions[version][0]
+                                                 for version, cached_filename in cached_versions.items()
+                                                 if cached_filename})
+            _write_last_cached_time(current_timestamp, cache_folder)
+            return cached_versions
+    except portalocker.exceptions.LockException:
+        print("Cache currently being written to.  Skipping.")
+        return None
+
+
+def get_version_index(cache_folder=None):
+    """Gets the version index of a cache folder, which associates each cached version with the SHA-1 of its file.
+
+    Parameters
+    ----------
+    cache_folder: str
+        hed cache folder: Defaults to HED_CACHE_DIRECTORY
+    Returns
+    -------
+    dict
+        A dictionary which associates each cached version with the git blob SHA-1 of its XML file.
+    """
+    if not cache_folder:
+        cache_folder = HED_CACHE_DIRECTORY
+    try:
+        with open(os.path.join(cache_folder, VERSION_INDEX_FILENAME), "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def export_cache_bundle(bundle_filename, cache_folder=None):
+    """Exports the HED XML files of a cache folder and their compiled snapshots to a single compressed bundle.
+
+    Snapshots that are missing or out of date are compiled and saved in the cache folder first. The bundle is a gzipped
+    tar file whose first member is a manifest with the git blob SHA-1 of every file in it.
+
+    Parameters
+    ----------
+    bundle_filename: str
+        The path to write the bundle to.
+    cache_folder: str
+        hed cache folder: Defaults to HED_CACHE_DIRECTORY
+    Returns
+    -------
+    list
+        The versions in the bundle.
+    """
+    # Imported here because hed_dictionary uses this module to find the cache directory.
+    from hed.util.hed_dictionary import HedDictionary
+    if not cache_folder:
+        cache_folder = HED_CACHE_DIRECTORY
+    hed_versions = get_all_hed_versions(cache_folder)
+    manifest_versions = OrderedDict()
+    bundle_files = []
+    for hed_version in hed_versions:
+        hed_xml_file = _create_xml_filename(hed_version, cache_folder)
+        if not os.path.isfile(hed_xml_file):
+            continue
+        version_entry = {BUNDLE_XML_KEY: os.path.basename(hed_xml_file), BUNDLE_SHA_KEY: _calculate_sha1(hed_xml_file)}
+        bundle_files.append(hed_xml_file)
+        snapshot_file = schema_snapshot.get_snapshot_path(hed_xml_file)
+        if schema_snapshot.load_snapshot(hed_xml_file) is None:
+            snapshot_file = HedDictionary(hed_xml_file, use_snapshot=False).save_snapshot()
+        if snapshot_file:
+            version_entry[BUNDLE_SNAPSHOT_KEY] = os.path.basename(snapshot_file)
+            version_entry[BUNDLE_SNAPSHOT_SHA_KEY] = _calculate_sha1(snapshot_file)
+            bundle_files.append(snapshot_file)
+        manifest_versions[hed_version] = version_entry
+    manifest = json.dumps({BUNDLE_FORMAT_VERSION_KEY: BUNDLE_FORMAT_VERSION, BUNDLE_VERSIONS_KEY: manifest_versions},
+                          indent=4).encode('utf-8')
+    with tarfile.open(bundle_filename, 'w:gz') as bundle:
+        manifest_info = tarfile.TarInfo(BUNDLE_MANIFEST_FILENAME)
+        manifest_info.size = len(manifest)
+        manifest_info.mtime = time.time()
+        bundle.addfile(manifest_info, io.BytesIO(manifest))
+        for bundle_file in bundle_files:
+            bundle.add(bundle_file, arcname=os.path.basename(bundle_file), recursive=False)
+    return list(manifest_versions)
+
+
+def import_cache_bundle(bundle_filename, cache_folder=None, lock_timeout=None, trust_snapshots=False):
+    """Imports a bundle written by export_cache_bundle into a cache folder in one sequential read.
+
+    Each file is checked against the SHA-1 in the manifest and installed atomically. The version index is updated
+    after every file in the manifest has been installed, and the cache is marked as just updated.
+
+    The hashes in the manifest only show that the bundle was not damaged, not where it came from. Snapshots are
+    unpickled when they are loaded, so a snapshot can run arbitrary code. By default the snapshots in the bundle are
+    skipped and compiled again from the imported XML files. Only pass trust_snapshots=True for bundles from a trusted
+    source.
+
+    Parameters
+    ----------
+    bundle_filename: str
+        The path to the bundle.
+    cache_folder: str
+        hed cache folder: Defaults to HED_CACHE_DIRECTORY
+    lock_timeout: float
+        The number of seconds to wait for another process to finish updating the cache. Defaults to CACHE_LOCK_TIMEOUT.
+    trust_snapshots: bool
+        True if the snapshots in the bundle should be installed as they are. False, if they should be compiled locally.
+    Returns
+    -------
+    list
+        The versions imported.
+    Raises
+    ------
+    ValueError
+        If the bundle has no manifest, a file does not match its SHA-1, or a file in the manifest is missing.
+    portalocker.exceptions.LockException
+        If another process is still updating the cache after lock_timeout seconds.
+    """
+    # Imported here because hed_dictionary uses this module to find the cache directory.
+    from hed.util.hed_dictionary import HedDictionary
+    if not cache_folder:
+        cache_folder = HED_CACHE_DIRECTORY
+    os.makedirs(cache_folder, exist_ok=True)
+    with _cache_writer_lease(cache_folder, lock_timeout), tarfile.open(bundle_filename, 'r|gz') as bundle:
+        manifest_versions = None
+        expected_files = {}
+        for member in bundle:
+            if not member.isfile():
+                continue
+            member_file = bundle.extractfile(member)
+            if manifest_versions is None:
+                if member.name != BUNDLE_MANIFEST_FILENAME:
+                    raise ValueError(f"The bundle {bundle_filename} does not start with a manifest.")
+                manifest_versions, expected_files = _read_bundle_manifest(member_file)
+                if not trust_snapshots:
+                    expected_files = {filename: expected_file for filename, expected_file in expected_files.items()
+                                      if expected_file[1]}
+                continue
+            if member.name not in expected_files:
+                continue
+            sha_hash, is_xml_file = expected_files.pop(member.name)
+            _install_bundle_file(member_file, member.size, sha_hash, os.path.join(cache_folder, member.name))
+            if is_xml_file:
+                _install_blob(os.path.join(cache_folder, member.name), sha_hash, cache_folder)
+        if manifest_versions is None:
+            raise ValueError(f"The bundle {bundle_filename} does not have a manifest.")
+        if expected_files:
+            raise ValueError(f"The bundle {bundle_filename} is missing {', '.join(sorted(expected_files))}.")
+        if not trust_snapshots:
+            for version_entry in manifest_versions.values():
+                hed_xml_file = os.path.join(cache_folder, version_entry[BUNDLE_XML_KEY])
+                HedDictionary(hed_xml_file, use_snapshot=False).save_snapshot()
+        _update_version_index(cache_folder, {hed_version: version_entry[BUNDLE_SHA_KEY]
+                                             for hed_version, version_entry in manifest_versions.items()})
+        _write_last_cached_time(time.time(), cache_folder)
+    return list(manifest_versions)
+
+
+def _read_bundle_manifest(manifest_file):
+    """Reads the manifest of a bundle.
+
+    Parameters
+    ----------
+    manifest_file: file object
+        The manifest in the bundle.
+    Returns
+    -------
+    tuple
+        The versions in the manifest, and a dictionary which associates the name of each file in the bundle with its
+        SHA-1 and whether it is an XML file.
+    """
+    manifest = json.load(manifest_file)
+    if manifest.get(BUNDLE_FORMAT_VERSION_KEY) != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported bundle format version {manifest.get(BUNDLE_FORMAT_VERSION_KEY)}.")
+    manifest_versions = manifest[BUNDLE_VERSIONS_KEY]
+    expected_files = {}
+    for version_entry in manifest_versions.values():
+        expected_files[version_entry[BUNDLE_XML_KEY]] = version_entry[BUNDLE_SHA_KEY], True
+        if version_entry.get(BUNDLE_SNAPSHOT_KEY):
+            expected_files[version_entry[BUNDLE_SNAPSHOT_KEY]] = version_entry[BUNDLE_SNAPSHOT_SHA_KEY], False
+    for filename in expected_files:
+        if os.path.basename(filename) != filename or filename in (os.curdir, os.pardir):
+            raise ValueError(f"The bundle manifest lists a file outside the cache folder: {filename}")
+    return manifest_versions, expected_files
+
+
+def _install_bundle_file(member_file, size, sha_hash, dest_filename):
+    """Copies a file out of a bundle to a temporary file, checks its SHA-1, and renames it over the destination."""
+    dest_folder, dest_basename = os.path.split(dest_filename)
+    file_descriptor, temp_filename = tempfile.mkstemp(prefix='.' + dest_basename, suffix=TEMP_FILE_SUFFIX,
+                                                      dir=dest_folder)
+    try:
+        githash = sha1()
+        githash.update(f"blob {size}\0".encode('utf-8'))
+        with os.fdopen(file_descriptor, "wb") as f:
+            for data in iter(lambda: member_file.read(COPY_BUFFER_SIZE), b''):
+                githash.update(data)
+                f.write(data)
+        if githash.hexdigest() != sha_hash:
+            raise ValueError(f"{dest_basename} in the bundle does not match its SHA-1 {sha_hash}.")
+        os.replace(temp_filename, dest_filename)
+    except Exception:
+        os.remove(temp_filename)
+        raise
+
+
+def _get_indexed_versions(cache_folder):
+    """Gets the sorted versions of the HED XML files in a cache folder with a version index.
+
+    The folder is listed again only when its modification time changes, which happens whenever a file is added to,
+    renamed into, or removed from it. Files that were in the folder before the index was written, or that were added
+    without updating the index, are included.
+
+    Parameters
+    ----------
+    cache_folder: str
+        hed cache folder.
+    Returns
+    -------
+    list
+        The versions in the folder, latest first. None if the folder has no version index.
+    """
+    cache_folder = os.path.abspath(cache_folder)
+    if not os.path.isfile(os.path.join(cache_folder, VERSION_INDEX_FILENAME)):
+        return None
+    try:
+        folder_key = os.stat(cache_folder).st_mtime_ns
+    except OSError:
+        return None
+    indexed_versions = _indexed_versions.get(cache_folder)
+    if indexed_versions is None or indexed_versions[0] != folder_key:
+        hed_versions = []
+        for hed_file in os.listdir(cache_folder):
+            expression_match = re.match(HED_VERSION_EXPRESSION, hed_file)
+            if expression_match is not None and hed_file.endswith(HED_XML_EXTENSION):
+                hed_versions.append(expression_match.group(1))
+        indexed_versions = folder_key, sorted(hed_versions, key=StrictVersion, reverse=True)
+        _indexed_versions[cache_folder] = indexed_versions
+    return indexed_versions[1]
+
+
+def _cache_updated_recently(cache_folder):
     last_timestamp = _read_last_cached_time(cache_folder)
     current_timestamp = time.time()
     if current_timestamp - last_timestamp < CACHE_TIME_THRESHOLD:
         print(f"Skipped caching.  Cache updated {current_timestamp - last_timestamp:02f} seconds ago."
               f"(cache update interval: {CACHE_TIME_THRESHOLD}s)")
-        return
+        return True
+    return False
 
-    try:
-        cache_lock_filename = os.path.join(cache_folder, "cache_lock.lock")
-        with portalocker.Lock(cache_lock_filename, timeout=1) as cache_lock:
-            hed_versions = _get_hed_xml_versions_from_url(hed_base_url)
 
-            for version in hed_versions:
-                _cache_hed_version(version, hed_versions[version], cache_folder=cache_folder)
+def _cache_writer_lease(cache_folder, lock_timeout=None):
+    """Gets the lease that a process must hold to update a cache folder. Reading the cache does not need it.
+
+    Parameters
+    ----------
+    cache_folder: str
+        hed cache folder.
+    lock_timeout: float
+        The number of seconds to wait for the lease. Defaults to CACHE_LOCK_TIMEOUT.
+    Returns
+    -------
+    portalocker.Lock
+        The lease, to be used as a context manager. Entering it raises a LockException if the wait runs out.
+    """
+    if lock_timeout is None:
+        lock_timeout = CACHE_LOCK_TIMEOUT
+    cache_lock_filename = os.path.join(cache_folder, CACHE_LOCK_FILENAME)
+    return portalocker.Lock(cache_lock_filename, timeout=lock_timeout)
 
-            _write_last_cached_time(current_timestamp, cache_folder)
-    except portalocker.exceptions.LockException:
-        print("Cache currently being written to.  Skipping.")
+
+def _update_version_index(cache_folder, version_hashes):
+    version_index = get_version_index(cache_folder)
+    version_index.update(version_hashes)
+    sorted_versions = sorted(version_index, key=StrictVersion, reverse=True)
+    _write_file_atomically(os.path.join(cache_folder, VERSION_INDEX_FILENAME),
+                           json.dumps({version: version_index[version] for version in sorted_versions}, indent=4))
 
 
 def _read_last_cached_time(cache_folder):
@@ -216,15 +555,14 @@ def _read_last_cached_time(cache_folder):
         with open(timestamp_filename, "r") as f:
             timestamp = float(f.readline())
             return timestamp
-    except FileNotFoundError or ValueError or IOError:
+    except (FileNotFoundError, ValueError, IOError):
         return 0
 
 
 def _write_last_cached_time(new_time, cache_folder):
     timestamp_filename = os.path.join(cache_folder, TIMESTAMP_FILENAME)
     try:
-        with open(timestamp_filename, "w") as f:
-            f.write(str(new_time))
+        _write_file_atomically(timestamp_filename, str(new_time))
     except Exception:
         raise ValueError("Error writing timestamp to hed cache")
 
@@ -238,7 +576,8 @@ def _check_if_api_url(api_url):
 
 
 def _check_if_url(hed_xml_or_url):
-    if hed_xml_or_url.startswith("http://") or hed_xml_or_url.startswith("https://"):
+    if hed_xml_or_url.startswith("http://") or hed_xml_or_url.startswith("https://") or \
+            hed_xml_or_url.startswith("file://"):
         return True
     return False
 
@@ -251,9 +590,14 @@ def _create_xml_filename(hed_xml_version, hed_directory=None):
 
 
 def _get_hed_xml_versions_from_url(hed_base_url=DEFAULT_HED_LIST_VERSIONS_URL):
-    url_request = urllib.request.urlopen(hed_base_url)
-    url_data = str(url_request.read(), 'utf-8')
-    loaded_json = json.loads(url_data)
+    if os.path.isdir(hed_base_url):
+        loaded_json = _list_hed_xml_directory(hed_base_url)
+    else:
+        if not _check_if_url(hed_base_url):
+            hed_base_url = pathlib.Path(os.path.abspath(hed_base_url)).as_uri()
+        url_request = urllib.request.urlopen(hed_base_url)
+        url_data = str(url_request.read(), 'utf-8')
+        loaded_json = json.loads(url_data)
 
     compiled_expression = re.compile(HED_VERSION_EXPRESSION)
     hed_versions = {}
@@ -269,10 +613,37 @@ def _get_hed_xml_versions_from_url(hed_base_url=DEFAULT_HED_LIST_VERSIONS_URL):
     return ordered_versions
 
 
-def _download_latest_hed_xml_version_from_url(hed_base_url, get_specific_version, cache_folder):
+def _list_hed_xml_directory(hed_directory):
+    """Lists the HED XML files in a local directory in the format of the github API, so that the directory can stand in
+       for the hed-specification repository.
+
+    Parameters
+    ----------
+    hed_directory: str
+        A local directory containing HED XML files.
+    Returns
+    -------
+    list
+        A list of dictionaries with the name, git blob SHA-1, and file:// download url of each HED XML file.
+    """
+    file_entries = []
+    for hed_file in sorted(os.listdir(hed_directory)):
+        if not hed_file.startswith(HED_XML_PREFIX) or not hed_file.endswith(HED_XML_EXTENSION):
+            continue
+        hed_file_path = os.path.abspath(os.path.join(hed_directory, hed_file))
+        file_entries.append({"name": hed_file, "sha": _calculate_sha1(hed_file_path),
+                             "download_url": pathlib.Path(hed_file_path).as_uri()})
+    return file_entries
+
+
+def _download_latest_hed_xml_version_from_url(hed_base_url, get_specific_version, cache_folder, lock_timeout=None):
     latest_version, version_info = _get_latest_hed_xml_version_from_url(hed_base_url, get_specific_version)
     if latest_version:
-        cached_xml_file = _cache_hed_version(latest_version, version_info, cache_folder=cache_folder)
+        os.makedirs(cache_folder, exist_ok=True)
+        with _cache_writer_lease(cache_folder, lock_timeout):
+            cached_xml_file = _cache_hed_version(latest_version, version_info, cache_folder=cache_folder)
+            if cached_xml_file:
+                _update_version_index(cache_folder, {latest_version: version_info[0]})
         return cached_xml_file
 
 
@@ -301,39 +672,117 @@ def _calculate_sha1(filename):
         return None
 
 
-# Attempt to make this multithread safe.
-def _safe_copy_tmp_to_folder(temp_hed_xml_file, dest_filename):
-    _, temp_xml_file = os.path.split(temp_hed_xml_file)
-    dest_folder, _ = os.path.split(dest_filename)
+def _write_file_atomically(dest_filename, contents):
+    """Writes text to a temporary file in the destination folder and renames it over the destination file."""
+    dest_folder, dest_basename = os.path.split(dest_filename)
+    file_descriptor, temp_filename = tempfile.mkstemp(prefix='.' + dest_basename, suffix=TEMP_FILE_SUFFIX,
+                                                      dir=dest_folder)
+    try:
+        with os.fdopen(file_descriptor, "w") as f:
+            f.write(contents)
+        os.replace(temp_filename, dest_filename)
+    except Exception:
+        os.remove(temp_filename)
+        raise
 
-    temp_filename_in_cache = os.path.join(dest_folder, temp_xml_file)
-    copyfile(temp_hed_xml_file, temp_filename_in_cache)
-    os.remove(temp_hed_xml_file)
+
+def _install_file(source_filename, dest_filename):
+    """Copies a file to a temporary file in the destination folder and renames it over the destination file.
+
+    Parameters
+    ----------
+    source_filename: str
+        The file to install.
+    dest_filename: str
+        The path to install the file at.
+    Returns
+    -------
+    string
+        The destination path, or None if the file could not be installed.
+    """
+    dest_folder, dest_basename = os.path.split(dest_filename)
+    file_descriptor, temp_filename = tempfile.mkstemp(prefix='.' + dest_basename, suffix=TEMP_FILE_SUFFIX,
+                                                      dir=dest_folder)
+    os.close(file_descriptor)
     try:
-        os.replace(temp_filename_in_cache, dest_filename)
+        copyfile(source_filename, temp_filename)
+        os.replace(temp_filename, dest_filename)
     except Exception:
-        os.remove(temp_filename_in_cache)
+        os.remove(temp_filename)
         return None
-
     return dest_filename
 
 
+def _get_blob_filename(sha_hash, cache_folder):
+    return os.path.join(cache_folder, BLOB_DIRECTORY_NAME, sha_hash + HED_XML_EXTENSION)
+
+
+def _install_blob(source_filename, sha_hash, cache_folder):
+    """Stores a file in the cache by its SHA-1. A file already stored under the same SHA-1 is kept.
+
+    Parameters
+    ----------
+    source_filename: str
+        A file whose git blob SHA-1 has been checked to be sha_hash.
+    sha_hash: str
+        The git blob SHA-1 of the file.
+    cache_folder: str
+        hed cache folder.
+    Returns
+    -------
+    string
+        The path to the stored file, or None if it could not be stored.
+    """
+    blob_filename = _get_blob_filename(sha_hash, cache_folder)
+    if os.path.exists(blob_filename):
+        return blob_filename
+    os.makedirs(os.path.dirname(blob_filename), exist_ok=True)
+    return _install_file(source_filename, blob_filename)
+
+
 def _cache_hed_version(version, version_info, cache_folder):
+    """Makes sure a version is stored in the cache by its SHA-1 and installed as HED<version>.xml.
+
+    The installed file is checked against the SHA-1 first. The file is only downloaded if no file with that SHA-1 is
+    stored yet, and a download whose SHA-1 does not match is discarded.
+
+    Parameters
+    ----------
+    version: str
+        The HED version.
+    version_info: tuple
+        The git blob SHA-1 and the download url of the XML file.
+    cache_folder: str
+        hed cache folder.
+    Returns
+    -------
+    string
+        The path to the installed XML file, or None if it could not be cached.
+    """
     sha_hash, download_url = version_info
 
     possible_cache_filename = _create_xml_filename(version, cache_folder)
     local_sha_hash = _calculate_sha1(possible_cache_filename)
-
+    blob_filename = _get_blob_filename(sha_hash, cache_folder)
     if sha_hash == local_sha_hash:
+        _install_blob(possible_cache_filename, sha_hash, cache_folder)
         return possible_cache_filename
 
     os.makedirs(cache_folder, exist_ok=True)
-    temp_hed_xml_file = url_to_file(download_url)
-    if temp_hed_xml_file:
-        cache_filename = _safe_copy_tmp_to_folder(temp_hed_xml_file, possible_cache_filename)
-        return cache_filename
-    else:
-        return None
+    if not os.path.exists(blob_filename):
+        temp_hed_xml_file = url_to_file(download_url)
+        if not temp_hed_xml_file:
+            return None
+        try:
+            if _calculate_sha1(temp_hed_xml_file) != sha_hash:
+                print(f"Skipped caching HED {version}.  The downloaded file does not match its SHA-1 {sha_hash}.")
+                return None
+            blob_filename = _install_blob(temp_hed_xml_file, sha_hash, cache_folder)
+        finally:
+            os.remove(temp_hed_xml_file)
+        if not blob_filename:
+            return None
+    return _install_file(blob_filename, possible_cache_filename)
 
 
 def _get_latest_semantic_version_in_list(semantic_version_list):
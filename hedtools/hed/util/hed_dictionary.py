@@ -5,9 +5,90 @@ unit class attributes in a dictionary.
 The dictionary is a dictionary of dictionaries. The dictionary names are
 'default', 'extensionAllowed', 'isNumeric', 'position', 'predicateType', 'recommended', 'required', 'requireChild',
 'tags', 'takesValue', 'unique', 'units', and 'unitClass'.
+
+The 'required' and 'unique' tag prefixes are also kept in prefix tries, so that the prefixes a tag starts with are
+found in a single walk over the tag.
+
+The dictionaries can be saved to a compiled snapshot next to the HED XML file. If a snapshot exists and the XML file
+has not changed since it was written, the dictionaries are loaded from the snapshot instead of parsing the XML file.
+Snapshots are pickled, so they are only loaded for HED XML files in the hed_cache directory.
 """
 
+import os
 from defusedxml.lxml import parse
+from hed.util import hed_cache
+from hed.util import schema_loader
+from hed.util import schema_snapshot
+from hed.util.unit_matcher import UnitMatcher
+
+# The key under which a prefix trie node stores the prefix that ends at the node. Every other key is one character.
+PREFIX_TRIE_END_KEY = ''
+
+
+def build_prefix_trie(prefixes):
+    """Builds a character trie of tag prefixes.
+
+    Parameters
+    ----------
+    prefixes: iterable of str
+        The lowercase tag prefixes.
+
+    Returns
+    -------
+    dict
+        The root node of the trie. Each node is a dictionary keyed by the next character of a prefix.
+
+    """
+    prefix_trie = {}
+    for prefix in prefixes:
+        node = prefix_trie
+        for character in prefix:
+            node = node.setdefault(character, {})
+        node[PREFIX_TRIE_END_KEY] = prefix
+    return prefix_trie
+
+
+def find_prefixes(prefix_trie, tag):
+    """Finds the prefixes in a prefix trie that a tag starts with.
+
+    Parameters
+    ----------
+    prefix_trie: dict
+        A trie built by build_prefix_trie.
+    tag: str
+        A lowercase tag.
+
+    Returns
+    -------
+    list
+        The prefixes that the tag starts with, shortest first.
+
+    """
+    prefixes = []
+    node = prefix_trie
+    for character in tag:
+        node = node.get(character)
+        if node is None:
+            return prefixes
+        if PREFIX_TRIE_END_KEY in node:
+            prefixes.append(node[PREFIX_TRIE_END_KEY])
+    return prefixes
+
+
+class TagRecord:
+    """The attributes of a single tag in the schema, including the attributes it inherits from its ancestors and the
+       attributes of its '#' child."""
+    __slots__ = ('extension_allowed', 'takes_value_child', 'unit_classes', 'unit_class_units', 'unit_matcher',
+                 'default_unit')
+
+    def __init__(self, extension_allowed, takes_value_child, unit_classes, unit_class_units, unit_matcher,
+                 default_unit):
+        self.extension_allowed = extension_allowed
+        self.takes_value_child = takes_value_child
+        self.unit_classes = unit_classes
+        self.unit_class_units = unit_class_units
+        self.unit_matcher = unit_matcher
+        self.default_unit = default_unit
 
 
 class HedDictionary:
@@ -18,8 +99,16 @@ class HedDictionary:
     TAG_DICTIONARY_KEYS = ['default', 'extensionAllowed', 'isNumeric', 'position', 'predicateType', 'recommended',
                            'required', 'requireChild', 'tags', 'takesValue', 'unique', 'unitClass']
     UNIT_CLASS_DICTIONARY_KEYS = ['SIUnit', 'unitSymbol']
+    UNIT_SYMBOL_ATTRIBUTE = 'unitSymbol'
+    SI_UNIT_MODIFIER_KEY = 'SIUnitModifier'
+    SI_UNIT_SYMBOL_MODIFIER_KEY = 'SIUnitSymbolModifier'
     UNIT_MODIFIER_DICTIONARY_KEYS = ['SIUnitModifier', 'SIUnitSymbolModifier']
     TAGS_DICTIONARY_KEY = 'tags'
+    TAKES_VALUE_ATTRIBUTE = 'takesValue'
+    REQUIRE_CHILD_ATTRIBUTE = 'requireChild'
+    UNIQUE_ATTRIBUTE = 'unique'
+    REQUIRED_ATTRIBUTE = 'required'
+    TAKES_VALUE_CHILD = '#'
     TAG_UNIT_CLASS_ATTRIBUTE = 'unitClass'
     UNIT_CLASS_ELEMENT = 'unitClass'
     UNIT_CLASS_UNIT_ELEMENT = 'unit'
@@ -27,14 +116,24 @@ class HedDictionary:
     UNIT_MODIFIER_ELEMENT = 'unitModifier'
     UNITS_ELEMENT = 'units'
     VERSION_ATTRIBUTE = 'version'
+    SNAPSHOT_DICTIONARIES_KEY = 'dictionaries'
+    SNAPSHOT_HAS_UNIT_CLASSES_KEY = 'has_unit_classes'
+    SNAPSHOT_HAS_UNIT_MODIFIERS_KEY = 'has_unit_modifiers'
 
-    def __init__(self, hed_xml_file_path):
+    def __init__(self, hed_xml_file_path, use_snapshot=True, schema_contents=None):
         """Constructor for the Hed_Dictionary class.
 
         Parameters
         ----------
         hed_xml_file_path: str
             The path to a HED XML file.
+        use_snapshot: bool
+            True if the dictionaries should be loaded from a compiled snapshot when a valid one exists. Snapshots are
+            only loaded and written automatically for HED XML files in the hed_cache directory, as loading one runs
+            pickle on a file next to the XML file. False, if the XML file should always be parsed.
+        schema_contents: SchemaContents
+            The contents of the HED XML file already read by schema_loader.read_schema, so that the same read can be
+            shared with a SchemaNodeMap. The file is read if not given.
 
         Returns
         -------
@@ -42,90 +141,113 @@ class HedDictionary:
             A Hed_Dictionary object.
 
         """
-        self.root_element = self._find_root_element(hed_xml_file_path)
-        self._populate_dictionaries()
+        self.hed_xml_file_path = hed_xml_file_path
+        self.xml_hash = schema_snapshot.calculate_xml_hash(hed_xml_file_path)
+        self._root_element = None
+        use_snapshot = use_snapshot and self._is_in_hed_cache_directory()
+        if use_snapshot and self._load_snapshot():
+            self._populate_tag_records()
+            self._populate_prefix_tries()
+            return
+        if schema_contents is None:
+            schema_contents = schema_loader.read_schema(hed_xml_file_path)
+        self._populate_dictionaries(schema_contents)
+        self._populate_tag_records()
+        self._populate_prefix_tries()
+        if use_snapshot:
+            self.save_snapshot()
 
-    def get_root_element(self):
-        """Gets the root element of the HED XML file.
+    def __getstate__(self):
+        """Gets the state used to pickle this object. The parsed XML tree is not pickled.
+
+        Returns
+        -------
+        dict
+            The attributes of this object without the root element.
+
+        """
+        state = self.__dict__.copy()
+        state['_root_element'] = None
+        return state
+
+    @property
+    def root_element(self):
+        """The root element of the HED XML file. The XML file is only parsed into a tree on first access, as the
+           dictionaries are loaded without it."""
+        if self._root_element is None:
+            self._root_element = self._find_root_element(self.hed_xml_file_path)
+        return self._root_element
+
+    def save_snapshot(self):
+        """Saves the dictionaries to a compiled snapshot next to the HED XML file.
 
         Parameters
         ----------
 
         Returns
         -------
-        Element
-            The root element of the HED XML file.
+        str
+            The path to the saved snapshot. None if the snapshot could not be written.
 
         """
-        return self.root_element
+        snapshot = {schema_snapshot.XML_HASH_KEY: self.xml_hash,
+                    self.SNAPSHOT_DICTIONARIES_KEY: self.dictionaries,
+                    self.SNAPSHOT_HAS_UNIT_CLASSES_KEY: self.has_unit_classes,
+                    self.SNAPSHOT_HAS_UNIT_MODIFIERS_KEY: self.has_unit_modifiers}
+        return schema_snapshot.save_snapshot(snapshot, self.hed_xml_file_path)
 
-    def get_dictionaries(self):
-        """Gets a dictionary of dictionaries that contains all of the tags, tag attributes, unit class units, and unit
-           class attributes
+    def _load_snapshot(self):
+        """Loads the dictionaries from the compiled snapshot of the HED XML file.
 
         Parameters
         ----------
 
         Returns
         -------
-        dict
-            A dictionary of dictionaries that contains all of the tags, tag attributes, unit class units, and unit
-            class attributes
+        bool
+            True if a valid snapshot was loaded. False, if there is no snapshot or it is out of date.
 
         """
-        return self.dictionaries
+        snapshot = schema_snapshot.load_snapshot(self.hed_xml_file_path, self.xml_hash)
+        if snapshot is None:
+            return False
+        self.dictionaries = snapshot[self.SNAPSHOT_DICTIONARIES_KEY]
+        self.has_unit_classes = snapshot[self.SNAPSHOT_HAS_UNIT_CLASSES_KEY]
+        self.has_unit_modifiers = snapshot[self.SNAPSHOT_HAS_UNIT_MODIFIERS_KEY]
+        return True
 
-    def _populate_dictionaries(self):
-        """Populates a dictionary of dictionaries that contains all of the tags, tag attributes, unit class units,
-           and unit class attributes.
+    def _is_in_hed_cache_directory(self):
+        """Checks to see if the HED XML file is in the hed_cache directory.
 
         Parameters
         ----------
 
         Returns
         -------
-        dict
-            A dictionary of dictionaries that contains all of the tags, tag attributes, unit class units, and unit class
-            attributes.
+        bool
+            True if the HED XML file is in the hed_cache directory. False, if otherwise.
 
         """
-        self.dictionaries = {}
-        self._populate_tag_dictionaries()
-        self._populate_unit_class_dictionaries()
-        self._populate_unit_modifier_dictionaries()
+        xml_directory = os.path.dirname(os.path.realpath(self.hed_xml_file_path))
+        return xml_directory == os.path.realpath(hed_cache.HED_CACHE_DIRECTORY)
 
-    def _populate_tag_dictionaries(self):
-        """Populates a dictionary of dictionaries associated with tags and their attributes.
+    def get_root_element(self):
+        """Gets the root element of the HED XML file.
 
         Parameters
         ----------
 
         Returns
         -------
-        dict
-            A dictionary of dictionaries that has been populated with dictionaries associated with tag attributes.
+        Element
+            The root element of the HED XML file.
 
         """
-        for TAG_DICTIONARY_KEY in HedDictionary.TAG_DICTIONARY_KEYS:
-            tags, tag_elements = self.get_tags_by_attribute(TAG_DICTIONARY_KEY)
-            if HedDictionary.EXTENSION_ALLOWED_ATTRIBUTE == TAG_DICTIONARY_KEY:
-                child_tags = self._get_all_child_tags(tag_elements)
-                child_tags_dictionary = self._string_list_to_lowercase_dictionary(child_tags)
-                tag_dictionary = self._string_list_to_lowercase_dictionary(tags)
-                tag_dictionary.update(child_tags_dictionary)
-            elif HedDictionary.DEFAULT_UNIT_ATTRIBUTE == TAG_DICTIONARY_KEY or \
-                    HedDictionary.TAG_UNIT_CLASS_ATTRIBUTE == TAG_DICTIONARY_KEY:
-                tag_dictionary = self._populate_tag_to_attribute_dictionary(tags, tag_elements, TAG_DICTIONARY_KEY)
-            elif HedDictionary.TAGS_DICTIONARY_KEY == TAG_DICTIONARY_KEY:
-                tags = self.get_all_tags()[0]
-                tag_dictionary = self._string_list_to_lowercase_dictionary(tags)
-            else:
-                tag_dictionary = self._string_list_to_lowercase_dictionary(tags)
-            self.dictionaries[TAG_DICTIONARY_KEY] = tag_dictionary
+        return self.root_element
 
-    def _populate_unit_class_dictionaries(self):
-        """Populates a dictionary of dictionaries associated with all of the unit classes, unit class units, and unit
-           class default units.
+    def get_dictionaries(self):
+        """Gets a dictionary of dictionaries that contains all of the tags, tag attributes, unit class units, and unit
+           class attributes
 
         Parameters
         ----------
@@ -133,136 +255,196 @@ class HedDictionary:
         Returns
         -------
         dict
-            A dictionary of dictionaries associated with all of the unit classes, unit class units, and unit class
-            default units.
+            A dictionary of dictionaries that contains all of the tags, tag attributes, unit class units, and unit
+            class attributes
 
         """
-        unit_class_elements = self._get_elements_by_name(self.UNIT_CLASS_ELEMENT)
-        if len(unit_class_elements) == 0:
-            self.has_unit_classes = False
-            return
-        self.has_unit_classes = True
-        self._populate_unit_class_default_unit_dictionary(unit_class_elements)
-        self._populate_unit_class_units_dictionary(unit_class_elements)
+        return self.dictionaries
 
-    def _populate_unit_modifier_dictionaries(self):
-        """
+    def _populate_dictionaries(self, schema_contents):
+        """Populates a dictionary of dictionaries that contains all of the tags, tag attributes, unit class units,
+           and unit class attributes. Every dictionary is filled in a single pass over the contents of the HED XML
+           file, and the full path of each tag is only built once.
+
+        Parameters
+        ----------
+        schema_contents: SchemaContents
+            The tags, unit classes, and unit modifiers of the HED XML file.
 
         Returns
         -------
 
         """
-        unit_modifier_elements = self._get_elements_by_name(self.UNIT_MODIFIER_ELEMENT)
-        if len(unit_modifier_elements) == 0:
-            self.has_unit_modifiers = False
-            return
-        self.has_unit_modifiers = True
-        for unit_modifier_key in self.UNIT_MODIFIER_DICTIONARY_KEYS:
-            self.dictionaries[unit_modifier_key] = {}
-        for unit_modifier_element in unit_modifier_elements:
-            unit_modifier_name = self._get_element_tag_value(unit_modifier_element)
+        self.dictionaries = {tag_dictionary_key: {} for tag_dictionary_key in self.TAG_DICTIONARY_KEYS}
+        extension_allowed_tags = set()
+        extension_allowed_child_tags = {}
+        for schema_node in schema_contents.nodes:
+            tag = '/'.join(schema_node.tag_path)
+            lowercase_tag = tag.lower()
+            self.dictionaries[self.TAGS_DICTIONARY_KEY][lowercase_tag] = tag
+            for attribute_name, attribute_value in schema_node.attributes.items():
+                tag_dictionary = self.dictionaries.get(attribute_name)
+                if tag_dictionary is None or attribute_name == self.TAGS_DICTIONARY_KEY:
+                    continue
+                if attribute_name == self.DEFAULT_UNIT_ATTRIBUTE or attribute_name == self.TAG_UNIT_CLASS_ATTRIBUTE:
+                    tag_dictionary[lowercase_tag] = attribute_value
+                else:
+                    tag_dictionary[lowercase_tag] = tag
+            if self.EXTENSION_ALLOWED_ATTRIBUTE in schema_node.attributes:
+                extension_allowed_tags.add(schema_node.tag_path)
+            if tag[-1] != self.TAKES_VALUE_CHILD and \
+                    any(schema_node.tag_path[:depth] in extension_allowed_tags
+                        for depth in range(1, len(schema_node.tag_path))):
+                extension_allowed_child_tags[lowercase_tag] = tag
+        self.dictionaries[self.EXTENSION_ALLOWED_ATTRIBUTE].update(extension_allowed_child_tags)
+
+        self.has_unit_classes = bool(schema_contents.unit_classes)
+        if self.has_unit_classes:
+            self.dictionaries[self.DEFAULT_UNITS_FOR_TYPE_ATTRIBUTE] = {}
+            self.dictionaries[self.UNITS_ELEMENT] = {}
+            for unit_class_key in self.UNIT_CLASS_DICTIONARY_KEYS:
+                self.dictionaries[unit_class_key] = {}
+        for unit_class in schema_contents.unit_classes:
+            default_unit = unit_class.attributes.get(self.DEFAULT_UNITS_FOR_TYPE_ATTRIBUTE)
+            if default_unit is None:
+                default_unit = unit_class.attributes[self.DEFAULT_UNIT_FOR_OLD_UNIT_CLASS_ATTRIBUTE]
+            self.dictionaries[self.DEFAULT_UNITS_FOR_TYPE_ATTRIBUTE][unit_class.name] = default_unit
+            if not unit_class.units:
+                units = unit_class.units_text.split(',')
+                self.dictionaries[self.UNITS_ELEMENT][unit_class.name] = [unit.lower() for unit in units]
+                continue
+            self.dictionaries[self.UNITS_ELEMENT][unit_class.name] = [unit_name for unit_name, _ in unit_class.units]
+            for unit_name, unit_attributes in unit_class.units:
+                for unit_class_key in self.UNIT_CLASS_DICTIONARY_KEYS:
+                    self.dictionaries[unit_class_key][unit_name] = unit_attributes.get(unit_class_key)
+
+        self.has_unit_modifiers = bool(schema_contents.unit_modifiers)
+        if self.has_unit_modifiers:
             for unit_modifier_key in self.UNIT_MODIFIER_DICTIONARY_KEYS:
-                self.dictionaries[unit_modifier_key][unit_modifier_name] = unit_modifier_element.get(unit_modifier_key)
+                self.dictionaries[unit_modifier_key] = {}
+        for unit_modifier in schema_contents.unit_modifiers:
+            for unit_modifier_key in self.UNIT_MODIFIER_DICTIONARY_KEYS:
+                self.dictionaries[unit_modifier_key][unit_modifier.name] = \
+                    unit_modifier.attributes.get(unit_modifier_key)
 
-    def _populate_unit_class_units_dictionary(self, unit_class_elements):
-        """Populates a dictionary that contains unit class units.
+    def _populate_tag_records(self):
+        """Populates the tag_records dictionary with a TagRecord for every tag. The keys are the lowercase tags in the
+           schema. The root of the schema is stored under an empty string key so that top-level '#' tags are also
+           covered.
 
         Parameters
         ----------
-        unit_class_elements: list
-            A list of unit class elements.
 
         Returns
         -------
-        dict
-            A dictionary that contains all the unit class units.
 
         """
-        self.dictionaries[self.UNITS_ELEMENT] = {}
-        for unit_class_key in self.UNIT_CLASS_DICTIONARY_KEYS:
-            self.dictionaries[unit_class_key] = {}
-        for unit_class_element in unit_class_elements:
-            element_name = self._get_element_tag_value(unit_class_element)
-            element_units = self._get_elements_by_name('unit', unit_class_element)
-            if not element_units:
-                element_units = self._get_element_tag_value(unit_class_element, self.UNIT_CLASS_UNITS_ELEMENT)
-                units = element_units.split(',')
-                units_list = list(map(lambda unit: unit.lower(), units))
-                self.dictionaries[self.UNITS_ELEMENT][element_name] = units_list
-                continue
-            element_unit_names = list(map(lambda element: element.text, element_units))
-            self.dictionaries[self.UNITS_ELEMENT][element_name] = element_unit_names
-            for element_unit in element_units:
-                unit_name = element_unit.text
-                for unit_class_key in self.UNIT_CLASS_DICTIONARY_KEYS:
-                    self.dictionaries[unit_class_key][unit_name] = element_unit.get(unit_class_key)
+        self.tag_records = {}
+        self.unit_matchers = {}
+        for tag in ['', *self.dictionaries[self.TAGS_DICTIONARY_KEY]]:
+            if tag:
+                takes_value_tag = tag + '/' + self.TAKES_VALUE_CHILD
+            else:
+                takes_value_tag = self.TAKES_VALUE_CHILD
+            unit_classes = None
+            unit_class_units = ()
+            unit_matcher = None
+            default_unit = ''
+            if self.has_unit_classes and self.tag_has_attribute(takes_value_tag, self.TAG_UNIT_CLASS_ATTRIBUTE):
+                unit_classes = tuple(self.dictionaries[self.TAG_UNIT_CLASS_ATTRIBUTE][takes_value_tag].split(','))
+                unit_class_units = tuple(unit for unit_class in unit_classes
+                                         for unit in self.dictionaries[self.UNITS_ELEMENT].get(unit_class, []))
+                unit_matcher = self.get_unit_matcher(unit_class_units)
+                default_unit = self._get_default_unit(takes_value_tag, unit_classes)
+            self.tag_records[tag] = TagRecord(
+                extension_allowed=self._tag_or_ancestor_has_attribute(tag, self.EXTENSION_ALLOWED_ATTRIBUTE),
+                takes_value_child=self.tag_has_attribute(takes_value_tag, self.TAKES_VALUE_ATTRIBUTE),
+                unit_classes=unit_classes,
+                unit_class_units=unit_class_units,
+                unit_matcher=unit_matcher,
+                default_unit=default_unit)
+
+    def _populate_prefix_tries(self):
+        """Populates the prefix tries of the 'required' and 'unique' tag prefixes.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
 
-    def _populate_unit_class_default_unit_dictionary(self, unit_class_elements):
-        """Populates a dictionary that contains unit class default units.
+        """
+        self.required_prefix_trie = build_prefix_trie(self.dictionaries[self.REQUIRED_ATTRIBUTE])
+        self.unique_prefix_trie = build_prefix_trie(self.dictionaries[self.UNIQUE_ATTRIBUTE])
+
+    def get_unit_matcher(self, units):
+        """Gets the UnitMatcher for a sequence of units. Matchers are built once and shared.
 
         Parameters
         ----------
-        unit_class_elements: list
-            A list of unit class elements.
+        units: tuple
+            The units of one or more unit classes.
 
         Returns
         -------
-        dict
-            A dictionary that contains all the unit class default units.
+        UnitMatcher
+            A UnitMatcher for the units.
 
         """
-        self.dictionaries[HedDictionary.DEFAULT_UNITS_FOR_TYPE_ATTRIBUTE] = {}
-        for unit_class_element in unit_class_elements:
-            unit_class_element_name = self._get_element_tag_value(unit_class_element)
-            default_unit = unit_class_element.get(self.DEFAULT_UNITS_FOR_TYPE_ATTRIBUTE)
-            if default_unit is None:
-                self.dictionaries[HedDictionary.DEFAULT_UNITS_FOR_TYPE_ATTRIBUTE][unit_class_element_name] = \
-                    unit_class_element.attrib[HedDictionary.DEFAULT_UNIT_FOR_OLD_UNIT_CLASS_ATTRIBUTE]
+        units = tuple(units)
+        unit_matcher = self.unit_matchers.get(units)
+        if unit_matcher is None:
+            if self.has_unit_modifiers:
+                unit_matcher = UnitMatcher(units, self.dictionaries[self.UNIT_SYMBOL_ATTRIBUTE],
+                                           list(self.dictionaries[self.SI_UNIT_MODIFIER_KEY]),
+                                           list(self.dictionaries[self.SI_UNIT_SYMBOL_MODIFIER_KEY]))
             else:
-                self.dictionaries[self.DEFAULT_UNITS_FOR_TYPE_ATTRIBUTE][unit_class_element_name] = default_unit
+                unit_matcher = UnitMatcher(units)
+            self.unit_matchers[units] = unit_matcher
+        return unit_matcher
 
-    def _populate_tag_to_attribute_dictionary(self, tag_list, tag_element_list, attribute_name):
-        """Populates the dictionaries associated with default unit tags in the attribute dictionary.
+    def _tag_or_ancestor_has_attribute(self, tag, tag_attribute):
+        """Checks to see if a tag or any of its ancestors has a specific attribute.
 
         Parameters
         ----------
-        tag_list: list
-            A list containing tags that have a specific attribute.
-        tag_element_list: list
-            A list containing tag elements that have a specific attribute.
-        attribute_name: str
-            The name of the attribute associated with the tags and tag elements.
+        tag: str
+            A lowercase tag.
+        tag_attribute: str
+            A tag attribute.
 
         Returns
         -------
-        dict
-            The attribute dictionary that has been populated with dictionaries associated with tags.
+        bool
+            True if the tag or one of its ancestors has the attribute. False, if otherwise.
 
         """
-        dictionary = {}
-        for index, tag in enumerate(tag_list):
-            dictionary[tag.lower()] = tag_element_list[index].attrib[attribute_name]
-        return dictionary
+        while tag:
+            if self.tag_has_attribute(tag, tag_attribute):
+                return True
+            tag = tag[:tag.rfind('/')] if '/' in tag else ''
+        return False
 
-    def _string_list_to_lowercase_dictionary(self, string_list):
-        """Converts a string list into a dictionary. The keys in the dictionary will be the lowercase values of the
-           strings in the list.
+    def _get_default_unit(self, takes_value_tag, unit_classes):
+        """Gets the default unit of a '#' tag that has unit classes.
 
         Parameters
         ----------
-        string_list: list
-            A list containing string elements.
+        takes_value_tag: str
+            A lowercase tag ending in '#'.
+        unit_classes: tuple
+            The unit classes of the tag.
 
         Returns
         -------
-        dict
-            A dictionary containing the strings in the list.
+        str
+            The default unit of the tag, or the default unit of its first unit class. An empty string if neither is
+            defined.
 
         """
-        lowercase_dictionary = {}
-        for string_element in string_list:
-            lowercase_dictionary[string_element.lower()] = string_element
-        return lowercase_dictionary
+        if self.tag_has_attribute(takes_value_tag, self.DEFAULT_UNIT_ATTRIBUTE):
+            return self.dictionaries[self.DEFAULT_UNIT_ATTRIBUTE][takes_value_tag]
+        return self.dictionaries[self.DEFAULT_UNITS_FOR_TYPE_ATTRIBUTE].get(unit_classes[0], '')
 
     def _find_root_element(self, hed_xml_file_path):
         """Parses a XML file and returns the root element.
@@ -421,59 +603,6 @@ class HedDictionary:
         """
         return self.root_element.xpath('.//%s[@%s]' % (element_name, attribute_name))
 
-    def _get_elements_by_name(self, element_name='node', parent_element=None):
-        """Gets the elements that have a specific element name.
-
-        Parameters
-        ----------
-        element_name: str
-            The name of the element. The default is 'node'.
-        parent_element: RestrictedElement
-            The parent element. The default is 'None'. If a parent element is specified then only the children of the
-            parent will be returned with the given 'element_name'. If not specified the root element will be the parent.
-
-        Returns
-        -------
-        list
-            A list containing elements that have a specific element name.
-
-        """
-        if parent_element is None:
-            elements = self.root_element.xpath('.//%s' % element_name)
-        else:
-            elements = parent_element.xpath('.//%s' % element_name)
-        return elements
-
-    def _get_all_child_tags(self, tag_elements=None, element_name='node', exclude_take_value_tags=True):
-        """Gets the tag elements that are children of the given nodes
-
-        Parameters
-        ----------
-        tag_elements: list of nodes
-            The list to return all child tags from
-        element_name: str
-            The name of the XML tag elements. The default is 'node'.
-        exclude_take_value_tags: bool
-            True if to exclude tags that take values. False, if otherwise. The default is True.
-
-        Returns
-        -------
-        list
-            A list containing the tags that are child nodes.
-
-        """
-        child_tags = []
-        if tag_elements is None:
-            tag_elements = self._get_elements_by_name(element_name)
-        for tag_element in tag_elements:
-            tag_element_children = self._get_elements_by_name(element_name, tag_element)
-            for child_tag_element in tag_element_children:
-                tag = self._get_tag_path_from_tag_element(child_tag_element)
-                if exclude_take_value_tags and tag[-1] == '#':
-                    continue
-                child_tags.append(tag)
-        return child_tags
-
     def tag_has_attribute(self, tag, tag_attribute):
         """Checks to see if the tag has a specific attribute.
 
@@ -5,7 +5,8 @@ import openpyxl
 class HedFileInput:
     """Handles parsing the actual on disk hed files to a more general format."""
     TEXT_EXTENSION = ['.tsv', '.txt']
-    EXCEL_EXTENSION = ['.xls', '.xlsx']
+    EXCEL_EXTENSION = ['.xlsx']
+    LEGACY_EXCEL_EXTENSION = ['.xls']
     FILE_EXTENSION = [*TEXT_EXTENSION, *EXCEL_EXTENSION]
     STRING_INPUT = 'string'
     FILE_INPUT = 'file'
@@ -13,7 +14,7 @@ class HedFileInput:
     COMMA_DELIMITER = ','
 
     def __init__(self, filename, worksheet_name=None, tag_columns=None,
-                 has_column_names=True, column_prefix_dictionary=None):
+                 has_column_names=True, column_prefix_dictionary=None, read_only=False):
         """Constructor for the HedFileInput class.
 
          Parameters
@@ -33,7 +34,20 @@ class HedFileInput:
              4: 'Event/Label/', 5: 'Event/Category/'} The third column contains tags that need Event/Description/ prepended to them,
              the fourth column contains tags that need Event/Label/ prepended to them, and the fifth column contains tags
              that needs Event/Category/ prepended to them.
+         read_only: bool
+             If True, the rows of a tsv/txt file are read from the file as they are iterated over instead of being
+             loaded into memory. set_cell and save are not available in this mode, use stream_to_file instead.
+             Excel workbooks are opened with the streaming read only reader in this mode, which keeps the file open
+             until close is called. They are reopened in editable mode the first time set_cell or save is called.
+
+         Raises
+         ------
+         ValueError
+             If the file is a legacy .xls workbook, which cannot be read. Save it as .xlsx instead.
          """
+        if HedFileInput._is_extension_type(filename, HedFileInput.LEGACY_EXCEL_EXTENSION):
+            raise ValueError("Legacy Excel .xls workbooks are not supported. Save '%s' as an .xlsx workbook and try "
+                             "again." % os.path.basename(filename))
         if tag_columns is None:
             tag_columns = [2]
         if column_prefix_dictionary is None:
@@ -44,20 +58,27 @@ class HedFileInput:
         self._filename = filename
         self._worksheet_name = worksheet_name
         self._has_column_names = has_column_names
+        self._read_only = read_only
         self._parse_hed_tags_function = None
         self._text_file = None
         self._workbook = None
+        self._read_only_workbook = None
         self._worksheet = None
+        self._workbook_is_editable = not read_only
         if self.is_spreadsheet_file():
             self._parse_hed_tags_function = self._parse_spreadsheet
-            self._workbook = self._open_workbook(self._filename)
+            self._workbook = self._open_workbook(self._filename, read_only=read_only)
             self._worksheet = self.get_worksheet(self._worksheet_name)
         elif self.is_text_file():
             self._parse_hed_tags_function = self._parse_text
-            self._text_file = self._open_text_file(self._filename)
+            if not self._read_only:
+                self._text_file = self._open_text_file(self._filename)
 
     def save(self, filename):
+        if self._read_only and not self._workbook:
+            raise ValueError("A read only HedFileInput cannot be saved. Use stream_to_file instead.")
         if self._workbook:
+            self._make_workbook_editable()
             final_filename = filename + ".xlsx"
             self._workbook.save(final_filename)
         elif self._text_file:
@@ -68,11 +89,72 @@ class HedFileInput:
                     f.write(row_to_write)
                     f.write('\n')
 
+    def stream_to_file(self, filename, row_function):
+        """Writes the rows of a tsv/txt file to another file as they are read, with the HED tag columns replaced.
+
+        Only the current row is held in memory, so this works for text files of any size. The header row is written
+        unchanged. Excel workbooks are modified in memory with set_cell and saved once all of the rows are processed.
+
+        Parameters
+        ----------
+        filename: str
+            The name of the file to write to, without the extension.
+        row_function: function
+            A function that takes the row number, the row HED string, and the dictionary which associates columns with
+            HED tags. It returns a dictionary which associates columns with their new text, or None if the row is
+            unchanged. Column prefixes are removed from the new text.
+        Returns
+        -------
+        str
+            The name of the file that was written.
+
+        """
+        if self._workbook:
+            self._make_workbook_editable()
+            for row_number, row_hed_string, column_to_hed_tags_dictionary in self:
+                new_cells = row_function(row_number, row_hed_string, column_to_hed_tags_dictionary)
+                for column_number, new_text in (new_cells or {}).items():
+                    self.set_cell(row_number, column_number, new_text)
+            final_filename = filename + ".xlsx"
+            self._workbook.save(final_filename)
+            return final_filename
+
+        final_filename = filename + ".tsv"
+        with open(final_filename, 'w') as f:
+            for row_number, text_file_row in enumerate(self._iter_text_file_rows()):
+                if not self.row_contains_headers(self._has_column_names, row_number):
+                    row_hed_string, column_to_hed_tags_dictionary = \
+                        self.get_hed_string_from_text_file_row(text_file_row)
+                    new_cells = row_function(row_number, row_hed_string, column_to_hed_tags_dictionary)
+                    for column_number, new_text in (new_cells or {}).items():
+                        text_file_row[column_number] = self._remove_column_prefix(column_number, new_text)
+                f.write(self.TAB_DELIMITER.join(text_file_row))
+                f.write('\n')
+        return final_filename
+
     # Make filename read only.
     @property
     def filename(self):
         return self._filename
 
+    @property
+    def read_only(self):
+        return self._read_only
+
+    def close(self):
+        """Closes the workbook. A read only workbook keeps its file open until it is closed."""
+        if self._read_only_workbook:
+            self._read_only_workbook.close()
+            self._read_only_workbook = None
+        if self._workbook:
+            self._workbook.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def __iter__(self):
         return self._parse_hed_tags_function()
 
@@ -80,19 +162,36 @@ class HedFileInput:
         if self._worksheet is None:
             return
         if self._worksheet:
-            for row_number, row in enumerate(self._worksheet.rows):
+            max_column = None
+            if self._worksheet.max_column is None and self._tag_columns:
+                # The worksheet has no stored dimensions, so pad every row up to the last tag column.
+                max_column = max(self._tag_columns) + 1
+            for row_number, row in enumerate(self._worksheet.iter_rows(max_col=max_column, values_only=True)):
                 if self.row_contains_headers(self._has_column_names, row_number):
                     continue
-                row_hed_string, column_to_hed_tags_dictionary = self.get_hed_tags_from_worksheet_row(row)
+                row_hed_string, column_to_hed_tags_dictionary = self._get_hed_tags_from_row_values(row)
                 yield row_number, row_hed_string, column_to_hed_tags_dictionary
 
     def _parse_text(self):
-        for row_number, text_file_row in enumerate(self._text_file):
+        for row_number, text_file_row in enumerate(self._iter_text_file_rows()):
             if self.row_contains_headers(self._has_column_names, row_number):
                 continue
             row_hed_string, column_to_hed_tags_dictionary = self.get_hed_string_from_text_file_row(text_file_row)
             yield row_number, row_hed_string, column_to_hed_tags_dictionary
 
+    def _iter_text_file_rows(self):
+        """Iterates over the split rows of the text file. In read only mode the rows are read from the file.
+
+        Returns
+        -------
+        iterator
+            An iterator over lists containing the stripped cells of each row.
+
+        """
+        if self._text_file is not None:
+            return iter(self._text_file)
+        return self._stream_text_file(self._filename)
+
     def set_cell(self, row_number, column_number, new_text, include_column_prefix_if_exist=False):
         """
 
@@ -111,20 +210,56 @@ class HedFileInput:
         -------
 
         """
-        if not include_column_prefix_if_exist \
-                and self._column_prefix_dictionary \
-                and column_number in self._column_prefix_dictionary:
-            prefix_to_remove = self._column_prefix_dictionary[column_number]
-            if new_text.startswith(prefix_to_remove):
-                new_text = new_text[len(prefix_to_remove):]
+        if self._read_only and not self._workbook:
+            raise ValueError("Cells cannot be set in a read only HedFileInput. Use stream_to_file instead.")
+        if not include_column_prefix_if_exist:
+            new_text = self._remove_column_prefix(column_number, new_text)
 
         if self._workbook:
+            self._make_workbook_editable()
             # Cells are 1 based rather than 0 based, so add 1
             self._worksheet.cell(row_number + 1, column_number + 1).value = new_text
         elif self._text_file:
             text_file_row = self._text_file[row_number]
             text_file_row[column_number] = new_text
 
+    def _make_workbook_editable(self):
+        """Reopens the workbook in editable mode if it was opened with the read only reader.
+
+        The read only workbook is kept open until close is called because rows may still be read from it.
+
+        Returns
+        -------
+
+        """
+        if self._workbook_is_editable:
+            return
+        self._read_only_workbook = self._workbook
+        self._workbook = self._open_workbook(self._filename)
+        self._worksheet = self.get_worksheet(self._worksheet_name)
+        self._workbook_is_editable = True
+
+    def _remove_column_prefix(self, column_number, new_text):
+        """Removes the prefix of a column from text that is written to it.
+
+        Parameters
+        ----------
+        column_number : int
+            The column number of the spreadsheet.
+        new_text : str
+            Text to enter in the column.
+        Returns
+        -------
+        str
+            The text with the column prefix removed, if the column has one and the text starts with it.
+
+        """
+        if self._column_prefix_dictionary and column_number in self._column_prefix_dictionary:
+            prefix_to_remove = self._column_prefix_dictionary[column_number]
+            if new_text.startswith(prefix_to_remove):
+                new_text = new_text[len(prefix_to_remove):]
+        return new_text
+
     def get_hed_tags_from_worksheet_row(self, worksheet_row):
         """Reads in the current row of HED tags from the Excel file. The hed tag columns will be concatenated to form a
            HED string.
@@ -158,10 +293,26 @@ class HedFileInput:
             A HED string containing the concatenated HED tag columns.
 
         """
-        row_column_count = len(text_file_row)
+        return self._get_hed_tags_from_row_values(text_file_row)
+
+    def _get_hed_tags_from_row_values(self, row_values):
+        """Reads in the HED tags from the values of a text file row or a worksheet row.
+
+        Parameters
+        ----------
+        row_values: list
+            A list containing the values in the row.
+        Returns
+        -------
+        tuple
+            A tuple containing a HED string containing the concatenated HED tag columns and a dictionary which
+            associates columns with HED tags.
+
+        """
+        row_column_count = len(row_values)
         self._tag_columns = self._remove_tag_columns_greater_than_row_column_count(row_column_count,
                                                                                    self._tag_columns)
-        return self.get_row_hed_tags(text_file_row, is_worksheet=False)
+        return self.get_row_hed_tags(row_values, is_worksheet=False)
 
     def get_row_hed_tags(self, spreadsheet_row, is_worksheet=True):
         """Reads in the current row of HED tags from a spreadsheet file. The hed tag columns will be concatenated to
@@ -345,19 +496,56 @@ class HedFileInput:
     def get_worksheet(self, worksheet_name=None):
         if not worksheet_name:
             return self._workbook.worksheets[0]
-        return self._workbook.get_sheet_by_name(worksheet_name)
+        return self._workbook[worksheet_name]
+
+    def get_worksheet_names(self):
+        """Gets the worksheet names in the Excel workbook.
+
+        Returns
+        -------
+        list
+            A list containing the worksheet names. Empty if the file is not an Excel workbook.
+
+        """
+        if not self._workbook:
+            return []
+        return list(self._workbook.sheetnames)
+
+    def get_column_names(self, worksheet_name=None):
+        """Gets the values in the first row of a worksheet or text file.
+
+        Parameters
+        ----------
+        worksheet_name: str
+            The name of the Excel worksheet. The worksheet this file was opened with is used if not given.
+        Returns
+        -------
+        list
+            A list containing the column names. Empty cells are returned as empty strings.
+
+        """
+        if self._workbook:
+            worksheet = self._worksheet
+            if worksheet_name:
+                worksheet = self.get_worksheet(worksheet_name)
+            for first_row in worksheet.iter_rows(max_row=1, values_only=True):
+                return ['' if value is None else value for value in first_row]
+            return []
+        for first_row in self._iter_text_file_rows():
+            return first_row
+        return []
 
     @staticmethod
-    def _open_workbook(workbook_path):
-        return openpyxl.load_workbook(workbook_path)
+    def _open_workbook(workbook_path, read_only=False):
+        return openpyxl.load_workbook(workbook_path, read_only=read_only)
 
     @staticmethod
     def _open_text_file(textfile_path):
+        return list(HedFileInput._stream_text_file(textfile_path))
+
+    @staticmethod
+    def _stream_text_file(textfile_path):
         column_delimiter = HedFileInput.TAB_DELIMITER
-        text_file = []
         with open(textfile_path, 'r', encoding='utf-8') as opened_text_file:
             for text_file_row in opened_text_file:
-                text_file_row = [x.strip() for x in text_file_row.split(column_delimiter)]
-                text_file.append(text_file_row)
-
-        return text_file
+                yield [x.strip() for x in text_file_row.split(column_delimiter)]
@@ -0,0 +1,473 @@
+"""
+This module contains a single-pass scanner and tokenizer for HED strings. The scanner reads a HED string once and finds
+both its string-level syntax problems and the spans of its tags and tag groups. The tokenizer builds an immutable parse
+tree of the tags and tag groups from those spans. Each node keeps its original text, its span in the HED string, and
+its group depth. The formatted text of a node is computed the first time it is needed.
+
+"""
+
+import re
+
+DELIMITER = ','
+DOUBLE_QUOTE_CHARACTER = '"'
+OPENING_GROUP_CHARACTER = '('
+CLOSING_GROUP_CHARACTER = ')'
+TILDE = '~'
+INVALID_CHARACTERS = '[]{}'
+TAG_TOKEN = 'tag'
+COMMA_MISSING_ERROR_TYPE = 'commaMissing'
+EXTRA_DELIMITER_ERROR_TYPE = 'extraDelimiter'
+INVALID_TAG_ERROR_TYPE = 'invalidTag'
+# The characters that the scanner stops at. The text between them is handled as a whole.
+SPECIAL_CHARACTER_EXPRESSION = re.compile('[%s]' % re.escape(DELIMITER + TILDE + OPENING_GROUP_CHARACTER +
+                                                             CLOSING_GROUP_CHARACTER + DOUBLE_QUOTE_CHARACTER +
+                                                             INVALID_CHARACTERS))
+
+
+class HedStringScan:
+    """The result of reading a HED string once.
+
+       invalid_characters is a list of (character, index) tuples. delimiter_issues is a list of (error type, issue
+       arguments) tuples for missing commas, extra delimiters, and text before an opening parenthesis, in the order the
+       issues appear in the HED string. tokens is a list of (token type, start, end) tuples, where the token type is
+       TAG_TOKEN, TILDE, OPENING_GROUP_CHARACTER, or CLOSING_GROUP_CHARACTER. The tokens are only complete if
+       tokenizable is True, which requires balanced parentheses and no text directly next to a group.
+    """
+    __slots__ = ('hed_string', 'invalid_characters', 'opening_parentheses_count', 'closing_parentheses_count',
+                 'delimiter_issues', 'tokens', 'tokenizable')
+
+    def __init__(self, hed_string):
+        self.hed_string = hed_string
+        self.invalid_characters = []
+        self.opening_parentheses_count = 0
+        self.closing_parentheses_count = 0
+        self.delimiter_issues = []
+        self.tokens = []
+        self.tokenizable = True
+
+
+def scan_hed_string(hed_string):
+    """Reads a HED string once, finding its string-level syntax problems and the spans of its tags and tag groups.
+
+    Only the delimiters, parentheses, double quotes, and invalid characters are looked at one at a time. The text
+    between them is handled as a whole.
+
+    Parameters
+    ----------
+    hed_string: str
+        A HED string consisting of tags and tag groups.
+    Returns
+    -------
+    HedStringScan
+        The syntax problems and tokens of the HED string.
+
+    """
+    hed_string_scan = HedStringScan(hed_string)
+    tokens = hed_string_scan.tokens
+    # The state of the delimiter check. The current tag of the check starts at tag_check_start.
+    checking_delimiters = True
+    last_character = ''
+    last_character_index = 0
+    tag_check_start = 0
+    tag_check_has_text = False
+    # The state of the tokenizer.
+    tag_start = tag_end = None
+    group_closed = False
+    depth = 0
+    text_start = 0
+    for match in [*SPECIAL_CHARACTER_EXPRESSION.finditer(hed_string), None]:
+        index = match.start() if match else len(hed_string)
+        if index > text_start:
+            text = hed_string[text_start:index]
+            stripped_text_length = len(text.lstrip())
+            if stripped_text_length:
+                first_index = index - stripped_text_length
+                last_index = text_start + len(text.rstrip()) - 1
+                if checking_delimiters:
+                    if last_character == CLOSING_GROUP_CHARACTER:
+                        hed_string_scan.delimiter_issues.append(
+                            (COMMA_MISSING_ERROR_TYPE, {'tag': hed_string[tag_check_start:first_index]}))
+                        checking_delimiters = False
+                    last_character = hed_string[last_index]
+                    last_character_index = last_index
+                tag_check_has_text = True
+                if group_closed:
+                    hed_string_scan.tokenizable = False
+                if tag_start is None:
+                    tag_start = first_index
+                tag_end = last_index + 1
+        if match is None:
+            break
+        character = hed_string[index]
+        text_start = index + 1
+        if character == DELIMITER or character == TILDE:
+            if checking_delimiters:
+                if not tag_check_has_text:
+                    hed_string_scan.delimiter_issues.append(
+                        (EXTRA_DELIMITER_ERROR_TYPE, {'character': character, 'index': index,
+                                                      'hed_string': hed_string}))
+                else:
+                    last_character = character
+                    last_character_index = index
+            tag_check_start = index + 1
+            tag_check_has_text = False
+            if tag_start is not None:
+                tokens.append((TAG_TOKEN, tag_start, tag_end))
+            if character == TILDE:
+                tokens.append((TILDE, index, index + 1))
+            tag_start = tag_end = None
+            group_closed = False
+            continue
+        if character == OPENING_GROUP_CHARACTER:
+            hed_string_scan.opening_parentheses_count += 1
+            if checking_delimiters:
+                if not tag_check_has_text:
+                    tag_check_start = index + 1
+                else:
+                    hed_string_scan.delimiter_issues.append(
+                        (INVALID_TAG_ERROR_TYPE, {'tag': hed_string[tag_check_start:index + 1]}))
+                last_character = character
+                last_character_index = index
+            if tag_start is not None or group_closed:
+                hed_string_scan.tokenizable = False
+            tokens.append((OPENING_GROUP_CHARACTER, index, index + 1))
+            depth += 1
+            tag_start = tag_end = None
+            continue
+        # The other special characters are part of the current tag for the delimiter check.
+        if checking_delimiters:
+            if last_character == CLOSING_GROUP_CHARACTER:
+                hed_string_scan.delimiter_issues.append(
+                    (COMMA_MISSING_ERROR_TYPE, {'tag': hed_string[tag_check_start:index]}))
+                checking_delimiters = False
+            last_character = character
+            last_character_index = index
+        tag_check_has_text = True
+        if character == CLOSING_GROUP_CHARACTER:
+            hed_string_scan.closing_parentheses_count += 1
+            if not depth:
+                hed_string_scan.tokenizable = False
+                continue
+            if tag_start is not None:
+                tokens.append((TAG_TOKEN, tag_start, tag_end))
+            tokens.append((CLOSING_GROUP_CHARACTER, index, index + 1))
+            depth -= 1
+            tag_start = tag_end = None
+            group_closed = True
+        elif character != DOUBLE_QUOTE_CHARACTER:
+            hed_string_scan.invalid_characters.append((character, index))
+            if group_closed:
+                hed_string_scan.tokenizable = False
+            if tag_start is None:
+                tag_start = index
+            tag_end = index + 1
+    if checking_delimiters and (last_character == DELIMITER or last_character == TILDE):
+        hed_string_scan.delimiter_issues.append(
+            (EXTRA_DELIMITER_ERROR_TYPE, {'character': last_character, 'index': last_character_index,
+                                          'hed_string': hed_string}))
+    if depth:
+        hed_string_scan.tokenizable = False
+    if tag_start is not None:
+        tokens.append((TAG_TOKEN, tag_start, tag_end))
+    return hed_string_scan
+
+
+def format_hed_tag(hed_tag):
+    """Format a single HED tag. New lines are replaced by spaces, slashes and double quotes in the beginning and end are
+       removed, and the tag is converted to lowercase.
+
+    Parameters
+    ----------
+    hed_tag: str
+        A HED tag.
+    Returns
+    -------
+    str
+        The formatted version of the HED tag.
+
+    """
+    hed_tag = hed_tag.replace('\n', ' ').strip()
+    if hed_tag.startswith('"'):
+        hed_tag = hed_tag[1:]
+    if hed_tag.endswith('"'):
+        hed_tag = hed_tag[:-1]
+    if hed_tag.startswith('/'):
+        hed_tag = hed_tag[1:]
+    if hed_tag.endswith('/'):
+        hed_tag = hed_tag[:-1]
+    return hed_tag.lower()
+
+
+def split_hed_string_with_spans(hed_string, start=0, end=None):
+    """Splits the tags and non-nested groups in part of a HED string. Double quotes are removed.
+
+    Parameters
+    ----------
+    hed_string: str
+        A HED string consisting of tags and tag groups.
+    start: int
+        The index in the HED string to start splitting at.
+    end: int
+        The index in the HED string to stop splitting at. The default is the end of the HED string.
+    Returns
+    -------
+    list
+        A list of tuples containing the text, start index, and end index of the individual tags and tag groups. Nested
+        tag groups are not split.
+
+    """
+    if end is None:
+        end = len(hed_string)
+    split_hed_string = []
+    number_of_opening_parentheses = 0
+    number_of_closing_parentheses = 0
+    current_tag = []
+    tag_start = tag_end = None
+    for index in range(start, end):
+        character = hed_string[index]
+        if character == DOUBLE_QUOTE_CHARACTER:
+            continue
+        elif character == OPENING_GROUP_CHARACTER:
+            number_of_opening_parentheses += 1
+        elif character == CLOSING_GROUP_CHARACTER:
+            number_of_closing_parentheses += 1
+        if number_of_opening_parentheses == number_of_closing_parentheses and \
+                (character == TILDE or character == DELIMITER):
+            if tag_start is not None:
+                split_hed_string.append((''.join(current_tag).strip(), tag_start, tag_end))
+            if character == TILDE:
+                split_hed_string.append((TILDE, index, index + 1))
+            current_tag = []
+            tag_start = tag_end = None
+        else:
+            current_tag.append(character)
+            if not character.isspace():
+                if tag_start is None:
+                    tag_start = index
+                tag_end = index + 1
+    if tag_start is not None:
+        split_hed_string.append((''.join(current_tag).strip(), tag_start, tag_end))
+    return split_hed_string
+
+
+class HedTagNode:
+    """A tag in a HED parse tree."""
+    __slots__ = ('_text', '_original_tag', '_formatted_tag', '_span', '_depth')
+    is_group = False
+
+    def __init__(self, text, span, depth):
+        self._text = text
+        self._original_tag = None
+        self._formatted_tag = None
+        self._span = span
+        self._depth = depth
+
+    @property
+    def text(self):
+        """The stripped text of the node with double quotes removed."""
+        return self._text
+
+    @property
+    def original_tag(self):
+        """The text of the node with new lines replaced by spaces."""
+        if self._original_tag is None:
+            self._original_tag = self._text.replace('\n', ' ')
+        return self._original_tag
+
+    @property
+    def formatted_tag(self):
+        """The lowercase formatted text of the node."""
+        if self._formatted_tag is None:
+            self._formatted_tag = format_hed_tag(self._text)
+        return self._formatted_tag
+
+    @property
+    def span(self):
+        """A tuple containing the start and end index of the node in the HED string."""
+        return self._span
+
+    @property
+    def depth(self):
+        """The number of groups that enclose the node."""
+        return self._depth
+
+
+class HedGroupNode(HedTagNode):
+    """A tag group in a HED parse tree. The text of a group includes its parentheses."""
+    __slots__ = ('_children',)
+    is_group = True
+
+    def __init__(self, text, span, depth, children):
+        super().__init__(text, span, depth)
+        self._children = tuple(children)
+
+    @property
+    def children(self):
+        """A tuple containing the tags and groups directly inside the group."""
+        return self._children
+
+    @property
+    def original_tags(self):
+        """A list containing the original text of the tags and groups directly inside the group."""
+        return [child.original_tag for child in self._children]
+
+    @property
+    def formatted_tags(self):
+        """A list containing the formatted text of the tags and groups directly inside the group."""
+        return [child.formatted_tag for child in self._children]
+
+
+class HedParseTree:
+    """An immutable parse tree of the tags and tag groups in a HED string."""
+    __slots__ = ('_hed_string', '_children', '_groups', '_top_level_tags', '_tags')
+
+    def __init__(self, hed_string, hed_string_scan=None):
+        """Constructor for the HedParseTree class.
+
+        Parameters
+        ----------
+        hed_string: str
+            A HED string consisting of tags and tag groups.
+        hed_string_scan: HedStringScan
+            The scan of the HED string, if it has already been scanned for validation. The HED string is scanned if
+            not given.
+        Returns
+        -------
+        HedParseTree
+            A HedParseTree object.
+
+        """
+        self._hed_string = hed_string
+        self._groups = []
+        group_tags = []
+        if hed_string_scan is None:
+            hed_string_scan = scan_hed_string(hed_string)
+        if hed_string_scan.tokenizable:
+            children = self._build_nodes_from_tokens(hed_string_scan.tokens, group_tags)
+        else:
+            children = self._build_nodes(0, len(hed_string), 0, group_tags)
+        self._children = tuple(children)
+        self._groups = tuple(self._groups)
+        self._top_level_tags = tuple(child for child in self._children if not child.is_group)
+        self._tags = self._remove_duplicate_tags(self._top_level_tags + tuple(group_tags))
+
+    @property
+    def hed_string(self):
+        """The HED string the tree was built from."""
+        return self._hed_string
+
+    @property
+    def children(self):
+        """A tuple containing the top-level tags and groups."""
+        return self._children
+
+    @property
+    def groups(self):
+        """A tuple containing all of the groups. Nested groups come before the groups that contain them."""
+        return self._groups
+
+    @property
+    def top_level_tags(self):
+        """A tuple containing the tags that are not in a group."""
+        return self._top_level_tags
+
+    @property
+    def tags(self):
+        """A tuple containing the unique tags. Top-level tags come first, followed by the tags in groups."""
+        return self._tags
+
+    def _build_nodes_from_tokens(self, tokens, group_tags):
+        """Builds the nodes of the tree from the tokens of the HED string scan. Tildes become tag nodes.
+
+        Parameters
+        ----------
+        tokens: list
+            A list of (token type, start, end) tuples. The parentheses must be balanced.
+        group_tags: list
+            A list that the tags in groups are appended to.
+        Returns
+        -------
+        list
+            A list containing the top-level nodes.
+
+        """
+        hed_string = self._hed_string
+        levels = [[]]
+        group_starts = []
+        for token_type, start, end in tokens:
+            if token_type == OPENING_GROUP_CHARACTER:
+                group_starts.append(start)
+                levels.append([])
+                continue
+            depth = len(group_starts)
+            if token_type == CLOSING_GROUP_CHARACTER:
+                group_start = group_starts.pop()
+                group_string = hed_string[group_start:end].replace(DOUBLE_QUOTE_CHARACTER, '')
+                group = HedGroupNode(group_string, (group_start, end), depth - 1, levels.pop())
+                levels[-1].append(group)
+                self._groups.append(group)
+                continue
+            text = hed_string[start:end]
+            if DOUBLE_QUOTE_CHARACTER in text:
+                text = text.replace(DOUBLE_QUOTE_CHARACTER, '')
+            tag = HedTagNode(text, (start, end), depth)
+            levels[-1].append(tag)
+            if depth:
+                group_tags.append(tag)
+        return levels[0]
+
+    def _build_nodes(self, start, end, depth, group_tags):
+        """Builds the nodes of the tree by splitting each level of the HED string separately. This keeps the behavior
+           of the original splitter for HED strings with unbalanced parentheses.
+
+        Parameters
+        ----------
+        start: int
+            The index in the HED string to start at.
+        end: int
+            The index in the HED string to stop at.
+        depth: int
+            The number of groups that enclose this part of the HED string.
+        group_tags: list
+            A list that the tags in groups are appended to.
+        Returns
+        -------
+        list
+            A list containing the nodes in this part of the HED string.
+
+        """
+        nodes = []
+        for text, tag_start, tag_end in split_hed_string_with_spans(self._hed_string, start, end):
+            if text.startswith(OPENING_GROUP_CHARACTER) and text.endswith(CLOSING_GROUP_CHARACTER):
+                children = self._build_nodes(tag_start + 1, tag_end - 1, depth + 1, group_tags)
+                group = HedGroupNode(text, (tag_start, tag_end), depth, children)
+                self._groups.append(group)
+                nodes.append(group)
+            else:
+                tag = HedTagNode(text, (tag_start, tag_end), depth)
+                if depth:
+                    group_tags.append(tag)
+                nodes.append(tag)
+        return nodes
+
+    @staticmethod
+    def _remove_duplicate_tags(tags):
+        """Removes the tags whose text appears earlier in a sequence of tags.
+
+        Parameters
+        ----------
+        tags: tuple
+            A tuple containing tag nodes.
+        Returns
+        -------
+        tuple
+            A tuple containing the first tag node for each text.
+
+        """
+        unique_texts = set()
+        unique_tags = []
+        for tag in tags:
+            if tag.text not in unique_texts:
+                unique_texts.add(tag.text)
+                unique_tags.append(tag)
+        return tuple(unique_tags)
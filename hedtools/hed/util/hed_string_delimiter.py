@@ -1,9 +1,10 @@
 """
-This module is used to split tags in a HED string.
+This module is used to split tags in a HED string. The tags and groups are views over a HedParseTree.
 
 """
 
-import copy
+from hed.util import hed_parse_tree
+from hed.util.hed_parse_tree import HedParseTree
 
 
 class HedStringDelimiter:
@@ -13,13 +14,15 @@ class HedStringDelimiter:
     CLOSING_GROUP_CHARACTER = ')'
     TILDE = '~'
 
-    def __init__(self, hed_string):
+    def __init__(self, hed_string, hed_string_scan=None):
         """Constructor for the HedStringDelimiter class.
 
         Parameters
         ----------
         hed_string
             A HED string consisting of tags and tag groups.
+        hed_string_scan: HedStringScan
+            The scan of the HED string, if it has already been scanned for validation.
         Returns
         -------
         HedStringDelimiter
@@ -27,18 +30,48 @@ class HedStringDelimiter:
 
         """
         self.hed_string = hed_string
-        self._split_hed_string_list = self.split_hed_string_into_list(hed_string)
-        self.tags = []
-        self.tag_groups = []
-        self.tag_group_strings = []
-        self.top_level_tags = self._find_top_level_tags()
-        self._find_group_tags(self._split_hed_string_list)
-        self.tags = HedStringDelimiter.format_hed_tags_in_list(self.tags, True)
-        self.top_level_tags = HedStringDelimiter.format_hed_tags_in_list(self.top_level_tags, True)
-        self.tag_groups = HedStringDelimiter.format_hed_tags_in_list(self.tag_groups, True)
-        self.formatted_tags = HedStringDelimiter.format_hed_tags_in_list(self.tags)
-        self.formatted_top_level_tags = HedStringDelimiter.format_hed_tags_in_list(self.top_level_tags)
-        self.formatted_tag_groups = HedStringDelimiter.format_hed_tags_in_list(self.tag_groups)
+        self.parse_tree = HedParseTree(hed_string, hed_string_scan)
+
+    @property
+    def tags(self):
+        return [tag.original_tag for tag in self.parse_tree.tags]
+
+    @property
+    def formatted_tags(self):
+        return [tag.formatted_tag for tag in self.parse_tree.tags]
+
+    @property
+    def top_level_tags(self):
+        return [tag.original_tag for tag in self.parse_tree.top_level_tags]
+
+    @property
+    def formatted_top_level_tags(self):
+        return [tag.formatted_tag for tag in self.parse_tree.top_level_tags]
+
+    @property
+    def tag_groups(self):
+        return [tag_group.original_tags for tag_group in self.parse_tree.groups]
+
+    @property
+    def formatted_tag_groups(self):
+        return [tag_group.formatted_tags for tag_group in self.parse_tree.groups]
+
+    @property
+    def tag_group_strings(self):
+        return [tag_group.text for tag_group in self.parse_tree.groups]
+
+    def get_parse_tree(self):
+        """Gets the parse_tree field.
+
+        Parameters
+        ----------
+        Returns
+        -------
+        HedParseTree
+            The parse tree of the tags and groups in the HED string.
+
+        """
+        return self.parse_tree
 
     def get_split_hed_string_list(self):
         """Gets the split_hed_string_list field.
@@ -51,7 +84,7 @@ class HedStringDelimiter:
             A list containing the individual tags and tag groups in the HED string. Nested tag groups are not split.
 
         """
-        return self._split_hed_string_list
+        return [tag_or_group.text for tag_or_group in self.parse_tree.children]
 
     def get_hed_string(self):
         """Gets the hed_string field.
@@ -157,46 +190,6 @@ class HedStringDelimiter:
         """
         return self.tag_group_strings
 
-    def _find_group_tags(self, tag_group_list):
-        """Finds the tags that are in groups and put them in a set. The groups themselves are also put into a list.
-
-        Parameters
-        ----------
-        tag_group_list: list
-            A list containing the group tags.
-        Returns
-        -------
-
-        """
-        for tag_or_group in tag_group_list:
-            if HedStringDelimiter.hed_string_is_a_group(tag_or_group):
-                tag_group_string = HedStringDelimiter.remove_group_parentheses(tag_or_group)
-                nested_group_tag_list = self.split_hed_string_into_list(tag_group_string)
-                self._find_group_tags(nested_group_tag_list)
-                self.tag_groups.append(nested_group_tag_list)
-                self.tag_group_strings.append(tag_or_group)
-            elif tag_or_group not in self.tags:
-                self.tags.append(tag_or_group)
-
-    def _find_top_level_tags(self):
-        """Finds all of the tags at the top-level in a HED string. All group tags will be removed.
-
-        Parameters
-        ----------
-        Returns
-        -------
-        list
-            A list containing the top-level tags.
-
-        """
-        top_level_tags = copy.copy(self._split_hed_string_list)
-        for tag_or_group in self._split_hed_string_list:
-            if HedStringDelimiter.hed_string_is_a_group(tag_or_group):
-                top_level_tags.remove(tag_or_group)
-            elif tag_or_group not in self.tags:
-                self.tags.append(tag_or_group)
-        return top_level_tags
-
     @staticmethod
     def format_hed_tag(hed_tag, only_remove_new_line=False):
         """Format a single HED tag. Slashes and double quotes in the beginning and end are removed and the tag is
@@ -214,19 +207,9 @@ class HedStringDelimiter:
             The formatted version of the HED tag.
 
         """
-        hed_tag = hed_tag.replace('\n', ' ')
         if only_remove_new_line:
-            return hed_tag
-        hed_tag = hed_tag.strip()
-        if hed_tag.startswith('"'):
-            hed_tag = hed_tag[1:]
-        if hed_tag.endswith('"'):
-            hed_tag = hed_tag[:-1]
-        if hed_tag.startswith('/'):
-            hed_tag = hed_tag[1:]
-        if hed_tag.endswith('/'):
-            hed_tag = hed_tag[:-1]
-        return hed_tag.lower()
+            return hed_tag.replace('\n', ' ')
+        return hed_parse_tree.format_hed_tag(hed_tag)
 
     @staticmethod
     def format_hed_tags_in_list(hed_tags_list, only_remove_new_line=False):
@@ -288,32 +271,8 @@ class HedStringDelimiter:
             A list containing the individual tags and tag groups in the HED string. Nested tag groups are not split.
 
         """
-        split_hed_string = []
-        number_of_opening_parentheses = 0
-        number_of_closing_parentheses = 0
-        current_tag = ''
-        for index, character in enumerate(hed_string):
-            if character == HedStringDelimiter.DOUBLE_QUOTE_CHARACTER:
-                continue
-            elif character == HedStringDelimiter.OPENING_GROUP_CHARACTER:
-                number_of_opening_parentheses += 1
-            elif character == HedStringDelimiter.CLOSING_GROUP_CHARACTER:
-                number_of_closing_parentheses += 1
-            if number_of_opening_parentheses == number_of_closing_parentheses and character == HedStringDelimiter.TILDE:
-                if not HedStringDelimiter.string_is_space_or_empty(current_tag):
-                    split_hed_string.append(current_tag.strip())
-                split_hed_string.append(HedStringDelimiter.TILDE)
-                current_tag = ''
-            elif number_of_opening_parentheses == number_of_closing_parentheses and character == \
-                    HedStringDelimiter.DELIMITER:
-                if not HedStringDelimiter.string_is_space_or_empty(current_tag):
-                    split_hed_string.append(current_tag.strip())
-                current_tag = ''
-            else:
-                current_tag += character
-        if not HedStringDelimiter.string_is_space_or_empty(current_tag):
-            split_hed_string.append(current_tag.strip())
-        return split_hed_string
+        split_hed_string = hed_parse_tree.split_hed_string_with_spans(hed_string)
+        return [tag_or_group for tag_or_group, _, _ in split_hed_string]
 
     @staticmethod
     def string_is_space_or_empty(string):
@@ -0,0 +1,141 @@
+"""
+This module contains functions for reading a HED XML file in a single streaming pass. The file is read with iterparse,
+so the depth of each element is tracked from its start and end events instead of looking up its ancestors, and each
+element is removed from the tree once it has been read. Only the tags, unit classes, and unit modifiers are kept, so
+the whole XML tree is never held in memory.
+
+The SchemaContents returned by read_schema can be given to both SchemaNodeMap and HedDictionary so that they are
+built from the same pass over the file.
+"""
+
+from xml.etree.ElementTree import ParseError
+
+from defusedxml.ElementTree import iterparse
+
+from hed.util.errors import SchemaError
+
+NODE_ELEMENT = 'node'
+NAME_ELEMENT = 'name'
+UNIT_CLASS_ELEMENT = 'unitClass'
+UNIT_CLASS_UNIT_ELEMENT = 'unit'
+UNIT_CLASS_UNITS_ELEMENT = 'units'
+UNIT_MODIFIER_ELEMENT = 'unitModifier'
+VERSION_ATTRIBUTE = 'version'
+
+
+class SchemaNode:
+    """A single tag in the schema.
+
+       tag_path is a tuple containing the name of the tag and the names of its ancestors, starting with the top-level
+       tag. attributes is a dictionary of the XML attributes of the node element.
+    """
+    __slots__ = ('tag_path', 'attributes')
+
+    def __init__(self, tag_path, attributes):
+        self.tag_path = tag_path
+        self.attributes = attributes
+
+
+class SchemaUnitClass:
+    """A single unit class in the schema.
+
+       units is a list of (unit name, attributes) pairs, one for each unit element. units_text is the text of the
+       units element for unit classes that list their units as comma-separated text instead.
+    """
+    __slots__ = ('name', 'attributes', 'units', 'units_text')
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = attributes
+        self.units = []
+        self.units_text = None
+
+
+class SchemaUnitModifier:
+    """A single unit modifier in the schema."""
+    __slots__ = ('name', 'attributes')
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = attributes
+
+
+class SchemaContents:
+    """The tags, unit classes, and unit modifiers of a HED XML file in document order."""
+
+    def __init__(self, version=None):
+        self.version = version
+        self.nodes = []
+        self.unit_classes = []
+        self.unit_modifiers = []
+
+
+def read_schema(hed_xml_file_path):
+    """Reads the contents of a HED XML file in a single streaming pass.
+
+    Parameters
+    ----------
+    hed_xml_file_path: str
+        The path to a HED XML file.
+
+    Returns
+    -------
+    SchemaContents
+        The tags, unit classes, and unit modifiers of the HED XML file.
+
+    Raises
+    ------
+    SchemaError
+        If the file is not well-formed XML.
+
+    """
+    schema_contents = SchemaContents()
+    element_stack = []
+    tag_name_stack = []
+    node_attributes_stack = []
+    unit_class = None
+    unit_modifier = None
+    try:
+        for event, element in iterparse(hed_xml_file_path, events=('start', 'end')):
+            if event == 'start':
+                if not element_stack:
+                    schema_contents.version = element.get(VERSION_ATTRIBUTE)
+                element_stack.append(element)
+                if element.tag == NODE_ELEMENT:
+                    node_attributes_stack.append(dict(element.attrib))
+                elif element.tag == UNIT_CLASS_ELEMENT:
+                    unit_class = SchemaUnitClass(None, dict(element.attrib))
+                elif element.tag == UNIT_MODIFIER_ELEMENT:
+                    unit_modifier = SchemaUnitModifier(None, dict(element.attrib))
+                continue
+
+            element_stack.pop()
+            parent_tag = element_stack[-1].tag if element_stack else None
+            if element.tag == NAME_ELEMENT:
+                if parent_tag == NODE_ELEMENT and len(tag_name_stack) < len(node_attributes_stack):
+                    tag_name_stack.append(element.text)
+                    schema_contents.nodes.append(SchemaNode(tuple(tag_name_stack), node_attributes_stack[-1]))
+                elif parent_tag == UNIT_CLASS_ELEMENT and unit_class.name is None:
+                    unit_class.name = element.text
+                elif parent_tag == UNIT_MODIFIER_ELEMENT and unit_modifier.name is None:
+                    unit_modifier.name = element.text
+            elif element.tag == NODE_ELEMENT:
+                node_attributes_stack.pop()
+                del tag_name_stack[len(node_attributes_stack):]
+            elif element.tag == UNIT_CLASS_UNIT_ELEMENT and unit_class is not None:
+                unit_class.units.append((element.text, dict(element.attrib)))
+            elif element.tag == UNIT_CLASS_UNITS_ELEMENT and parent_tag == UNIT_CLASS_ELEMENT \
+                    and unit_class.units_text is None:
+                unit_class.units_text = element.text
+            elif element.tag == UNIT_CLASS_ELEMENT:
+                schema_contents.unit_classes.append(unit_class)
+                unit_class = None
+            elif element.tag == UNIT_MODIFIER_ELEMENT:
+                schema_contents.unit_modifiers.append(unit_modifier)
+                unit_modifier = None
+            if element_stack:
+                element_stack[-1].remove(element)
+            element.clear()
+    except ParseError as e:
+        raise SchemaError(e.msg)
+    return schema_contents
@@ -1,7 +1,4 @@
-from defusedxml.lxml import parse
-import lxml
-
-from hed.util.errors import SchemaError
+from hed.util import schema_loader
 
 
 class TagEntry:
@@ -16,26 +13,37 @@ class TagEntry:
         self.long_clean_tag = long_org_tag.lower()
 
 
+class TagPathNode:
+    """This is a single node in the tag path trie.
+
+       The path from the root of the trie to a node is a lowercase tag path that ends with the name of the schema tag
+       in entry, such as 'sensory event' or 'event/sensory event'.
+    """
+    __slots__ = ('entry', 'children')
+
+    def __init__(self, entry):
+        self.entry = entry
+        self.children = {}
+
+
 class SchemaNodeMap:
     """     Helper class for seeing if a schema has any duplicate tags/validate basic existence
        """
-    def __init__(self, hed_xml_file=None, hed_tree=None, use_full_name_as_key=False):
+    def __init__(self, hed_xml_file=None, hed_tree=None, use_full_name_as_key=False, schema_contents=None):
         self.parent_map = None
         self.tag_dict = {}
         self.current_depth_check = []
         self.tag_name_stack = []
         self.no_duplicate_tags = True
         self.use_full_name_as_key = use_full_name_as_key
+        self._tag_path_trie = None
 
         if hed_tree is not None:
             self.process_tree(hed_tree)
+        elif schema_contents is not None:
+            self.process_schema_contents(schema_contents)
         elif hed_xml_file:
-            try:
-                hed_tree = parse(hed_xml_file)
-            except lxml.etree.XMLSyntaxError as e:
-                raise SchemaError(e.msg)
-            hed_tree = hed_tree.getroot()
-            self.process_tree(hed_tree)
+            self.process_schema_contents(schema_loader.read_schema(hed_xml_file))
 
     def process_tree(self, hed_tree):
         """Primary setup function.  Takes an XML tree and sets up the mapping dict."""
@@ -58,6 +66,68 @@ class SchemaNodeMap:
                     self.tag_name_stack.append(elem.text)
                     self._add_tag(elem.text, self.tag_name_stack)
 
+    def process_schema_contents(self, schema_contents):
+        """Sets up the mapping dict from the contents of a HED XML file read by schema_loader.read_schema."""
+        self._reset_map_schema()
+
+        for schema_node in schema_contents.nodes:
+            tag_name = schema_node.tag_path[-1]
+            # handle special case where text is just "#"
+            if tag_name and "#" in tag_name:
+                continue
+            self._add_tag(tag_name, schema_node.tag_path)
+
+    @property
+    def tag_path_trie(self):
+        """A trie over every valid way of writing each tag, from its short form to its long form.
+
+        Each tag is added under every trailing part of its long path, so 'Event/Sensory event' is added as
+        'sensory event' and 'event/sensory event'. The children of the returned dictionary are keyed by the lowercase
+        first part of a path. A tag path is valid if it can be walked from the root one part at a time, and the node it
+        ends on holds the TagEntry of its last part. The trie is built the first time it is used. It is only built from
+        tags with unique names.
+
+        Returns
+        -------
+            dict: (lowercase tag name : TagPathNode)
+        """
+        if self._tag_path_trie is None:
+            tag_path_trie = {}
+            for tag_entry in self.tag_dict.values():
+                if isinstance(tag_entry, list):
+                    continue
+                path_parts = tag_entry.long_clean_tag.split('/')
+                for start_index in range(len(path_parts)):
+                    children = tag_path_trie
+                    for path_part in path_parts[start_index:]:
+                        node = children.get(path_part)
+                        if node is None:
+                            node = children[path_part] = TagPathNode(None)
+                        children = node.children
+                    node.entry = tag_entry
+            self._tag_path_trie = tag_path_trie
+        return self._tag_path_trie
+
+    def find_tag_path(self, path_parts):
+        """Finds the tag that a lowercase tag path written in short, long, or intermediate form refers to.
+
+        Parameters
+        ----------
+        path_parts: list of str
+            The lowercase parts of the tag path.
+        Returns
+        -------
+            TagEntry: The tag the path ends with, or None if the parts are not a trailing part of a long tag path.
+        """
+        children = self.tag_path_trie
+        node = None
+        for path_part in path_parts:
+            node = children.get(path_part)
+            if node is None:
+                return None
+            children = node.children
+        return node.entry if node else None
+
     def has_duplicate_tags(self):
         """Converting functions don't make much sense to work if we have duplicate tags and are disabled"""
         return not self.no_duplicate_tags
@@ -97,6 +167,7 @@ class SchemaNodeMap:
     def _reset_map_schema(self):
         self.tag_name_stack = []
         self.tag_dict = {}
+        self._tag_path_trie = None
         self.current_depth_check = ["node"]
         self.no_duplicate_tags = True
 
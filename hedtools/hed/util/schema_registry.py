@@ -0,0 +1,247 @@
+"""
+This module contains the SchemaRegistry class which shares schema objects between callers in the same process.
+
+A schema object is built once per resolved HED XML file path and file modification time, and reused until it is
+evicted or the file changes. Objects returned by the registry are shared and must be treated as read-only.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from hed.util.hed_dictionary import HedDictionary
+from hed.util.schema_node_map import SchemaNodeMap
+
+DEFAULT_MAX_SIZE = 16
+HED_DICTIONARY_KIND = 'HedDictionary'
+SCHEMA_NODE_MAP_KIND = 'SchemaNodeMap'
+
+
+class SchemaRegistry:
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """Constructor for the SchemaRegistry class.
+
+        Parameters
+        ----------
+        max_size: int
+            The maximum number of schema objects to keep. The least recently used object is evicted when the registry
+            is full.
+
+        Returns
+        -------
+        SchemaRegistry
+            A SchemaRegistry object.
+
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._pending_builds = {}
+        self._lock = threading.Lock()
+
+    def get_hed_dictionary(self, hed_xml_file_path):
+        """Gets the shared HedDictionary for a HED XML file.
+
+        Parameters
+        ----------
+        hed_xml_file_path: str
+            The path to a HED XML file.
+
+        Returns
+        -------
+        HedDictionary
+            The shared HedDictionary built from the HED XML file.
+
+        """
+        key = self._get_key(HED_DICTIONARY_KIND, hed_xml_file_path)
+        return self._get_or_build(key, lambda: HedDictionary(hed_xml_file_path))
+
+    def get_schema_node_map(self, hed_xml_file_path):
+        """Gets the shared SchemaNodeMap for a HED XML file.
+
+        Parameters
+        ----------
+        hed_xml_file_path: str
+            The path to a HED XML file.
+
+        Returns
+        -------
+        SchemaNodeMap
+            The shared SchemaNodeMap built from the HED XML file.
+
+        """
+        key = self._get_key(SCHEMA_NODE_MAP_KIND, hed_xml_file_path)
+        return self._get_or_build(key, lambda: SchemaNodeMap(hed_xml_file_path))
+
+    def get_cache_info(self):
+        """Gets the hit and miss counters of the registry.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        dict
+            A dictionary with the keys 'hits', 'misses', 'evictions', 'size', and 'max_size'.
+
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'size': len(self._entries), 'max_size': self.max_size}
+
+    def clear(self):
+        """Removes all schema objects from the registry and resets the counters.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    @staticmethod
+    def _get_key(kind, hed_xml_file_path):
+        """Gets the registry key of a schema object.
+
+        Parameters
+        ----------
+        kind: str
+            The kind of schema object.
+        hed_xml_file_path: str
+            The path to a HED XML file.
+
+        Returns
+        -------
+        tuple
+            A tuple containing the kind, the resolved path, the modification time, and the size of the HED XML file.
+            Each HED version is stored in its own file, so the resolved path also identifies the version.
+
+        """
+        resolved_path = os.path.realpath(hed_xml_file_path)
+        file_stat = os.stat(resolved_path)
+        return kind, resolved_path, file_stat.st_mtime_ns, file_stat.st_size
+
+    def _get_or_build(self, key, build_function):
+        """Gets the schema object for a key, building it if it is not in the registry.
+
+        Only one thread builds the object for a key. Other threads asking for the same key wait for that build.
+
+        Parameters
+        ----------
+        key: tuple
+            The registry key.
+        build_function: function
+            A function that builds the schema object.
+
+        Returns
+        -------
+        object
+            The schema object.
+
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            pending_build = self._pending_builds.get(key)
+            if pending_build is None:
+                pending_build = Future()
+                self._pending_builds[key] = pending_build
+                self.misses += 1
+                is_builder = True
+            else:
+                self.hits += 1
+                is_builder = False
+        if not is_builder:
+            return pending_build.result()
+        try:
+            schema_object = build_function()
+        except BaseException as e:
+            with self._lock:
+                del self._pending_builds[key]
+            pending_build.set_exception(e)
+            raise
+        with self._lock:
+            del self._pending_builds[key]
+            self._entries[key] = schema_object
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        pending_build.set_result(schema_object)
+        return schema_object
+
+
+_default_registry = SchemaRegistry()
+
+
+def get_default_registry():
+    """Gets the process-wide schema registry.
+
+    Returns
+    -------
+    SchemaRegistry
+        The schema registry shared by the validator and tag format tools.
+
+    """
+    return _default_registry
+
+
+def get_hed_dictionary(hed_xml_file_path):
+    """Gets the shared HedDictionary for a HED XML file from the process-wide registry.
+
+    Parameters
+    ----------
+    hed_xml_file_path: str
+        The path to a HED XML file.
+
+    Returns
+    -------
+    HedDictionary
+        The shared HedDictionary built from the HED XML file.
+
+    """
+    return _default_registry.get_hed_dictionary(hed_xml_file_path)
+
+
+def get_schema_node_map(hed_xml_file_path):
+    """Gets the shared SchemaNodeMap for a HED XML file from the process-wide registry.
+
+    Parameters
+    ----------
+    hed_xml_file_path: str
+        The path to a HED XML file.
+
+    Returns
+    -------
+    SchemaNodeMap
+        The shared SchemaNodeMap built from the HED XML file.
+
+    """
+    return _default_registry.get_schema_node_map(hed_xml_file_path)
+
+
+def get_cache_info():
+    """Gets the hit and miss counters of the process-wide registry.
+
+    Returns
+    -------
+    dict
+        A dictionary with the keys 'hits', 'misses', 'evictions', 'size', and 'max_size'.
+
+    """
+    return _default_registry.get_cache_info()
+
+
+def clear_cache():
+    """Removes all schema objects from the process-wide registry."""
+    _default_registry.clear()
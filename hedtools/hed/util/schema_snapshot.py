@@ -0,0 +1,123 @@
+"""
+This module saves and loads compiled snapshots of a HED schema. A snapshot holds the plain dictionaries of a
+HedDictionary together with a format version and a hash of the HED XML file it was built from. Snapshots are stored
+next to the XML file so that the XML does not have to be parsed again as long as it is unchanged.
+
+"""
+
+import os
+import pickle
+import tempfile
+from hashlib import sha1
+
+SNAPSHOT_EXTENSION = '.snapshot'
+SNAPSHOT_FORMAT_VERSION = 1
+FORMAT_VERSION_KEY = 'format_version'
+XML_HASH_KEY = 'xml_hash'
+
+
+def get_snapshot_path(hed_xml_file_path):
+    """Gets the path of the snapshot that belongs to a HED XML file.
+
+    Parameters
+    ----------
+    hed_xml_file_path: str
+        The path to a HED XML file.
+
+    Returns
+    -------
+    str
+        The path to the snapshot file. The snapshot lives in the same directory as the XML file.
+
+    """
+    return os.path.splitext(hed_xml_file_path)[0] + SNAPSHOT_EXTENSION
+
+
+def calculate_xml_hash(hed_xml_file_path):
+    """Calculates the SHA-1 hash of the contents of a HED XML file.
+
+    Parameters
+    ----------
+    hed_xml_file_path: str
+        The path to a HED XML file.
+
+    Returns
+    -------
+    str
+        The hex digest of the file contents.
+
+    """
+    with open(hed_xml_file_path, 'rb') as hed_xml_file:
+        return sha1(hed_xml_file.read()).hexdigest()
+
+
+def save_snapshot(snapshot, hed_xml_file_path):
+    """Saves a snapshot next to the HED XML file it was built from.
+
+    The snapshot is written to a temporary file first and then renamed, so readers never see a partial snapshot.
+
+    Parameters
+    ----------
+    snapshot: dict
+        A dictionary of plain Python objects. It must contain the hash of the XML file under XML_HASH_KEY.
+    hed_xml_file_path: str
+        The path to the HED XML file the snapshot was built from.
+
+    Returns
+    -------
+    str
+        The path to the saved snapshot. None if the snapshot could not be written.
+
+    """
+    snapshot_path = get_snapshot_path(hed_xml_file_path)
+    snapshot = dict(snapshot)
+    snapshot[FORMAT_VERSION_KEY] = SNAPSHOT_FORMAT_VERSION
+    temp_snapshot_path = None
+    try:
+        snapshot_fd, temp_snapshot_path = tempfile.mkstemp(suffix=SNAPSHOT_EXTENSION,
+                                                           dir=os.path.dirname(snapshot_path) or None)
+        with os.fdopen(snapshot_fd, 'wb') as snapshot_file:
+            pickle.dump(snapshot, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_snapshot_path, snapshot_path)
+    except OSError:
+        if temp_snapshot_path and os.path.exists(temp_snapshot_path):
+            os.remove(temp_snapshot_path)
+        return None
+    return snapshot_path
+
+
+def load_snapshot(hed_xml_file_path, xml_hash=None):
+    """Loads the snapshot that belongs to a HED XML file if it is still valid.
+
+    The snapshot is unpickled before its hash is checked, so only snapshots written by a trusted process, such as those
+    in the hed_cache directory, should be loaded.
+
+    Parameters
+    ----------
+    hed_xml_file_path: str
+        The path to a HED XML file.
+    xml_hash: str
+        The hash of the HED XML file. It is calculated if not given.
+
+    Returns
+    -------
+    dict
+        The snapshot. None if there is no snapshot, it was written by another format version, or the XML file has
+        changed since it was written.
+
+    """
+    snapshot_path = get_snapshot_path(hed_xml_file_path)
+    if not os.path.isfile(snapshot_path):
+        return None
+    try:
+        with open(snapshot_path, 'rb') as snapshot_file:
+            snapshot = pickle.load(snapshot_file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get(FORMAT_VERSION_KEY) != SNAPSHOT_FORMAT_VERSION:
+        return None
+    if xml_hash is None:
+        xml_hash = calculate_xml_hash(hed_xml_file_path)
+    if snapshot.get(XML_HASH_KEY) != xml_hash:
+        return None
+    return snapshot
@@ -0,0 +1,205 @@
+"""
+This module contains the UnitMatcher class which finds the unit used by a tag value. A matcher is built once for the
+units of a unit class, including their plural forms, so values can be checked without re-sorting the units or
+pluralizing them at validation time.
+
+"""
+
+import re
+from functools import lru_cache
+import inflect
+
+pluralize = inflect.engine()
+pluralize.defnoun("hertz", "hertz")
+
+
+@lru_cache(maxsize=None)
+def get_unit_plural(unit):
+    """Gets the plural form of a unit.
+
+    Parameters
+    ----------
+    unit: str
+        A unit.
+    Returns
+    -------
+    str
+        The plural form of the unit.
+
+    """
+    return pluralize.plural(unit)
+
+
+class UnitMatcher:
+    def __init__(self, units, unit_symbols=None, unit_modifiers=None, unit_symbol_modifiers=None):
+        """Constructor for the UnitMatcher class.
+
+        Longer units are tried first. A unit that is a symbol is matched against the original value and keeps its
+        case, other units and their plural forms are matched against the formatted value.
+
+        Parameters
+        ----------
+        units: list of str
+            The units of one or more unit classes.
+        unit_symbols: dict
+            A dictionary containing the 'unitSymbol' attribute of the units.
+        unit_modifiers: list of str
+            The unit modifiers that are stripped from values using a unit. None if the schema has no unit modifiers,
+            in which case no unit is treated as a symbol and plural forms are not matched.
+        unit_symbol_modifiers: list of str
+            The unit modifiers that are stripped from values using a unit symbol.
+
+        Returns
+        -------
+        UnitMatcher
+            A UnitMatcher object.
+
+        """
+        self._has_unit_modifiers = unit_modifiers is not None
+        candidates = []
+        for unit in sorted(units, key=len, reverse=True):
+            is_symbol = self._has_unit_modifiers and bool(unit_symbols.get(unit))
+            candidates.append((unit, is_symbol))
+            if self._has_unit_modifiers and unit_symbols.get(unit) is None:
+                candidates.append((get_unit_plural(unit), False))
+        self._symbol_candidates = [(index, unit) for index, (unit, is_symbol) in enumerate(candidates) if is_symbol]
+        self._word_candidates = [(index, unit) for index, (unit, is_symbol) in enumerate(candidates) if not is_symbol]
+        self._symbol_prefix_expression = self._compile_candidates(self._symbol_candidates)
+        self._symbol_suffix_expression = self._compile_candidates(self._symbol_candidates, reverse=True)
+        self._word_prefix_expression = self._compile_candidates(self._word_candidates)
+        self._word_suffix_expression = self._compile_candidates(self._word_candidates, reverse=True)
+        self._unit_modifiers = self._get_modifier_info(unit_modifiers)
+        self._unit_symbol_modifiers = self._get_modifier_info(unit_symbol_modifiers)
+
+    def match_units(self, original_value, formatted_value):
+        """Finds the unit used by a value and strips it and any unit modifiers off.
+
+        Parameters
+        ----------
+        original_value: str
+            The unformatted value of the tag.
+        formatted_value: str
+            The formatted value of the tag.
+        Returns
+        -------
+        tuple
+            A tuple containing the unit that was found and the value with the unit and unit modifiers removed. The
+            unit is None and the value is the formatted value if no unit was found.
+
+        """
+        best_index = None
+        for candidates, expression, value, is_prefix in (
+                (self._symbol_candidates, self._symbol_prefix_expression, original_value, True),
+                (self._symbol_candidates, self._symbol_suffix_expression, original_value[::-1], False),
+                (self._word_candidates, self._word_prefix_expression, formatted_value, True),
+                (self._word_candidates, self._word_suffix_expression, formatted_value[::-1], False)):
+            if expression is None:
+                continue
+            match = expression.match(value)
+            if match is None:
+                continue
+            index, unit = candidates[match.lastindex - 1]
+            if best_index is None or index < best_index:
+                best_index = index
+                best_unit = unit
+                best_is_prefix = is_prefix
+                best_is_symbol = candidates is self._symbol_candidates
+        if best_index is None:
+            return None, formatted_value
+        value = original_value if best_is_symbol else formatted_value
+        if best_is_prefix:
+            stripped_value = value[len(best_unit):].strip()
+        else:
+            stripped_value = value[0:-len(best_unit)].strip()
+        if self._has_unit_modifiers:
+            modifiers = self._unit_symbol_modifiers if best_is_symbol else self._unit_modifiers
+            stripped_value = self._strip_off_unit_modifiers(stripped_value, modifiers)
+        return best_unit, stripped_value
+
+    def strip_units(self, original_value, formatted_value):
+        """Removes the unit and any unit modifiers from a value.
+
+        Parameters
+        ----------
+        original_value: str
+            The unformatted value of the tag.
+        formatted_value: str
+            The formatted value of the tag.
+        Returns
+        -------
+        str
+            The value with the unit removed, if one was present. Otherwise, the formatted value.
+
+        """
+        return self.match_units(original_value, formatted_value)[1]
+
+    @staticmethod
+    def _strip_off_unit_modifiers(stripped_value, modifier_info):
+        """Removes unit modifiers from the beginning or end of a value. The modifiers are tried in schema order and each
+           one is removed at most once.
+
+        Parameters
+        ----------
+        stripped_value: str
+            A value with its unit removed.
+        modifier_info: tuple
+            A tuple containing the modifiers, their first characters, their last characters, and whether any of them
+            is empty.
+        Returns
+        -------
+        str
+            The value with the unit modifiers removed.
+
+        """
+        modifiers, first_characters, last_characters, has_empty_modifier = modifier_info
+        if not has_empty_modifier and (not stripped_value or (stripped_value[0] not in first_characters and
+                                                              stripped_value[-1] not in last_characters)):
+            return stripped_value
+        for unit_modifier in modifiers:
+            if stripped_value.startswith(unit_modifier):
+                stripped_value = stripped_value[len(unit_modifier):].strip()
+            elif stripped_value.endswith(unit_modifier):
+                stripped_value = stripped_value[0:-len(unit_modifier)].strip()
+        return stripped_value
+
+    @staticmethod
+    def _compile_candidates(candidates, reverse=False):
+        """Compiles units into an expression that matches the first unit, in order, at the start of a value.
+
+        Parameters
+        ----------
+        candidates: list
+            A list of (index, unit) tuples.
+        reverse: bool
+            True if the units should be reversed to match the end of a reversed value.
+        Returns
+        -------
+        Pattern
+            The compiled expression. None if there are no units.
+
+        """
+        if not candidates:
+            return None
+        groups = ['(%s)' % re.escape(unit[::-1] if reverse else unit) for _, unit in candidates]
+        return re.compile('|'.join(groups))
+
+    @staticmethod
+    def _get_modifier_info(unit_modifiers):
+        """Gets the modifiers with the characters they start and end with.
+
+        Parameters
+        ----------
+        unit_modifiers: list of str
+            The unit modifiers.
+        Returns
+        -------
+        tuple
+            A tuple containing the modifiers, a set of their first characters, a set of their last characters, and
+            whether any of them is empty.
+
+        """
+        unit_modifiers = list(unit_modifiers or [])
+        first_characters = {unit_modifier[0] for unit_modifier in unit_modifiers if unit_modifier}
+        last_characters = {unit_modifier[-1] for unit_modifier in unit_modifiers if unit_modifier}
+        has_empty_modifier = any(not unit_modifier for unit_modifier in unit_modifiers)
+        return unit_modifiers, first_characters, last_characters, has_empty_modifier
@@ -3,6 +3,26 @@ This module is used to report errors found in the validation.
 
 """
 
+ERROR_MESSAGES = {
+    'row': 'Issues in row %(error_row)s:\n',
+    'column': 'Issues in row %(error_row)s column %(error_column)s:\n',
+    'invalidFileName': '\tInvalid file name - "%(file_name)s"\n',
+    'parentheses': '\tERROR: Number of opening and closing parentheses are unequal. %(opening_parentheses_count)s '
+                   'opening parentheses. %(closing_parentheses_count)s closing parentheses\n',
+    'invalidCharacter': '\tERROR: Invalid character "%(character)s" at index %(index)s of string "%(hed_string)s"',
+    'commaMissing': '\tERROR: Comma missing after - "%(tag)s"\n',
+    'extraCommaOrInvalid': '\tERROR: Either "%(previous_tag)s" contains a comma when it should not or "%(tag)s" is not a '
+                           'valid tag\n ',
+    'duplicateTag': '\tERROR: Duplicate tag - "%(tag)s"\n',
+    'childRequired': '\tERROR: Descendant tag required - "%(tag)s"\n',
+    'tooManyTildes': '\tERROR: Too many tildes - group "%(tag)s"\n',
+    'multipleUniqueTags': '\tERROR: Multiple unique tags with prefix - "%(tag_prefix)s"\n',
+    'unitClassInvalidUnit': '\tERROR: Invalid unit - "%(tag)s" valid units are "%(unit_class_units)s"\n',
+    'invalidTag': '\tERROR: Invalid tag - "%(tag)s"\n',
+    'extraDelimiter': '\tERROR: Extra delimiter "%(character)s" at index %(index)s of string "%(hed_string)s"',
+}
+DEFAULT_ERROR_MESSAGE = 'ERROR: Unknown error'
+
 
 def report_error_type(error_type, error_row=1, error_column=1, hed_string='', tag='', tag_prefix='', previous_tag='',
                       character='', index=0, unit_class_units='', file_name='', opening_parentheses_count=0,
@@ -44,28 +64,16 @@ def report_error_type(error_type, error_row=1, error_column=1, hed_string='', ta
         error.
 
     """
-    error_types = {
-        'row': 'Issues in row %s:\n' % str(error_row),
-        'column': 'Issues in row %s column %s:\n' % (str(error_row), str(error_column)),
-        'invalidFileName': '\tInvalid file name - "%s"\n' % file_name,
-        'parentheses': '\tERROR: Number of opening and closing parentheses are unequal. %s opening parentheses. %s '
-                       'closing parentheses\n' % (opening_parentheses_count, closing_parentheses_count),
-        'invalidCharacter': '\tERROR: Invalid character "%s" at index %s of string "%s"'
-                            % (character, index, hed_string),
-        'commaMissing': '\tERROR: Comma missing after - "%s"\n' % tag,
-        'extraCommaOrInvalid': '\tERROR: Either "%s" contains a comma when it should not or "%s" is not a valid '
-                               'tag\n ' % (previous_tag, tag),
-        'duplicateTag': '\tERROR: Duplicate tag - "%s"\n' % tag,
-        'childRequired': '\tERROR: Descendant tag required - "%s"\n' % tag,
-        'tooManyTildes': '\tERROR: Too many tildes - group "%s"\n' % tag,
-        'multipleUniqueTags': '\tERROR: Multiple unique tags with prefix - "%s"\n' % tag_prefix,
-        'unitClassInvalidUnit': '\tERROR: Invalid unit - "%s" valid units are "%s"\n' % (tag, unit_class_units),
-        'invalidTag': '\tERROR: Invalid tag - "%s"\n' % tag,
-        'extraDelimiter': '\tERROR: Extra delimiter "%s" at index %s of string "%s"'
-                          % (character, index, hed_string),
-    }
-    default_error_message = 'ERROR: Unknown error'
-    error_message = error_types.get(error_type, default_error_message)
+    error_template = ERROR_MESSAGES.get(error_type)
+    if error_template is None:
+        error_message = DEFAULT_ERROR_MESSAGE
+    else:
+        error_message = error_template % {
+            'error_row': error_row, 'error_column': error_column, 'hed_string': hed_string, 'tag': tag,
+            'tag_prefix': tag_prefix, 'previous_tag': previous_tag, 'character': character, 'index': index,
+            'unit_class_units': unit_class_units, 'file_name': file_name,
+            'opening_parentheses_count': opening_parentheses_count,
+            'closing_parentheses_count': closing_parentheses_count}
 
     error_object = {'code': error_type, 'message': error_message}
     return [error_object]
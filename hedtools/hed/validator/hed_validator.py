@@ -1,29 +1,45 @@
 """
 This module contains the HedValidator class which is used to validate the tags in a HED string or a file. The file
-types include .tsv, .txt, .xls, and .xlsx. To get the validation issues after creating a HedValidator class call
-the get_validation_issues() function.
+types include .tsv, .txt, and .xlsx. To get the validation issues after creating a HedValidator class call
+the get_validation_issues() function. To validate many HED strings with the same validator call validate_many(), which
+returns the issues in an IssueTable. To revalidate a file incrementally pass an IssueStore, which keeps the issues of
+each row so that only the rows that changed since the last validation are validated again. A HedValidator created
+without an input can be reused for many inputs with validate(), and iter_row_issues() validates an input lazily and
+can stop after a number of errors.
 
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from hed.util import column_util
 from hed.util import hed_cache
+from hed.util import schema_registry
 from hed.validator import error_reporter
-from hed.util.hed_dictionary import HedDictionary
+from hed.validator import warning_reporter
+from hed.validator.issue_store import ROW_ISSUES_COLUMN
+from hed.validator.issue_table import IssueTable, NO_VALUE
+from hed.util.hed_parse_tree import scan_hed_string
 from hed.util.hed_string_delimiter import HedStringDelimiter
 from hed.validator.tag_validator import TagValidator
 from hed.util.hed_file_input import HedFileInput
 
 
 class HedValidator:
-    def __init__(self, hed_input, check_for_warnings=False, run_semantic_validation=True,
+    ROWS_PER_WORKER_CHUNK = 1000
+    CHUNKS_IN_FLIGHT_PER_WORKER = 2
+    ISSUE_LOCATION_CODES = ('row', 'column')
+
+    def __init__(self, hed_input=None, check_for_warnings=False, run_semantic_validation=True,
                  hed_xml_file='', xml_version_number=None,
-                 hed_dictionary=None):
+                 hed_dictionary=None, workers=None, progress_callback=None, issue_store=None):
         """Constructor for the HedValidator class.
 
         Parameters
         ----------
         hed_input: str or list or HedFileInput object
             A list of HED strings, a single HED string, or a HedFileInput object.
-            If it is a single string or a list, validate them as hed strings.
+            If it is a single string or a list, validate them as hed strings. If None, nothing is validated until
+            validate() or iter_row_issues() is called.
         check_for_warnings: bool
             True if the validator should check for warnings. False if the validator should only report errors.
         run_semantic_validation: bool
@@ -35,6 +51,16 @@ class HedValidator:
                 or does not point to a specific xml file.
         hed_dictionary: HedDictionary
             Name of already prepared HedDictionary to use.  This overrides hed_xml_url_or_file
+        workers: int
+            The number of worker processes used to validate the rows of a HedFileInput. The schema is sent to each
+            worker once and the issues are merged back in row order. The default validates the rows serially.
+        progress_callback: function
+            A function that is called as the rows of a HedFileInput are validated. It is passed the number of rows
+            validated so far and the number of issues found so far.
+        issue_store: IssueStore
+            A store of the issues of previously validated rows. If given, the rows of a HedFileInput whose HED strings
+            were validated before with the same schema and options reuse their stored issues, and the issues of the
+            other rows are added to the store. The rows are validated serially in this mode.
         Returns
         -------
         HedValidator object
@@ -43,6 +69,14 @@ class HedValidator:
         """
         self._is_file = isinstance(hed_input, HedFileInput)
         self._hed_input = hed_input
+        self._check_for_warnings = check_for_warnings
+        self._run_semantic_validation = run_semantic_validation
+        self._workers = workers
+        self._progress_callback = progress_callback
+        self._issue_store = issue_store
+        self._recomputed_row_count = 0
+        self._reused_row_count = 0
+        self._hed_dictionary = None
         if run_semantic_validation:
             if hed_dictionary is None:
                 self._hed_dictionary = self._get_hed_dictionary(hed_xml_file,
@@ -56,8 +90,144 @@ class HedValidator:
             self._tag_validator = TagValidator(check_for_warnings=check_for_warnings,
                                                run_semantic_validation=False)
 
-        self._validation_issues = self._validate_hed_input()
-        self._run_semantic_validation = run_semantic_validation
+        self._validation_issues = []
+        if hed_input is not None:
+            self._validation_issues = self._validate_hed_input()
+
+    def validate(self, hed_input, max_errors=None):
+        """Validates a new input with this validator. The schema and the TagValidator are reused, so one validator can
+           validate many inputs. The issue counts of the TagValidator include the issues of every input.
+
+         Parameters
+         ----------
+        hed_input: str or list or HedFileInput object
+            A list of HED strings, a single HED string, or a HedFileInput object.
+        max_errors: int
+            If given, validation stops once this many errors have been found. 1 stops at the first error. The rows
+            after the stopping point are not validated, so a list of HED strings gets a shorter list of issues. The
+            input is then validated lazily with iter_row_issues, which does not use the workers or issue_store.
+         Returns
+         -------
+         list
+             The issues that were found, in the same form as get_validation_issues().
+
+        """
+        self._hed_input = hed_input
+        self._is_file = isinstance(hed_input, HedFileInput)
+        if max_errors is None:
+            self._validation_issues = self._validate_hed_input()
+        elif isinstance(hed_input, str):
+            self._validation_issues = [issue for _, _, issues in self.iter_row_issues(hed_input, max_errors)
+                                       for issue in issues]
+        elif self._is_file:
+            self._validation_issues = list(self.iter_validation_issues(hed_input, max_errors))
+        else:
+            validation_issues = []
+            for row_number, _, issues in self.iter_row_issues(hed_input, max_errors):
+                validation_issues += [[] for _ in range(row_number - len(validation_issues))]
+                validation_issues.append(issues)
+            if self.count_errors([issue for issues in validation_issues for issue in issues]) < max_errors:
+                validation_issues += [[] for _ in range(len(hed_input) - len(validation_issues))]
+            self._validation_issues = validation_issues
+        return self._validation_issues
+
+    def is_valid(self, hed_input):
+        """Checks if an input has no errors with this validator. Validation stops at the first error, so an invalid
+           file is usually rejected after reading only a few rows.
+
+         Parameters
+         ----------
+        hed_input: str or list or HedFileInput object
+            A list of HED strings, a single HED string, or a HedFileInput object.
+         Returns
+         -------
+         bool
+             True if the input has no errors. False, if otherwise. Warnings do not make an input invalid.
+
+        """
+        for _, _, issues in self.iter_row_issues(hed_input, max_errors=1):
+            if self.count_errors(issues):
+                return False
+        return True
+
+    def iter_row_issues(self, hed_input, max_errors=None):
+        """Validates an input lazily with this validator. Each row is validated only when the issues before it have
+           been consumed, so the caller can stop at any time. The rows are validated serially in this process, so the
+           workers and issue_store of this validator are not used.
+
+         Parameters
+         ----------
+        hed_input: str or list or HedFileInput object
+            A list or other iterable of HED strings, a single HED string, or a HedFileInput object.
+        max_errors: int
+            If given, no more rows are validated once this many errors have been found. 1 stops at the first error.
+         Yields
+         -------
+         tuple
+             A (row, column, issues) tuple for each row or column with issues. For a HedFileInput the row is the row
+             number in the file, and the column is the column number, or None for the issues of the whole row. For
+             HED strings the row is the position of the string and the column is None. An invalid file name is
+             reported with None as the row.
+
+        """
+        error_count = 0
+        for row_number, column_number, validation_issues in self._iter_row_issues(hed_input):
+            yield row_number, column_number, validation_issues
+            if max_errors is not None:
+                error_count += self.count_errors(validation_issues)
+                if error_count >= max_errors:
+                    return
+
+    def _iter_row_issues(self, hed_input):
+        """Validates an input lazily, yielding the issues of each row or column with issues.
+
+         Parameters
+         ----------
+        hed_input: str or list or HedFileInput object
+            A list or other iterable of HED strings, a single HED string, or a HedFileInput object.
+         Yields
+         -------
+         tuple
+             A (row, column, issues) tuple for each row or column with issues.
+
+        """
+        if isinstance(hed_input, str):
+            validation_issues = self._validate_hed_strings([hed_input])[0]
+            if validation_issues:
+                yield 0, None, validation_issues
+        elif not isinstance(hed_input, HedFileInput):
+            for row_number, hed_string in enumerate(hed_input):
+                validation_issues = self._validate_hed_strings([hed_string])[0]
+                if validation_issues:
+                    yield row_number, None, validation_issues
+        elif not hed_input.is_valid_extension():
+            yield None, None, error_reporter.report_error_type('invalidFileName', file_name=hed_input.filename)
+        else:
+            for rows_processed, (row_number, row_hed_string, column_to_hed_tags_dictionary) in \
+                    enumerate(hed_input, 1):
+                row_issues, _, _ = self._get_row_issues(row_hed_string, column_to_hed_tags_dictionary)
+                for column_number, validation_issues in row_issues:
+                    yield row_number, column_number, validation_issues
+                if self._progress_callback:
+                    self._progress_callback(rows_processed, self._tag_validator.get_issue_count())
+
+    @staticmethod
+    def count_errors(validation_issues):
+        """Counts the errors in a list of issues. Warnings and the row and column issues giving the location of other
+           issues are not counted.
+
+         Parameters
+         ----------
+        validation_issues: list
+            A list of issues.
+         Returns
+         -------
+         int
+             The number of errors.
+
+        """
+        return sum(1 for issue in validation_issues if issue['code'] not in warning_reporter.WARNING_MESSAGES
+                   and issue['code'] not in HedValidator.ISSUE_LOCATION_CODES)
 
     def get_tag_validator(self):
         """Gets a TagValidator object.
@@ -73,10 +243,38 @@ class HedValidator:
         """
         return self._tag_validator
 
+    def get_recomputed_row_count(self):
+        """Gets the number of rows that were validated instead of reusing the issues in the issue store.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        int
+            The number of rows that were validated.
+
+        """
+        return self._recomputed_row_count
+
+    def get_reused_row_count(self):
+        """Gets the number of rows whose issues were taken from the issue store.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        int
+            The number of rows whose stored issues were reused.
+
+        """
+        return self._reused_row_count
+
     @staticmethod
     def _get_hed_dictionary(hed_xml_file, get_specific_version=None):
         """Gets a HEDDictionary object based on the hed xml file specified. If no HED file is specified then the latest
-           file will be retrieved.
+           file will be retrieved. The HEDDictionary is shared through the process-wide schema registry.
 
         Parameters
         ----------
@@ -92,7 +290,7 @@ class HedValidator:
 
         """
         final_hed_xml_file = hed_cache.get_local_file(hed_xml_file, get_specific_version)
-        hed_dictionary = HedDictionary(final_hed_xml_file)
+        hed_dictionary = schema_registry.get_hed_dictionary(final_hed_xml_file)
         return hed_dictionary
 
     def _validate_hed_input(self):
@@ -117,14 +315,177 @@ class HedValidator:
         return validation_issues
 
     def _validate_hed_tags_in_file(self):
+        if self._issue_store is not None:
+            return self._validate_hed_tags_in_file_incrementally()
+        if self._workers and self._workers > 1:
+            return self._validate_hed_tags_in_file_in_parallel()
         validation_issues = []
 
-        for row_number, row_hed_string, column_to_hed_tags_dictionary in self._hed_input:
+        for rows_processed, (row_number, row_hed_string, column_to_hed_tags_dictionary) in \
+                enumerate(self._hed_input, 1):
             validation_issues = self._append_validation_issues_if_found(validation_issues, row_number, row_hed_string,
                                                                         column_to_hed_tags_dictionary)
+            if self._progress_callback:
+                self._progress_callback(rows_processed, self._tag_validator.get_issue_count())
 
         return validation_issues
 
+    def _validate_hed_tags_in_file_incrementally(self):
+        """Validates the HED tags in a file, reusing the issues in the issue store for rows that were validated
+           before and storing the issues of the other rows.
+
+         Parameters
+         ----------
+         Returns
+         -------
+         list
+             The issues that were found.
+
+        """
+        validation_issues = []
+        validator_key = self._get_validator_key()
+        for rows_processed, (row_number, row_hed_string, column_to_hed_tags_dictionary) in \
+                enumerate(self._hed_input, 1):
+            row_key = self._issue_store.get_row_key(validator_key, row_hed_string, column_to_hed_tags_dictionary)
+            stored_row_issues = self._issue_store.get_row_issues(row_key)
+            if stored_row_issues is None:
+                row_issues, error_count, warning_count = self._get_row_issues(row_hed_string,
+                                                                              column_to_hed_tags_dictionary)
+                self._issue_store.set_row_issues(row_key, row_issues, error_count, warning_count)
+                self._recomputed_row_count += 1
+            else:
+                row_issues, error_count, warning_count = stored_row_issues
+                self._tag_validator.add_issue_counts(error_count, warning_count)
+                self._reused_row_count += 1
+            for column_number, column_validation_issues in row_issues:
+                if column_number == ROW_ISSUES_COLUMN:
+                    validation_issues += HedValidator.generate_row_issue_message(row_number)
+                else:
+                    validation_issues += HedValidator.generate_column_issue_message(row_number, column_number)
+                validation_issues += column_validation_issues
+            if self._progress_callback:
+                self._progress_callback(rows_processed, self._tag_validator.get_issue_count())
+        self._issue_store.commit()
+        return validation_issues
+
+    def _get_validator_key(self):
+        """Gets a string identifying the schema and options of this validator, which is part of the key of each row
+           in the issue store.
+
+         Parameters
+         ----------
+         Returns
+         -------
+         str
+             The validator key.
+
+        """
+        xml_hash = self._hed_dictionary.xml_hash if self._hed_dictionary else None
+        return '%s:%s:%s' % (xml_hash, self._check_for_warnings, self._run_semantic_validation)
+
+    def _get_row_issues(self, row_hed_string, column_to_hed_tags_dictionary):
+        """Validates a row and gets its issues grouped by column, without the row and column issues giving their
+           location.
+
+         Parameters
+         ----------
+        row_hed_string: str
+            The HED string associated with a row.
+        column_to_hed_tags_dictionary: dict
+            A dictionary which associates columns with HED tags
+         Returns
+         -------
+         tuple
+             A tuple containing a list of (column, issues) pairs, the number of errors, and the number of warnings in
+             the row. The column is ROW_ISSUES_COLUMN for the issues of the whole row.
+
+        """
+        error_count = self._tag_validator.get_error_count()
+        warning_count = self._tag_validator.get_warning_count()
+        row_issues = []
+        if row_hed_string:
+            hed_string_delimiter = HedStringDelimiter(row_hed_string)
+            row_validation_issues = self._validate_top_level_in_hed_string(hed_string_delimiter)
+            row_validation_issues += self._validate_tag_levels_in_hed_string(hed_string_delimiter)
+            if row_validation_issues:
+                row_issues.append((ROW_ISSUES_COLUMN, row_validation_issues))
+        for column_number, column_hed_string in column_to_hed_tags_dictionary.items():
+            column_validation_issues = self.validate_column_hed_string(column_hed_string)
+            if column_validation_issues:
+                row_issues.append((column_number, column_validation_issues))
+        return row_issues, self._tag_validator.get_error_count() - error_count, \
+            self._tag_validator.get_warning_count() - warning_count
+
+    def _validate_hed_tags_in_file_in_parallel(self):
+        """Validates the HED tags in a file using a pool of worker processes. Each worker validates chunks of rows
+           and the issues are merged back in row order.
+
+         Parameters
+         ----------
+         Returns
+         -------
+         list
+             The issues that were found.
+
+        """
+        validation_issues = []
+        rows_processed = 0
+        worker_arguments = (self._hed_dictionary, self._check_for_warnings, self._run_semantic_validation)
+        with ProcessPoolExecutor(max_workers=self._workers, initializer=_initialize_worker,
+                                 initargs=worker_arguments) as executor:
+            for chunk_validation_issues, chunk_error_count, chunk_warning_count, chunk_row_count in \
+                    self._map_row_chunks(executor):
+                validation_issues += chunk_validation_issues
+                self._tag_validator.add_issue_counts(chunk_error_count, chunk_warning_count)
+                rows_processed += chunk_row_count
+                if self._progress_callback:
+                    self._progress_callback(rows_processed, self._tag_validator.get_issue_count())
+        return validation_issues
+
+    def _map_row_chunks(self, executor):
+        """Sends the row chunks to the worker processes and gets their results in row order. Only a few chunks per
+           worker are submitted ahead of the result being collected, so the rows of a large file are not all read into
+           memory at once.
+
+         Parameters
+         ----------
+         executor: Executor
+             The executor that runs the worker processes.
+         Returns
+         -------
+         generator
+             A generator that yields the result of _validate_rows_in_worker for each chunk, in row order.
+
+        """
+        max_chunks_in_flight = self._workers * self.CHUNKS_IN_FLIGHT_PER_WORKER
+        chunk_futures = deque()
+        for row_chunk in self._get_row_chunks():
+            if len(chunk_futures) == max_chunks_in_flight:
+                yield chunk_futures.popleft().result()
+            chunk_futures.append(executor.submit(_validate_rows_in_worker, row_chunk))
+        while chunk_futures:
+            yield chunk_futures.popleft().result()
+
+    def _get_row_chunks(self):
+        """Groups the rows of the HED file input into chunks that are sent to the worker processes.
+
+         Parameters
+         ----------
+         Returns
+         -------
+         generator
+             A generator that yields lists of (row_number, row_hed_string, column_to_hed_tags_dictionary) tuples.
+
+        """
+        row_chunk = []
+        for row in self._hed_input:
+            row_chunk.append(row)
+            if len(row_chunk) == self.ROWS_PER_WORKER_CHUNK:
+                yield row_chunk
+                row_chunk = []
+        if row_chunk:
+            yield row_chunk
+
     def get_validation_issues(self):
         """Gets the issues.
 
@@ -138,6 +499,166 @@ class HedValidator:
          """
         return self._validation_issues
 
+    def iter_validation_issues(self, hed_file_input, max_errors=None):
+        """Validates the rows of a file one at a time with this validator. The issues of each row are yielded as soon as
+           the row is validated, so they can be written out before the rest of the file is read. Like iter_row_issues,
+           this does not use the workers or issue_store of this validator.
+
+         Parameters
+         ----------
+        hed_file_input: HedFileInput object
+            The file to validate.
+        max_errors: int
+            If given, no more rows are validated once this many errors have been found.
+         Yields
+         -------
+         dict
+             The issues that were found, in the same order as the issues returned by get_validation_issues() for the
+             same input, including the row and column issues.
+
+         """
+        for row_number, column_number, validation_issues in self.iter_row_issues(hed_file_input, max_errors):
+            if row_number is None:
+                yield from validation_issues
+            elif column_number == ROW_ISSUES_COLUMN:
+                yield from HedValidator.generate_row_issue_message(row_number) + validation_issues
+            else:
+                yield from HedValidator.generate_column_issue_message(row_number, column_number) + validation_issues
+
+    def validate_column(self, hed_strings):
+        """Validates a column of HED strings with this validator. Each unique HED string is validated once and its
+           issues are given to every row with that string. The issue counts of the tag validator include the issues of
+           every row.
+
+         Parameters
+         ----------
+        hed_strings: list, NumPy array, or pandas Series
+            The column of HED strings. Values that are not strings, such as missing cells, have no issues.
+         Returns
+         -------
+         list, NumPy array, or pandas Series
+             The issues of each row, in the same kind of container as hed_strings. Rows with the same string share the
+             same list of issues.
+
+         """
+        unique_strings, row_codes, value_counts = column_util.factorize_column(hed_strings)
+        unique_issues = []
+        for hed_string, value_count in zip(unique_strings, value_counts):
+            if not isinstance(hed_string, str):
+                unique_issues.append([])
+                continue
+            error_count = self._tag_validator.get_error_count()
+            warning_count = self._tag_validator.get_warning_count()
+            unique_issues.append(self._validate_hed_strings([hed_string])[0])
+            self._tag_validator.add_issue_counts(
+                (self._tag_validator.get_error_count() - error_count) * (value_count - 1),
+                (self._tag_validator.get_warning_count() - warning_count) * (value_count - 1))
+        return column_util.broadcast_to_column(hed_strings, unique_issues, row_codes)
+
+    def validate_many(self, hed_strings):
+        """Validates many HED strings with this validator. The issues are returned in columnar form instead of as a
+           list of dictionaries.
+
+         Parameters
+         ----------
+        hed_strings: iterable or HedFileInput object
+            An iterable of HED strings or a HedFileInput object. The row of an issue is the position of its HED string
+            in the iterable, or its row number in the file.
+         Returns
+         -------
+         IssueTable
+             The issues that were found. The issues are in the same order as the issues returned by
+             get_validation_issues() for the same input.
+
+         """
+        issue_table = IssueTable()
+        if isinstance(hed_strings, HedFileInput):
+            for row_number, row_hed_string, column_to_hed_tags_dictionary in hed_strings:
+                if row_hed_string:
+                    hed_string_delimiter = HedStringDelimiter(row_hed_string)
+                    self._add_level_issues_to_table(issue_table, hed_string_delimiter, row_number, NO_VALUE)
+                for column_number, column_hed_string in column_to_hed_tags_dictionary.items():
+                    self._add_hed_string_issues_to_table(issue_table, column_hed_string, row_number, column_number,
+                                                         validate_levels=False)
+        else:
+            for row_number, hed_string in enumerate(hed_strings):
+                self._add_hed_string_issues_to_table(issue_table, hed_string, row_number, NO_VALUE)
+        return issue_table
+
+    def _add_hed_string_issues_to_table(self, issue_table, hed_string, row, column, validate_levels=True):
+        """Validates a HED string and adds its issues to an issue table.
+
+         Parameters
+         ----------
+        issue_table: IssueTable
+            The table that the issues are added to.
+        hed_string: str
+            A HED string.
+        row: int
+            The row that the HED string is in.
+        column: int
+            The column that the HED string is in.
+        validate_levels: bool
+            True if the top-level tags and the tags at each level should be validated.
+         Returns
+         -------
+
+         """
+        string_span = (0, len(hed_string))
+        hed_string_scan = scan_hed_string(hed_string)
+        validation_issues = self._tag_validator.run_hed_string_validators(hed_string, hed_string_scan)
+        if validation_issues:
+            issue_table.add_issues(validation_issues, row, column, string_span)
+            return
+        hed_string_delimiter = HedStringDelimiter(hed_string, hed_string_scan)
+        if validate_levels:
+            self._add_level_issues_to_table(issue_table, hed_string_delimiter, row, column)
+        parse_tree = hed_string_delimiter.get_parse_tree()
+        previous_original_tag = ''
+        previous_formatted_tag = ''
+        for tag_index, tag in enumerate(parse_tree.tags):
+            validation_issues = \
+                self._tag_validator.run_individual_tag_validators(tag.original_tag, tag.formatted_tag,
+                                                                  previous_original_tag=previous_original_tag,
+                                                                  previous_formatted_tag=previous_formatted_tag)
+            issue_table.add_issues(validation_issues, row, column, tag.span, tag_index)
+            previous_original_tag = tag.original_tag
+            previous_formatted_tag = tag.formatted_tag
+        for tag_group in parse_tree.groups:
+            validation_issues = self._tag_validator.run_tag_group_validators(tag_group.original_tags, tag_group.text)
+            issue_table.add_issues(validation_issues, row, column, tag_group.span)
+
+    def _add_level_issues_to_table(self, issue_table, hed_string_delimiter, row, column):
+        """Validates the top-level tags and the tags at each level of a HED string and adds the issues to an issue
+           table.
+
+         Parameters
+         ----------
+        issue_table: IssueTable
+            The table that the issues are added to.
+        hed_string_delimiter: HedStringDelimiter
+            A HEDStringDelimiter object.
+        row: int
+            The row that the HED string is in.
+        column: int
+            The column that the HED string is in.
+         Returns
+         -------
+
+         """
+        parse_tree = hed_string_delimiter.get_parse_tree()
+        string_span = (0, len(parse_tree.hed_string))
+        top_level_tags = [tag.original_tag for tag in parse_tree.top_level_tags]
+        formatted_top_level_tags = [tag.formatted_tag for tag in parse_tree.top_level_tags]
+        validation_issues = self._tag_validator.run_top_level_validators(formatted_top_level_tags)
+        issue_table.add_issues(validation_issues, row, column, string_span)
+        for tag_group in parse_tree.groups:
+            validation_issues = self._tag_validator.run_tag_level_validators(tag_group.original_tags,
+                                                                             tag_group.formatted_tags)
+            issue_table.add_issues(validation_issues, row, column, tag_group.span)
+        validation_issues = self._tag_validator.run_tag_level_validators(top_level_tags, formatted_top_level_tags)
+        issue_table.add_issues(validation_issues, row, column, string_span)
+
     def _append_validation_issues_if_found(self, validation_issues, row_number, row_hed_string,
                                            column_to_hed_tags_dictionary):
         """Appends the issues associated with a particular row and/or column in a spreadsheet.
@@ -228,10 +749,11 @@ class HedValidator:
              The issues associated with a particular row column.
 
          """
+        hed_string_scan = scan_hed_string(column_hed_string)
         validation_issues = []
-        validation_issues += self._tag_validator.run_hed_string_validators(column_hed_string)
+        validation_issues += self._tag_validator.run_hed_string_validators(column_hed_string, hed_string_scan)
         if not validation_issues:
-            hed_string_delimiter = HedStringDelimiter(column_hed_string)
+            hed_string_delimiter = HedStringDelimiter(column_hed_string, hed_string_scan)
             validation_issues += self._validate_individual_tags_in_hed_string(hed_string_delimiter)
             validation_issues += self._validate_groups_in_hed_string(hed_string_delimiter)
         return validation_issues
@@ -252,9 +774,10 @@ class HedValidator:
         eeg_issues = []
         for i in range(0, len(hed_strings)):
             hed_string = hed_strings[i]
-            validation_issues = self._tag_validator.run_hed_string_validators(hed_string)
+            hed_string_scan = scan_hed_string(hed_string)
+            validation_issues = self._tag_validator.run_hed_string_validators(hed_string, hed_string_scan)
             if not validation_issues:
-                hed_string_delimiter = HedStringDelimiter(hed_string)
+                hed_string_delimiter = HedStringDelimiter(hed_string, hed_string_scan)
                 validation_issues += self._validate_top_level_in_hed_string(hed_string_delimiter)
                 validation_issues += self._validate_tag_levels_in_hed_string(hed_string_delimiter)
                 validation_issues += self._validate_individual_tags_in_hed_string(hed_string_delimiter)
@@ -277,13 +800,12 @@ class HedValidator:
 
          """
         validation_issues = []
-        tag_groups = hed_string_delimiter.get_tag_groups()
-        formatted_tag_groups = hed_string_delimiter.get_formatted_tag_groups()
-        original_and_formatted_tag_groups = zip(tag_groups, formatted_tag_groups)
-        for original_tag_group, formatted_tag_group in original_and_formatted_tag_groups:
-            validation_issues += self._tag_validator.run_tag_level_validators(original_tag_group, formatted_tag_group)
-        top_level_tags = hed_string_delimiter.get_top_level_tags()
-        formatted_top_level_tags = hed_string_delimiter.get_formatted_top_level_tags()
+        parse_tree = hed_string_delimiter.get_parse_tree()
+        for tag_group in parse_tree.groups:
+            validation_issues += self._tag_validator.run_tag_level_validators(tag_group.original_tags,
+                                                                              tag_group.formatted_tags)
+        top_level_tags = [tag.original_tag for tag in parse_tree.top_level_tags]
+        formatted_top_level_tags = [tag.formatted_tag for tag in parse_tree.top_level_tags]
         validation_issues += self._tag_validator.run_tag_level_validators(top_level_tags, formatted_top_level_tags)
         return validation_issues
 
@@ -301,7 +823,8 @@ class HedValidator:
 
          """
         validation_issues = []
-        formatted_top_level_tags = hed_string_delimiter.get_formatted_top_level_tags()
+        parse_tree = hed_string_delimiter.get_parse_tree()
+        formatted_top_level_tags = [tag.formatted_tag for tag in parse_tree.top_level_tags]
         validation_issues += self._tag_validator.run_top_level_validators(formatted_top_level_tags)
         return validation_issues
 
@@ -319,11 +842,9 @@ class HedValidator:
 
          """
         validation_issues = []
-        tag_groups = hed_string_delimiter.get_tag_groups()
-        tag_group_strings = hed_string_delimiter.get_tag_group_strings()
-        tag_groups_with_strings = zip(tag_groups, tag_group_strings)
-        for tag_group, tag_group_string in tag_groups_with_strings:
-            validation_issues += self._tag_validator.run_tag_group_validators(tag_group, tag_group_string)
+        parse_tree = hed_string_delimiter.get_parse_tree()
+        for tag_group in parse_tree.groups:
+            validation_issues += self._tag_validator.run_tag_group_validators(tag_group.original_tags, tag_group.text)
         return validation_issues
 
     def _validate_individual_tags_in_hed_string(self, hed_string_delimiter):
@@ -340,16 +861,15 @@ class HedValidator:
 
          """
         validation_issues = []
-        tag_set = hed_string_delimiter.get_tags()
-        formatted_tag_set = hed_string_delimiter.get_formatted_tags()
-        original_and_formatted_tags = list(zip(tag_set, formatted_tag_set))
-        for index, (original_tag, formatted_tag) in enumerate(original_and_formatted_tags):
-            previous_original_tag, previous_formatted_tag = HedValidator.get_previous_original_and_formatted_tag(
-                original_and_formatted_tags, index)
+        previous_original_tag = ''
+        previous_formatted_tag = ''
+        for tag in hed_string_delimiter.get_parse_tree().tags:
             validation_issues += \
-                self._tag_validator.run_individual_tag_validators(original_tag, formatted_tag,
+                self._tag_validator.run_individual_tag_validators(tag.original_tag, tag.formatted_tag,
                                                                   previous_original_tag=previous_original_tag,
                                                                   previous_formatted_tag=previous_formatted_tag)
+            previous_original_tag = tag.original_tag
+            previous_formatted_tag = tag.formatted_tag
         return validation_issues
 
     def get_printable_issue_string(self, title=''):
@@ -443,3 +963,54 @@ class HedValidator:
             row_number += 1
         column_number += 1
         return error_reporter.report_error_type('column', error_row=row_number, error_column=column_number)
+
+
+_worker_hed_validator = None
+
+
+def _initialize_worker(hed_dictionary, check_for_warnings, run_semantic_validation):
+    """Creates the HedValidator used by a worker process. This runs once in each worker process.
+
+    Parameters
+    ----------
+    hed_dictionary: HedDictionary
+        The HedDictionary used for semantic validation.
+    check_for_warnings: bool
+        True if the validator should check for warnings. False if the validator should only report errors.
+    run_semantic_validation: bool
+        True if the validator should check the HED data against a schema. False for syntax-only validation.
+
+    Returns
+    -------
+
+    """
+    global _worker_hed_validator
+    _worker_hed_validator = HedValidator(check_for_warnings=check_for_warnings,
+                                         run_semantic_validation=run_semantic_validation,
+                                         hed_dictionary=hed_dictionary)
+
+
+def _validate_rows_in_worker(rows):
+    """Validates a chunk of rows in a worker process.
+
+    Parameters
+    ----------
+    rows: list
+        A list of (row_number, row_hed_string, column_to_hed_tags_dictionary) tuples.
+
+    Returns
+    -------
+    tuple
+        A tuple containing the issues found in the rows, the number of errors, the number of warnings, and the number
+        of rows.
+
+    """
+    tag_validator = _worker_hed_validator.get_tag_validator()
+    error_count = tag_validator.get_error_count()
+    warning_count = tag_validator.get_warning_count()
+    validation_issues = []
+    for row_number, row_hed_string, column_to_hed_tags_dictionary in rows:
+        validation_issues = _worker_hed_validator._append_validation_issues_if_found(
+            validation_issues, row_number, row_hed_string, column_to_hed_tags_dictionary)
+    return validation_issues, tag_validator.get_error_count() - error_count, \
+        tag_validator.get_warning_count() - warning_count, len(rows)
@@ -0,0 +1,126 @@
+"""
+This module contains the IssueStore class which keeps the validation issues of spreadsheet rows in a SQLite database so
+that a file can be revalidated incrementally. A row is identified by a hash of the schema, the validator options, and
+the HED strings of the row, so a row whose HED strings are unchanged reuses its stored issues even if it has moved to
+another row number. The row and column issues that give the location of the issues are not stored and are generated
+again for the current row number.
+
+"""
+
+import json
+import sqlite3
+from hashlib import sha256
+
+ISSUE_STORE_FORMAT_VERSION = 1
+ROW_ISSUES_COLUMN = None
+
+
+class IssueStore:
+    def __init__(self, database_path):
+        """Constructor for the IssueStore class.
+
+        Parameters
+        ----------
+        database_path: str
+            The path to the SQLite database file. It is created if it does not exist. ':memory:' keeps the issues in
+            memory.
+
+        Returns
+        -------
+        IssueStore
+            An IssueStore object.
+
+        """
+        self.database_path = database_path
+        self._connection = sqlite3.connect(database_path)
+        self._connection.execute('CREATE TABLE IF NOT EXISTS row_issues (row_key TEXT PRIMARY KEY, '
+                                 'issues TEXT NOT NULL, error_count INTEGER NOT NULL, '
+                                 'warning_count INTEGER NOT NULL)')
+        self._connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._connection.execute('SELECT COUNT(*) FROM row_issues').fetchone()[0]
+
+    @staticmethod
+    def get_row_key(validator_key, row_hed_string, column_to_hed_tags_dictionary):
+        """Gets the key of a row.
+
+        Parameters
+        ----------
+        validator_key: str
+            A string identifying the schema and the validator options.
+        row_hed_string: str
+            The HED string of the row.
+        column_to_hed_tags_dictionary: dict
+            A dictionary which associates columns with HED tags.
+        Returns
+        -------
+        str
+            The key of the row.
+
+        """
+        row_content = json.dumps([ISSUE_STORE_FORMAT_VERSION, validator_key, row_hed_string,
+                                  sorted(column_to_hed_tags_dictionary.items())])
+        return sha256(row_content.encode('utf-8')).hexdigest()
+
+    def get_row_issues(self, row_key):
+        """Gets the stored issues of a row.
+
+        Parameters
+        ----------
+        row_key: str
+            The key of the row.
+        Returns
+        -------
+        tuple
+            A tuple containing the issues, the error count, and the warning count of the row. The issues are a list of
+            (column, issues) pairs where the column is ROW_ISSUES_COLUMN for the issues of the whole row. None if the
+            row is not stored.
+
+        """
+        stored_row = self._connection.execute('SELECT issues, error_count, warning_count FROM row_issues '
+                                              'WHERE row_key = ?', (row_key,)).fetchone()
+        if stored_row is None:
+            return None
+        issues, error_count, warning_count = stored_row
+        return [tuple(column_issues) for column_issues in json.loads(issues)], error_count, warning_count
+
+    def set_row_issues(self, row_key, row_issues, error_count, warning_count):
+        """Stores the issues of a row. The change is saved to the database by commit().
+
+        Parameters
+        ----------
+        row_key: str
+            The key of the row.
+        row_issues: list
+            A list of (column, issues) pairs.
+        error_count: int
+            The number of errors in the row.
+        warning_count: int
+            The number of warnings in the row.
+        Returns
+        -------
+
+        """
+        self._connection.execute('INSERT OR REPLACE INTO row_issues VALUES (?, ?, ?, ?)',
+                                 (row_key, json.dumps(row_issues), error_count, warning_count))
+
+    def commit(self):
+        """Saves the stored issues to the database."""
+        self._connection.commit()
+
+    def clear(self):
+        """Removes all stored issues."""
+        self._connection.execute('DELETE FROM row_issues')
+        self._connection.commit()
+
+    def close(self):
+        """Saves the stored issues and closes the database."""
+        self._connection.commit()
+        self._connection.close()
@@ -0,0 +1,206 @@
+"""
+This module contains the IssueTable class which holds validation issues in columnar form. Each issue is a position in
+a set of parallel arrays holding its code, row, column, span, and tag index. Issue codes and message texts are stored
+once in a pool and referenced by index, so issues that repeat across many rows share their text. The row and column
+messages are only rendered when the issues are converted to the list form returned by HedValidator.
+
+"""
+
+from array import array
+from collections import Counter
+from hed.validator import error_reporter
+
+NO_VALUE = -1
+ROW_ISSUE_CODE = 'row'
+COLUMN_ISSUE_CODE = 'column'
+
+
+class IssueTable:
+    def __init__(self):
+        """Constructor for the IssueTable class.
+
+        Returns
+        -------
+        IssueTable
+            An empty IssueTable object.
+
+        """
+        self.rows = array('l')
+        self.columns = array('l')
+        self.span_starts = array('l')
+        self.span_ends = array('l')
+        self.tag_indices = array('l')
+        self.code_ids = array('l')
+        self.message_ids = array('l')
+        self.code_names = []
+        self._code_name_ids = {}
+        self._messages = []
+        self._message_ids_by_text = {}
+
+    def __len__(self):
+        return len(self.code_ids)
+
+    def __iter__(self):
+        for issue_index in range(len(self)):
+            yield self.get_issue(issue_index)
+
+    @property
+    def codes(self):
+        """A list containing the code of each issue."""
+        return [self.code_names[code_id] for code_id in self.code_ids]
+
+    def add_issue(self, code, message, row, column=NO_VALUE, span_start=NO_VALUE, span_end=NO_VALUE,
+                  tag_index=NO_VALUE):
+        """Adds an issue to the table.
+
+        Parameters
+        ----------
+        code: str
+            The issue code.
+        message: str
+            The issue message.
+        row: int
+            The row or the index of the HED string the issue was found in.
+        column: int
+            The column the issue was found in. NO_VALUE if the issue does not belong to a column.
+        span_start: int
+            The index in the HED string where the text that caused the issue starts.
+        span_end: int
+            The index in the HED string where the text that caused the issue ends.
+        tag_index: int
+            The index of the tag that caused the issue in the tags of the HED string. NO_VALUE if the issue was not
+            caused by a single tag.
+        Returns
+        -------
+
+        """
+        code_id = self._code_name_ids.get(code)
+        if code_id is None:
+            code_id = len(self.code_names)
+            self._code_name_ids[code] = code_id
+            self.code_names.append(code)
+        message_id = self._message_ids_by_text.get(message)
+        if message_id is None:
+            message_id = len(self._messages)
+            self._message_ids_by_text[message] = message_id
+            self._messages.append(message)
+        self.code_ids.append(code_id)
+        self.message_ids.append(message_id)
+        self.rows.append(row)
+        self.columns.append(column)
+        self.span_starts.append(span_start)
+        self.span_ends.append(span_end)
+        self.tag_indices.append(tag_index)
+
+    def add_issues(self, issues, row, column=NO_VALUE, span=None, tag_index=NO_VALUE):
+        """Adds a list of issues returned by the validators to the table.
+
+        Parameters
+        ----------
+        issues: list
+            A list of dictionaries containing the code and message of each issue.
+        row: int
+            The row or the index of the HED string the issues were found in.
+        column: int
+            The column the issues were found in. NO_VALUE if the issues do not belong to a column.
+        span: tuple
+            A tuple containing the start and end index of the text that caused the issues. None if not known.
+        tag_index: int
+            The index of the tag that caused the issues in the tags of the HED string.
+        Returns
+        -------
+
+        """
+        span_start, span_end = span if span else (NO_VALUE, NO_VALUE)
+        for issue in issues:
+            self.add_issue(issue['code'], issue['message'], row, column, span_start, span_end, tag_index)
+
+    def get_code(self, issue_index):
+        """Gets the code of an issue.
+
+        Parameters
+        ----------
+        issue_index: int
+            The position of the issue in the table.
+        Returns
+        -------
+        str
+            The issue code.
+
+        """
+        return self.code_names[self.code_ids[issue_index]]
+
+    def get_message(self, issue_index):
+        """Gets the message of an issue.
+
+        Parameters
+        ----------
+        issue_index: int
+            The position of the issue in the table.
+        Returns
+        -------
+        str
+            The issue message.
+
+        """
+        return self._messages[self.message_ids[issue_index]]
+
+    def get_issue(self, issue_index):
+        """Gets an issue as a dictionary.
+
+        Parameters
+        ----------
+        issue_index: int
+            The position of the issue in the table.
+        Returns
+        -------
+        dict
+            A dictionary containing the code, message, row, column, span start, span end, and tag index of the issue.
+
+        """
+        return {'code': self.get_code(issue_index), 'message': self.get_message(issue_index),
+                'row': self.rows[issue_index], 'column': self.columns[issue_index],
+                'span_start': self.span_starts[issue_index], 'span_end': self.span_ends[issue_index],
+                'tag_index': self.tag_indices[issue_index]}
+
+    def get_code_counts(self):
+        """Counts the issues with each code.
+
+        Returns
+        -------
+        dict
+            A dictionary which associates issue codes with the number of issues that have them.
+
+        """
+        code_id_counts = Counter(self.code_ids)
+        return {self.code_names[code_id]: count for code_id, count in code_id_counts.items()}
+
+    def to_issue_list(self, has_headers=True):
+        """Converts the table to the list of issues returned by HedValidator for a file, with a row or column issue
+           before the issues of each row and column.
+
+        Parameters
+        ----------
+        has_headers: bool
+            If true, adjusts the row numbers in the row and column issues to account for one line header.
+        Returns
+        -------
+        list
+            A list of dictionaries containing the code and message of each issue.
+
+        """
+        validation_issues = []
+        current_location = None
+        for issue_index in range(len(self)):
+            row = self.rows[issue_index]
+            column = self.columns[issue_index]
+            if (row, column) != current_location:
+                current_location = (row, column)
+                error_row = row + 1 if has_headers else row
+                if column == NO_VALUE:
+                    validation_issues += error_reporter.report_error_type(ROW_ISSUE_CODE, error_row=error_row)
+                else:
+                    validation_issues += error_reporter.report_error_type(COLUMN_ISSUE_CODE, error_row=error_row,
+                                                                          error_column=column + 1)
+            validation_issues.append({'code': self.get_code(issue_index), 'message': self.get_message(issue_index)})
+        return validation_issues
@@ -5,12 +5,12 @@ This module is used to validate the HED tags as strings.
 
 import datetime
 import re
-import inflect
+from collections import OrderedDict
+from hed.util.hed_dictionary import find_prefixes
+from hed.util.hed_parse_tree import INVALID_CHARACTERS, scan_hed_string
+from hed.util.unit_matcher import get_unit_plural
 from hed.validator import warning_reporter, error_reporter
 
-pluralize = inflect.engine()
-pluralize.defnoun("hertz", "hertz")
-
 
 class TagValidator:
     CAMEL_CASE_EXPRESSION = r'([A-Z-]+\s*[a-z-]*)+'
@@ -24,7 +24,7 @@ class TagValidator:
     DIGIT_EXPRESSION = r'^-?[\d.]+(?:e-?\d+)?$'
     DUPLICATE_ERROR_TYPE = 'duplicateTag'
     EXTENSION_ALLOWED_ATTRIBUTE = 'extensionAllowed'
-    INVALID_CHARS = '[]{}'
+    INVALID_CHARS = INVALID_CHARACTERS
     PARENTHESES_ERROR_TYPE = 'parentheses'
     REQUIRE_CHILD_ERROR_TYPE = 'childRequired'
     REQUIRE_CHILD_TYPE = 'requireChild'
@@ -48,14 +48,18 @@ class TagValidator:
     TILDE = '~'
     SI_UNIT_MODIFIER_KEY = 'SIUnitModifier'
     SI_UNIT_SYMBOL_MODIFIER_KEY = 'SIUnitSymbolModifier'
+    DEFAULT_TAG_CACHE_SIZE = 10000
 
-    def __init__(self, hed_dictionary=None, check_for_warnings=False, run_semantic_validation=True):
+    def __init__(self, hed_dictionary=None, check_for_warnings=False, run_semantic_validation=True,
+                 tag_cache_size=DEFAULT_TAG_CACHE_SIZE):
         """Constructor for the Tag_Validator class.
 
         Parameters
         ----------
         hed_dictionary: HedDictionary
             A Hed_Dictionary object.
+        tag_cache_size: int
+            The maximum number of individual tag validation results to keep. 0 disables the cache.
 
         Returns
         -------
@@ -73,6 +77,10 @@ class TagValidator:
         self._error_count = 0
         self._warning_count = 0
         self._run_semantic_validation = run_semantic_validation
+        self._tag_cache = OrderedDict()
+        self._tag_cache_size = tag_cache_size
+        self._tag_cache_hits = 0
+        self._tag_cache_misses = 0
 
     def _increment_issue_count(self, is_error=True):
         """Increments the validation issue count
@@ -91,6 +99,23 @@ class TagValidator:
         else:
             self._warning_count += 1
 
+    def add_issue_counts(self, error_count, warning_count):
+        """Adds the issues counted by another validator, such as one running in a worker process.
+
+         Parameters
+         ----------
+         error_count: int
+            The number of errors to add.
+         warning_count: int
+            The number of warnings to add.
+         Returns
+         -------
+
+         """
+        self._issue_count += error_count + warning_count
+        self._error_count += error_count
+        self._warning_count += warning_count
+
     def get_issue_count(self):
         """Gets the issue count
 
@@ -130,9 +155,26 @@ class TagValidator:
          """
         return self._error_count
 
+    def get_tag_cache_info(self):
+        """Gets the hit and miss counters of the individual tag validation cache.
+
+         Parameters
+         ----------
+
+         Returns
+         -------
+         dict
+            A dictionary with the keys 'hits', 'misses', 'hit_rate', 'size', and 'max_size'.
+         """
+        lookups = self._tag_cache_hits + self._tag_cache_misses
+        hit_rate = self._tag_cache_hits / lookups if lookups else 0.0
+        return {'hits': self._tag_cache_hits, 'misses': self._tag_cache_misses, 'hit_rate': hit_rate,
+                'size': len(self._tag_cache), 'max_size': self._tag_cache_size}
+
     def run_individual_tag_validators(self, original_tag, formatted_tag, previous_original_tag='',
                                       previous_formatted_tag=''):
-        """Runs the validators on the individual tags in a HED string.
+        """Runs the validators on the individual tags in a HED string. The results are cached per tag. An invalid tag
+           is still checked against the previous tag every time because its error depends on the previous tag.
 
          Parameters
          ----------
@@ -150,16 +192,42 @@ class TagValidator:
              The validation issues associated with the top-level in the HED string.
 
          """
+        cache_key = (original_tag, formatted_tag, self._check_for_warnings)
+        cached_result = self._tag_cache.get(cache_key)
+        if cached_result is not None:
+            self._tag_cache.move_to_end(cache_key)
+            self._tag_cache_hits += 1
+            depends_on_previous_tag, cached_issues, error_count, warning_count = cached_result
+            validation_issues = []
+            if depends_on_previous_tag:
+                validation_issues += self.tag_exist_in_schema(original_tag, formatted_tag, previous_original_tag,
+                                                              previous_formatted_tag)
+            validation_issues += [dict(issue) for issue in cached_issues]
+            self.add_issue_counts(error_count, warning_count)
+            return validation_issues
+        self._tag_cache_misses += 1
+
         validation_issues = []
         if self._run_semantic_validation:
             validation_issues += self.tag_exist_in_schema(original_tag, formatted_tag, previous_original_tag,
                                                           previous_formatted_tag)
+        depends_on_previous_tag = bool(validation_issues)
+        tag_exist_issue_count = len(validation_issues)
+        error_count = self._error_count
+        warning_count = self._warning_count
+        if self._run_semantic_validation:
             validation_issues += self.check_if_tag_unit_class_units_are_valid(original_tag, formatted_tag)
             validation_issues += self.check_if_tag_requires_child(original_tag, formatted_tag)
             if self._check_for_warnings:
                 validation_issues += self.check_if_tag_unit_class_units_exist(original_tag, formatted_tag)
         if self._check_for_warnings:
             validation_issues += self.check_capitalization(original_tag, formatted_tag)
+        if self._tag_cache_size > 0:
+            cached_issues = [dict(issue) for issue in validation_issues[tag_exist_issue_count:]]
+            self._tag_cache[cache_key] = (depends_on_previous_tag, cached_issues, self._error_count - error_count,
+                                          self._warning_count - warning_count)
+            if len(self._tag_cache) > self._tag_cache_size:
+                self._tag_cache.popitem(last=False)
         return validation_issues
 
     def run_tag_group_validators(self, tag_group, tag_group_string):
@@ -181,7 +249,7 @@ class TagValidator:
         validation_issues += self.check_number_of_group_tildes(tag_group, tag_group_string)
         return validation_issues
 
-    def run_hed_string_validators(self, hed_string):
+    def run_hed_string_validators(self, hed_string, hed_string_scan=None):
         """Runs the validators on the HED string. If this is passed then all the other validators are run on the tags
            and groups in the HED string.
 
@@ -189,16 +257,20 @@ class TagValidator:
          ----------
          hed_string: str
             A HED string.
+         hed_string_scan: HedStringScan
+            The scan of the HED string. The HED string is scanned once here if not given.
          Returns
          -------
          list
              The validation issues associated with a HED string.
 
          """
+        if hed_string_scan is None:
+            hed_string_scan = scan_hed_string(hed_string)
         validation_issues = []
-        validation_issues += self.find_invalid_character_issues(hed_string)
-        validation_issues += self.count_tag_group_parentheses(hed_string)
-        validation_issues += self.find_delimiter_issues_in_hed_string(hed_string)
+        validation_issues += self.find_invalid_character_issues(hed_string, hed_string_scan)
+        validation_issues += self.count_tag_group_parentheses(hed_string, hed_string_scan)
+        validation_issues += self.find_delimiter_issues_in_hed_string(hed_string, hed_string_scan)
         return validation_issues
 
     def run_tag_level_validators(self, original_tag_list, formatted_tag_list):
@@ -332,12 +404,13 @@ class TagValidator:
             True if the tag has the 'extensionAllowed' attribute. False, if otherwise.
 
         """
-        tag_slash_indices = self.get_tag_slash_indices(formatted_tag)
-        for tag_slash_index in tag_slash_indices:
-            tag_substring = self.get_tag_substring_by_end_index(formatted_tag, tag_slash_index)
-            if self._hed_dictionary.tag_has_attribute(tag_substring,
-                                                      TagValidator.EXTENSION_ALLOWED_ATTRIBUTE):
-                return True
+        tag_records = self._hed_dictionary.tag_records
+        tag_slash_index = formatted_tag.rfind('/')
+        while tag_slash_index != -1:
+            tag_record = tag_records.get(formatted_tag[:tag_slash_index])
+            if tag_record is not None:
+                return tag_record.extension_allowed
+            tag_slash_index = formatted_tag.rfind('/', 0, tag_slash_index)
         return False
 
     def tag_takes_value(self, formatted_tag):
@@ -353,9 +426,8 @@ class TagValidator:
             True if the tag has the 'takesValue' attribute. False, if otherwise.
 
         """
-        takes_value_tag = self.replace_tag_name_with_pound(formatted_tag)
-        return self._hed_dictionary.tag_has_attribute(takes_value_tag,
-                                                      TagValidator.TAKES_VALUE_ATTRIBUTE)
+        parent_tag_record = self._get_parent_tag_record(formatted_tag)
+        return parent_tag_record is not None and parent_tag_record.takes_value_child
 
     def is_unit_class_tag(self, formatted_tag):
         """Checks to see if the tag has the 'unitClass' attribute.
@@ -370,11 +442,26 @@ class TagValidator:
             True if the tag has the 'unitClass' attribute. False, if otherwise.
 
         """
-        takes_value_tag = self.replace_tag_name_with_pound(formatted_tag)
-        if not self._hed_dictionary.has_unit_classes:
-            return False
-        return self._hed_dictionary.tag_has_attribute(takes_value_tag,
-                                                      TagValidator.UNIT_CLASS_ATTRIBUTE)
+        parent_tag_record = self._get_parent_tag_record(formatted_tag)
+        return parent_tag_record is not None and parent_tag_record.unit_classes is not None
+
+    def _get_parent_tag_record(self, formatted_tag):
+        """Gets the schema record of the parent of a tag. The record holds the attributes of the parent's '#' child.
+
+        Parameters
+        ----------
+        formatted_tag: str
+            The tag that is used to do the validation.
+        Returns
+        -------
+        TagRecord
+            The record of the tag's parent. None if the parent is not in the schema.
+
+        """
+        last_tag_slash_index = formatted_tag.rfind('/')
+        if last_tag_slash_index == -1:
+            return self._hed_dictionary.tag_records.get('')
+        return self._hed_dictionary.tag_records.get(formatted_tag[:last_tag_slash_index])
 
     def replace_tag_name_with_pound(self, formatted_tag):
         """Replaces the tag name with the pound sign.
@@ -411,11 +498,13 @@ class TagValidator:
 
         """
         validation_issues = []
-        if not self.tag_exists_in_schema(formatted_tag) and self.is_unit_class_tag(formatted_tag):
-            tag_unit_classes = self.get_tag_unit_classes(formatted_tag)
+        parent_tag_record = self._get_parent_tag_record(formatted_tag)
+        if parent_tag_record is not None and parent_tag_record.unit_classes is not None and \
+                not self.tag_exists_in_schema(formatted_tag):
+            tag_unit_classes = parent_tag_record.unit_classes
             formatted_tag_unit_value = self.get_tag_name(formatted_tag)
             original_tag_unit_value = self.get_tag_name(original_tag)
-            tag_unit_class_units = tuple(self.get_tag_unit_class_units(formatted_tag))
+            tag_unit_class_units = parent_tag_record.unit_class_units
             if (TagValidator.DATE_TIME_UNIT_CLASS in
                     self._hed_dictionary_dictionaries[self.UNITS_ELEMENT]):
                 if (TagValidator.DATE_TIME_UNIT_CLASS in tag_unit_classes
@@ -432,9 +521,8 @@ class TagValidator:
                         and TagValidator.is_clock_face_time(formatted_tag_unit_value)):
                     return validation_issues
             if re.search(TagValidator.DIGIT_EXPRESSION,
-                         self.validate_units(original_tag_unit_value,
-                                             formatted_tag_unit_value,
-                                             tag_unit_class_units)):
+                         parent_tag_record.unit_matcher.strip_units(original_tag_unit_value,
+                                                                    formatted_tag_unit_value)):
                 pass
             else:
                 validation_issues += error_reporter.report_error_type('unitClassInvalidUnit', tag=original_tag,
@@ -457,49 +545,9 @@ class TagValidator:
         derivative_units = [unit]
         if self._hed_dictionary.has_unit_modifiers and \
                 self._hed_dictionary_dictionaries[self.UNIT_SYMBOL_TYPE].get(unit) is None:
-            derivative_units.append(pluralize.plural(unit))
+            derivative_units.append(get_unit_plural(unit))
         return derivative_units
 
-    def _strip_off_units_if_valid(self, unit_value, unit, is_unit_symbol):
-        """Validates and strips units from a value.
-
-        Parameters
-        ----------
-        unit_value: str
-            The value to validate.
-        unit: str
-            The unit to strip.
-        is_unit_symbol: bool
-            Whether the unit is a symbol.
-        Returns
-        -------
-        tuple
-            The found unit and the stripped value.
-        """
-        found_unit = False
-        stripped_value = ''
-
-        if str(unit_value).startswith(unit):
-            found_unit = True
-            stripped_value = str(unit_value)[len(unit):].strip()
-        elif str(unit_value).endswith(unit):
-            found_unit = True
-            stripped_value = str(unit_value)[0:-len(unit)].strip()
-
-        if found_unit and self._hed_dictionary.has_unit_modifiers:
-            modifierKey = ''
-            if is_unit_symbol:
-                modifierKey = self.SI_UNIT_SYMBOL_MODIFIER_KEY
-            else:
-                modifierKey = self.SI_UNIT_MODIFIER_KEY
-
-            for unit_modifier in self._hed_dictionary_dictionaries[modifierKey]:
-                if stripped_value.startswith(unit_modifier):
-                    stripped_value = stripped_value[len(unit_modifier):].strip()
-                elif stripped_value.endswith(unit_modifier):
-                    stripped_value = stripped_value[0:-len(unit_modifier)].strip()
-        return found_unit, stripped_value
-
     def validate_units(self, original_tag_unit_value, formatted_tag_unit_value, tag_unit_class_units):
         """Checks to see if the specified string has a valid unit, and removes it if so.
 
@@ -518,23 +566,8 @@ class TagValidator:
             Otherwise, returns tag_unit_values
 
         """
-        tag_unit_class_units = sorted(tag_unit_class_units, key=len, reverse=True)
-        for unit in tag_unit_class_units:
-            derivative_units = self.get_valid_unit_plural(unit)
-            for derivative_unit in derivative_units:
-                if self._hed_dictionary.has_unit_modifiers and \
-                        self._hed_dictionary_dictionaries[self.UNIT_SYMBOL_TYPE].get(unit):
-                    found_unit, stripped_value = self._strip_off_units_if_valid(original_tag_unit_value,
-                                                                                derivative_unit,
-                                                                                True)
-                else:
-                    found_unit, stripped_value = self._strip_off_units_if_valid(formatted_tag_unit_value,
-                                                                                derivative_unit,
-                                                                                False)
-                if found_unit:
-                    return stripped_value
-
-        return formatted_tag_unit_value
+        unit_matcher = self._hed_dictionary.get_unit_matcher(tag_unit_class_units)
+        return unit_matcher.strip_units(original_tag_unit_value, formatted_tag_unit_value)
 
     def check_if_tag_unit_class_units_exist(self, original_tag, formatted_tag):
         """Reports a validation warning if the tag provided has a unit class but no units are not specified.
@@ -574,11 +607,7 @@ class TagValidator:
             The tag name.
 
         """
-        tag_name = tag
-        tag_slash_indices = self.get_tag_slash_indices(tag)
-        if tag_slash_indices:
-            tag_name = tag[tag_slash_indices[-1] + 1:]
-        return tag_name
+        return tag[tag.rfind('/') + 1:]
 
     def get_tag_unit_classes(self, formatted_tag):
         """Gets the unit classes associated with a particular tag.
@@ -594,12 +623,10 @@ class TagValidator:
             the tag doesn't have unit classes associated with it.
 
         """
-        unit_classes = []
-        unit_class_tag = self.replace_tag_name_with_pound(formatted_tag)
-        if self.is_unit_class_tag(formatted_tag):
-            unit_classes = self._hed_dictionary_dictionaries[TagValidator.UNIT_CLASS_ATTRIBUTE][unit_class_tag]
-            unit_classes = unit_classes.split(',')
-        return unit_classes
+        parent_tag_record = self._get_parent_tag_record(formatted_tag)
+        if parent_tag_record is None or parent_tag_record.unit_classes is None:
+            return []
+        return list(parent_tag_record.unit_classes)
 
     def get_tag_unit_class_units(self, formatted_tag):
         """Gets the unit class units associated with a particular tag.
@@ -615,18 +642,10 @@ class TagValidator:
             the tag doesn't have unit class units associated with it.
 
         """
-        units = []
-        unit_class_tag = self.replace_tag_name_with_pound(formatted_tag)
-        if self.is_unit_class_tag(formatted_tag):
-            unit_classes = self._hed_dictionary_dictionaries[TagValidator.UNIT_CLASS_ATTRIBUTE][unit_class_tag]
-            unit_classes = unit_classes.split(',')
-
-            for unit_class in unit_classes:
-                try:
-                    units += (self._hed_dictionary_dictionaries[TagValidator.UNIT_CLASS_UNITS_ELEMENT][unit_class])
-                except Exception:
-                    continue
-        return units
+        parent_tag_record = self._get_parent_tag_record(formatted_tag)
+        if parent_tag_record is None or parent_tag_record.unit_classes is None:
+            return []
+        return list(parent_tag_record.unit_class_units)
 
     def get_unit_class_default_unit(self, formatted_tag):
         """Gets the default unit class unit that is associated with the specified tag.
@@ -642,20 +661,10 @@ class TagValidator:
             empty string is returned.
 
         """
-        default_unit = ''
-        unit_class_tag = self.replace_tag_name_with_pound(formatted_tag)
-        if self.is_unit_class_tag(formatted_tag):
-            has_default_attribute = self._hed_dictionary.tag_has_attribute(unit_class_tag,
-                                                                           TagValidator.DEFAULT_UNIT_ATTRIBUTE)
-            if has_default_attribute:
-                default_unit = self._hed_dictionary_dictionaries[TagValidator.DEFAULT_UNIT_ATTRIBUTE][unit_class_tag]
-            elif unit_class_tag in self._hed_dictionary_dictionaries[TagValidator.UNIT_CLASS_ATTRIBUTE]:
-                unit_classes = \
-                    self._hed_dictionary_dictionaries[TagValidator.UNIT_CLASS_ATTRIBUTE][unit_class_tag].split(',')
-                first_unit_class = unit_classes[0]
-                default_unit = self._hed_dictionary_dictionaries[TagValidator.DEFAULT_UNITS_FOR_TYPE_ATTRIBUTE][
-                    first_unit_class]
-        return default_unit
+        parent_tag_record = self._get_parent_tag_record(formatted_tag)
+        if parent_tag_record is None:
+            return ''
+        return parent_tag_record.default_unit
 
     def check_number_of_group_tildes(self, tag_group, tag_group_string):
         """Reports a validation error if the tag group has too many tildes.
@@ -714,11 +723,13 @@ class TagValidator:
 
         """
         validation_issues = []
+        required_prefix_trie = self._hed_dictionary.required_prefix_trie
+        present_tag_prefixes = set()
+        for formatted_tag in formatted_top_level_tags:
+            present_tag_prefixes.update(find_prefixes(required_prefix_trie, formatted_tag))
         required_tag_prefixes = self._hed_dictionary_dictionaries[TagValidator.REQUIRED_PREFIX_TYPE]
-        for required_tag_prefix in required_tag_prefixes:
-            capitalized_required_tag_prefix = \
-                self._hed_dictionary_dictionaries[TagValidator.REQUIRED_PREFIX_TYPE][required_tag_prefix]
-            if sum([x.startswith(required_tag_prefix) for x in formatted_top_level_tags]) < 1:
+        for required_tag_prefix, capitalized_required_tag_prefix in required_tag_prefixes.items():
+            if required_tag_prefix not in present_tag_prefixes:
                 validation_issues += warning_reporter.report_warning_type(TagValidator.REQUIRED_ERROR_TYPE,
                                                                           tag_prefix=capitalized_required_tag_prefix)
                 self._increment_issue_count(is_error=False)
@@ -740,13 +751,16 @@ class TagValidator:
 
         """
         validation_issues = []
+        unique_prefix_trie = self._hed_dictionary.unique_prefix_trie
+        unique_tag_prefix_counts = {}
+        for formatted_tag in formatted_tag_list:
+            for unique_tag_prefix in find_prefixes(unique_prefix_trie, formatted_tag):
+                unique_tag_prefix_counts[unique_tag_prefix] = unique_tag_prefix_counts.get(unique_tag_prefix, 0) + 1
         unique_tag_prefixes = self._hed_dictionary_dictionaries[TagValidator.UNIQUE_TAG_TYPE]
-        for unique_tag_prefix in unique_tag_prefixes:
-            unique_tag_prefix_bool_mask = [x.startswith(unique_tag_prefix) for x in formatted_tag_list]
-            if sum(unique_tag_prefix_bool_mask) > 1:
-                validation_issues += error_reporter.report_error_type(
-                    TagValidator.UNIQUE_ERROR_TYPE,
-                    tag_prefix=self._hed_dictionary_dictionaries[TagValidator.UNIQUE_TAG_TYPE][unique_tag_prefix])
+        for unique_tag_prefix, capitalized_unique_tag_prefix in unique_tag_prefixes.items():
+            if unique_tag_prefix_counts.get(unique_tag_prefix, 0) > 1:
+                validation_issues += error_reporter.report_error_type(TagValidator.UNIQUE_ERROR_TYPE,
+                                                                      tag_prefix=capitalized_unique_tag_prefix)
                 self._increment_issue_count()
         return validation_issues
 
@@ -763,14 +777,11 @@ class TagValidator:
             True if the tag starts with a unique prefix. False if otherwise.
 
         """
-        unique_tag_prefixes = self._hed_dictionary_dictionaries[TagValidator.UNIQUE_TAG_TYPE]
-        for unique_tag_prefix in unique_tag_prefixes:
-            if tag.lower().startswith(unique_tag_prefix):
-                return True
-        return False
+        return bool(find_prefixes(self._hed_dictionary.unique_prefix_trie, tag.lower()))
 
     def check_if_duplicate_tags_exist(self, original_tag_list, formatted_tag_list):
-        """Reports a validation error if two or more tags are the same.
+        """Reports a validation error if two or more tags are the same. The copies of a tag are paired up in order, and
+           one error is reported for each pair at the first tag of the pair.
 
         Parameters
         ----------
@@ -785,20 +796,19 @@ class TagValidator:
 
         """
         validation_issues = []
-        duplicate_indices = set([])
+        tag_counts = {}
+        for tag in formatted_tag_list:
+            tag_counts[tag] = tag_counts.get(tag, 0) + 1
+        tags_seen = {}
         for tag_index, tag in enumerate(formatted_tag_list):
-            all_indices = range(len(formatted_tag_list))
-            for duplicate_index in all_indices:
-                if tag_index == duplicate_index:
-                    continue
-                if formatted_tag_list[tag_index] != TagValidator.TILDE and \
-                        formatted_tag_list[tag_index] == formatted_tag_list[duplicate_index] and \
-                        tag_index not in duplicate_indices and duplicate_index not in duplicate_indices:
-                    duplicate_indices.add(tag_index)
-                    duplicate_indices.add(duplicate_index)
-                    validation_issues += error_reporter.report_error_type(TagValidator.DUPLICATE_ERROR_TYPE,
-                                                                          tag=original_tag_list[tag_index])
-                    self._increment_issue_count()
+            if tag_counts[tag] < 2 or tag == TagValidator.TILDE:
+                continue
+            times_seen = tags_seen.get(tag, 0)
+            tags_seen[tag] = times_seen + 1
+            if times_seen % 2 == 0 and times_seen + 1 < tag_counts[tag]:
+                validation_issues += error_reporter.report_error_type(TagValidator.DUPLICATE_ERROR_TYPE,
+                                                                      tag=original_tag_list[tag_index])
+                self._increment_issue_count()
         return validation_issues
 
     def get_tag_slash_indices(self, tag, slash='/'):
@@ -837,78 +847,28 @@ class TagValidator:
             return tag[:end_index]
         return tag
 
-    def find_delimiter_issues_in_hed_string(self, hed_string):
+    def find_delimiter_issues_in_hed_string(self, hed_string, hed_string_scan=None):
         """Reports a validation error if there are missing commas or commas in tags that take values.
 
         Parameters
         ----------
         hed_string: str
             A hed string.
+        hed_string_scan: HedStringScan
+            The scan of the HED string. The HED string is scanned if not given.
         Returns
         -------
         list
             A validation issues list. If no issues are found then an empty list is returned.
 
         """
-        last_non_empty_valid_character = ''
-        last_non_empty_valid_index = 0
-        current_tag = ''
+        if hed_string_scan is None:
+            hed_string_scan = scan_hed_string(hed_string)
         issues = []
-
-        for i in range(len(hed_string)):
-            current_character = hed_string[i]
-            current_tag += current_character
-            if not current_character.strip():
-                continue
-            if TagValidator.character_is_delimiter(current_character):
-                if current_tag.strip() == current_character:
-                    issues += error_reporter.report_error_type('extraDelimiter',
-                                                               character=current_character,
-                                                               index=i,
-                                                               hed_string=hed_string)
-                    current_tag = ''
-                    continue
-                current_tag = ''
-            elif current_character == self.OPENING_GROUP_CHARACTER:
-                if current_tag.strip() == self.OPENING_GROUP_CHARACTER:
-                    current_tag = ''
-                else:
-                    issues += error_reporter.report_error_type('invalidTag', tag=current_tag)
-            elif TagValidator.comma_is_missing_after_closing_parentheses(last_non_empty_valid_character,
-                                                                         current_character):
-                issues += error_reporter.report_error_type('commaMissing', tag=current_tag[:-1])
-                break
-            last_non_empty_valid_character = current_character
-            last_non_empty_valid_index = i
-        if TagValidator.character_is_delimiter(last_non_empty_valid_character):
-            issues += error_reporter.report_error_type('extraDelimiter',
-                                                       character=last_non_empty_valid_character,
-                                                       index=last_non_empty_valid_index,
-                                                       hed_string=hed_string)
+        for error_type, issue_arguments in hed_string_scan.delimiter_issues:
+            issues += error_reporter.report_error_type(error_type, **issue_arguments)
         return issues
 
-    def skip_iterations(self, iterator, start, end):
-        """Skips a number of iterations based on the start and end index.
-
-        Parameters
-        ----------
-        iterator: iterator
-            A iterator object.
-        start: int
-            The start position in the iterator to start skipping.
-        end: int
-            The end position in the iterator to stop skipping.
-        Returns
-        -------
-        iterator
-            An iterator with the iterations skipped.
-
-        """
-        iterations_to_skip = end - start
-        for iteration in range(iterations_to_skip):
-            next(iterator, None)
-        return iterator
-
     @staticmethod
     def report_invalid_character_error(character, index, hed_string):
         """Reports a error that is related to an invalid character.
@@ -930,66 +890,31 @@ class TagValidator:
         return error_reporter.report_error_type(TagValidator.CHARACTER_ERROR_TYPE, character=character, index=index,
                                                 hed_string=hed_string)
 
-    @staticmethod
-    def comma_is_missing_after_closing_parentheses(last_non_empty_character, current_character):
-        """Checks to see if a comma is missing after a closing parentheses in a HED string. This is a helper function for
-           the find_missing_commas_in_hed_string function.
-
-        Parameters
-        ----------
-        last_non_empty_character: str
-            The last non-empty string in the HED string.
-        current_character: str
-            The current character in the HED string.
-        Returns
-        -------
-        bool
-            True if a comma is missing after a closing parentheses. False, if otherwise.
-
-        """
-        return last_non_empty_character == TagValidator.CLOSING_GROUP_CHARACTER and not \
-            TagValidator.character_is_delimiter(current_character)
-
-    @staticmethod
-    def character_is_delimiter(character):
-        """Checks to see if the character is a delimiter. A delimiter is a commma or a tilde.
-
-        Parameters
-        ----------
-        character: str
-            A string character.
-        Returns
-        -------
-        bool
-            Returns true if the character is a delimiter. False, if otherwise. A delimiter is a comma or a tilde.
-
-        """
-        if character == TagValidator.COMMA or character == TagValidator.TILDE:
-            return True
-        return False
-
-    def find_invalid_character_issues(self, hed_string):
+    def find_invalid_character_issues(self, hed_string, hed_string_scan=None):
         """Reports an error if it finds any invalid characters as defined by TagValidator.INVALID_CHARS
 
         Parameters
         ----------
         hed_string: str
             A hed string.
+        hed_string_scan: HedStringScan
+            The scan of the HED string. The HED string is scanned if not given.
         Returns
         -------
         list
             A validation issues list. If no issues are found then an empty list is returned.
 
         """
+        if hed_string_scan is None:
+            hed_string_scan = scan_hed_string(hed_string)
         validation_issues = []
-        for index, character in enumerate(hed_string):
-            if character in TagValidator.INVALID_CHARS:
-                validation_issues += TagValidator.report_invalid_character_error(character, index, hed_string)
-                self._increment_issue_count()
+        for character, index in hed_string_scan.invalid_characters:
+            validation_issues += TagValidator.report_invalid_character_error(character, index, hed_string)
+            self._increment_issue_count()
 
         return validation_issues
 
-    def count_tag_group_parentheses(self, hed_string):
+    def count_tag_group_parentheses(self, hed_string, hed_string_scan=None):
         """Reports a validation error if there are an unequal number of opening or closing parentheses. This is the
          first check before the tags are parsed.
 
@@ -997,6 +922,8 @@ class TagValidator:
         ----------
         hed_string: str
             A hed string.
+        hed_string_scan: HedStringScan
+            The scan of the HED string. The parentheses are counted in the HED string if not given.
         Returns
         -------
         list
@@ -1004,8 +931,12 @@ class TagValidator:
 
         """
         validation_issues = []
-        number_of_opening_parentheses = hed_string.count('(')
-        number_of_closing_parentheses = hed_string.count(')')
+        if hed_string_scan is None:
+            number_of_opening_parentheses = hed_string.count('(')
+            number_of_closing_parentheses = hed_string.count(')')
+        else:
+            number_of_opening_parentheses = hed_string_scan.opening_parentheses_count
+            number_of_closing_parentheses = hed_string_scan.closing_parentheses_count
         if number_of_opening_parentheses != number_of_closing_parentheses:
             validation_issues += error_reporter.report_error_type(TagValidator.PARENTHESES_ERROR_TYPE,
                                                                   opening_parentheses_count=number_of_opening_parentheses,
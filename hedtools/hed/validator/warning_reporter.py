@@ -3,6 +3,13 @@ This module is used to report warnings found in the validation.
 
 """
 
+WARNING_MESSAGES = {
+    'capitalization': '\tWARNING: First word not capitalized or camel case - "%(tag)s"\n',
+    'requiredPrefixMissing': '\tWARNING: Tag with prefix "%(tag_prefix)s" is required\n',
+    'unitClassDefaultUsed': '\tWARNING: No unit specified. Using "%(default_unit)s" as the default - "%(tag)s"\n'
+}
+DEFAULT_WARNING_MESSAGE = 'WARNING: Unknown warning'
+
 
 def report_warning_type(warning_type, tag='', default_unit='', tag_prefix=''):
     """Reports the abc warning based on the type of warning.
@@ -24,13 +31,11 @@ def report_warning_type(warning_type, tag='', default_unit='', tag_prefix=''):
         of warning.
 
     """
-    warning_types = {
-        'capitalization': '\tWARNING: First word not capitalized or camel case - "%s"\n' % tag,
-        'requiredPrefixMissing': '\tWARNING: Tag with prefix "%s" is required\n' % tag_prefix,
-        'unitClassDefaultUsed': '\tWARNING: No unit specified. Using "%s" as the default - "%s"\n' % (default_unit, tag)
-    }
-    default_warning_message = 'WARNING: Unknown warning'
-    warning_message = warning_types.get(warning_type, default_warning_message)
+    warning_template = WARNING_MESSAGES.get(warning_type)
+    if warning_template is None:
+        warning_message = DEFAULT_WARNING_MESSAGE
+    else:
+        warning_message = warning_template % {'tag': tag, 'default_unit': default_unit, 'tag_prefix': tag_prefix}
 
     warning_object = {'code': warning_type, 'message': warning_message}
     return [warning_object]
@@ -20,5 +20,8 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     python_requires='>=3.7',
+    entry_points={
+        'console_scripts': ['hed-validate=hed.tools.bulk_validate:main'],
+    },
 )
 
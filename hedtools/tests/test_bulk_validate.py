@@ -0,0 +1,97 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from hed.tools import bulk_validate
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.hed_xml_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data/HED7.1.1.xml')
+
+    def setUp(self):
+        self.dataset_directory = tempfile.mkdtemp()
+        self.output_directory = os.path.join(self.dataset_directory, 'derivatives')
+        self.valid_file = self._write_events_file('sub-01/sub-01_events.tsv', 'Event/Category/Experimental stimulus')
+        self.invalid_file = self._write_events_file('sub-02/sub-02_events.tsv', 'This/Is/Not/A/Valid/Tag')
+
+    def tearDown(self):
+        shutil.rmtree(self.dataset_directory)
+
+    def _write_events_file(self, relative_path, hed_string):
+        events_file = os.path.join(self.dataset_directory, relative_path)
+        os.makedirs(os.path.dirname(events_file), exist_ok=True)
+        with open(events_file, 'w', encoding='utf-8') as opened_file:
+            opened_file.write('onset\tduration\tHED\n')
+            opened_file.write('1.0\t0\t%s\n' % hed_string)
+        return events_file
+
+    def _run(self, *arguments):
+        return bulk_validate.main([self.dataset_directory, '--hed-xml', self.hed_xml_file, '--tag-column-names',
+                                   'HED', '--output-dir', self.output_directory] + list(arguments))
+
+    def _read_summary(self):
+        with open(os.path.join(self.output_directory, bulk_validate.SUMMARY_FILENAME), 'r') as opened_file:
+            return json.load(opened_file)
+
+    def test_find_input_files(self):
+        self.assertEqual(bulk_validate.find_input_files([self.dataset_directory]),
+                         [self.valid_file, self.invalid_file])
+        self.assertEqual(bulk_validate.find_input_files([os.path.join(self.dataset_directory, 'sub-02', '*.tsv')]),
+                         [self.invalid_file])
+
+    def test_validate_files(self):
+        for workers in ['1', '2']:
+            self.assertEqual(self._run('--workers', workers), 1)
+            summary = self._read_summary()
+            self.assertEqual(summary['totals']['validated'], 2)
+            self.assertEqual(summary['totals']['errors'], 1)
+            invalid_entry = summary['files'][os.path.join('sub-02', 'sub-02_events.tsv')]
+            with open(invalid_entry['output_file'], 'r', encoding='utf-8') as opened_file:
+                self.assertIn('This/Is/Not/A/Valid/Tag', opened_file.read())
+            self.assertNotIn('output_file', summary['files'][os.path.join('sub-01', 'sub-01_events.tsv')])
+
+    def test_delimiter_errors(self):
+        self._write_events_file('sub-01/sub-01_events.tsv', 'Event/Label/Y,,Event/Description/Z')
+        os.remove(self.invalid_file)
+        self.assertEqual(self._run('--workers', '1'), 1)
+        entry, = self._read_summary()['files'].values()
+        self.assertEqual((entry['errors'], entry['warnings'], entry['issues']), (1, 0, 1))
+        with open(entry['output_file'], 'r', encoding='utf-8') as opened_file:
+            self.assertIn('Extra delimiter', opened_file.read())
+
+    def test_resume(self):
+        self._run('--workers', '1')
+        self._write_events_file('sub-02/sub-02_events.tsv', 'Event/Category/Experimental stimulus')
+        self.assertEqual(self._run('--workers', '1', '--resume'), 0)
+        totals = self._read_summary()['totals']
+        self.assertEqual((totals['validated'], totals['skipped'], totals['errors']), (1, 1, 0))
+        self.assertFalse(os.path.exists(os.path.join(self.output_directory, 'sub-02',
+                                                     'sub-02_events.tsv' + bulk_validate.ISSUES_FILE_SUFFIX)))
+
+    def test_resume_after_schema_edit(self):
+        hed_xml_file = os.path.join(self.dataset_directory, 'HED.xml')
+        shutil.copyfile(self.hed_xml_file, hed_xml_file)
+        arguments = ['--hed-xml', hed_xml_file, '--workers', '1']
+        self._run(*arguments)
+        self._run(*arguments, '--resume')
+        self.assertEqual(self._read_summary()['totals']['skipped'], 2)
+        with open(hed_xml_file, 'a') as opened_file:
+            opened_file.write('\n')
+        self._run(*arguments, '--resume')
+        totals = self._read_summary()['totals']
+        self.assertEqual((totals['validated'], totals['skipped']), (2, 0))
+
+    def test_find_dataset_hed_version(self):
+        with open(os.path.join(self.dataset_directory, bulk_validate.DATASET_DESCRIPTION_FILENAME), 'w') as opened_file:
+            json.dump({'Name': 'Test', bulk_validate.HED_VERSION_FIELD: 'HED7.1.1'}, opened_file)
+        version_cache = {}
+        self.assertEqual(bulk_validate.find_dataset_hed_version(self.valid_file, version_cache), '7.1.1')
+        self.assertEqual(version_cache[os.path.dirname(self.valid_file)], '7.1.1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,21 @@
+import unittest
+
+from hed.util import column_util
+
+
+class Test(unittest.TestCase):
+    def test_factorize_column(self):
+        unique_values, row_codes, value_counts = column_util.factorize_column(['Event', 'Item', 'Event', None, 'Event'])
+        self.assertEqual(unique_values, ['Event', 'Item', None])
+        self.assertEqual(row_codes, [0, 1, 0, 2, 0])
+        self.assertEqual(value_counts, [3, 1, 1])
+
+    def test_broadcast_to_column(self):
+        column = ('Event', 'Item', 'Event')
+        unique_values, row_codes, _ = column_util.factorize_column(column)
+        row_results = column_util.broadcast_to_column(column, [value.upper() for value in unique_values], row_codes)
+        self.assertEqual(row_results, ['EVENT', 'ITEM', 'EVENT'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,17 @@
 import unittest
+import io
+import json
 import os
+import pathlib
+import shutil
+import tarfile
+import tempfile
+from unittest import mock
+
+import portalocker
 
 from hed.util import hed_cache
+from hed.util import schema_snapshot
 
 
 class Test(unittest.TestCase):
@@ -72,5 +82,173 @@ class Test(unittest.TestCase):
         self.assertIsInstance(cached_versions, list)
         self.assertTrue(len(cached_versions) > 0)
 
+
+class TestLocalCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.hed_base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+        cls.hed_versions = ['7.1.1', '7.0.4']
+
+    def setUp(self):
+        self.temp_directory = tempfile.mkdtemp()
+        self.source_dir = os.path.join(self.temp_directory, 'hedxml')
+        self.cache_dir = os.path.join(self.temp_directory, 'cache')
+        os.makedirs(self.source_dir)
+        for hed_version in self.hed_versions:
+            shutil.copy(os.path.join(self.hed_base_dir, f'HED{hed_version}.xml'), self.source_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_directory)
+
+    def test_cache_from_directory(self):
+        cached_versions = hed_cache.cache_all_hed_xml_versions(self.source_dir, self.cache_dir)
+        self.assertEqual(list(cached_versions), self.hed_versions)
+        self.assertEqual(hed_cache.get_all_hed_versions(self.cache_dir), self.hed_versions)
+        version_index = hed_cache.get_version_index(self.cache_dir)
+        self.assertEqual(list(version_index), self.hed_versions)
+        for hed_version, sha_hash in version_index.items():
+            cached_file = hed_cache.get_path_from_hed_version(hed_version, self.cache_dir)
+            self.assertEqual(cached_versions[hed_version], cached_file)
+            self.assertEqual(hed_cache._calculate_sha1(cached_file), sha_hash)
+            self.assertTrue(os.path.exists(hed_cache._get_blob_filename(sha_hash, self.cache_dir)))
+        self.assertIsNone(hed_cache.cache_all_hed_xml_versions(self.source_dir, self.cache_dir))
+
+    def test_cache_from_file_url_listing(self):
+        listing = hed_cache._list_hed_xml_directory(self.source_dir)
+        listing[0]['sha'] = '0' * 40
+        listing_file = os.path.join(self.temp_directory, 'listing.json')
+        with open(listing_file, 'w') as f:
+            json.dump(listing, f)
+        cached_versions = hed_cache.cache_all_hed_xml_versions(pathlib.Path(listing_file).as_uri(), self.cache_dir)
+        self.assertIsNone(cached_versions[self.hed_versions[1]])
+        self.assertTrue(cached_versions[self.hed_versions[0]])
+        self.assertEqual(list(hed_cache.get_version_index(self.cache_dir)), [self.hed_versions[0]])
+
+    def test_repair_installed_file(self):
+        hed_cache.cache_all_hed_xml_versions(self.source_dir, self.cache_dir)
+        cached_file = hed_cache.get_path_from_hed_version(self.hed_versions[0], self.cache_dir)
+        with open(cached_file, 'w') as f:
+            f.write('<HED')
+        shutil.rmtree(self.source_dir)
+        hed_versions = {hed_version: (sha_hash, 'file:///missing.xml')
+                        for hed_version, sha_hash in hed_cache.get_version_index(self.cache_dir).items()}
+        self.assertEqual(hed_cache._cache_hed_version(self.hed_versions[0], hed_versions[self.hed_versions[0]],
+                                                      self.cache_dir), cached_file)
+        self.assertEqual(hed_cache._calculate_sha1(cached_file), hed_versions[self.hed_versions[0]][0])
+
+    def test_writer_lease(self):
+        os.makedirs(self.cache_dir)
+        with hed_cache._cache_writer_lease(self.cache_dir):
+            self.assertIsNone(hed_cache.cache_all_hed_xml_versions(self.source_dir, self.cache_dir, lock_timeout=0.1))
+            self.assertEqual(hed_cache.get_all_hed_versions(self.cache_dir), [])
+        with self.assertRaises(portalocker.exceptions.LockException):
+            with hed_cache._cache_writer_lease(self.cache_dir):
+                with hed_cache._cache_writer_lease(self.cache_dir, lock_timeout=0.1):
+                    pass
+
+    def test_cache_specific_file_url(self):
+        hed_xml_url = pathlib.Path(os.path.join(self.source_dir, 'HED7.1.1.xml')).as_uri()
+        cached_file = hed_cache.cache_specific_url(hed_xml_url, cache_folder=self.cache_dir)
+        self.assertEqual(cached_file, os.path.join(self.cache_dir, 'HED7.1.1.xml'))
+        self.assertEqual(list(hed_cache.get_version_index(self.cache_dir)), ['7.1.1'])
+
+    def test_cache_specific_file_url_waits_for_lease(self):
+        hed_xml_url = pathlib.Path(os.path.join(self.source_dir, 'HED7.1.1.xml')).as_uri()
+        os.makedirs(self.cache_dir)
+        with hed_cache._cache_writer_lease(self.cache_dir):
+            with self.assertRaises(portalocker.exceptions.LockException):
+                hed_cache.cache_specific_url(hed_xml_url, cache_folder=self.cache_dir, lock_timeout=0.1)
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, 'HED7.1.1.xml')))
+
+    def test_bundle_round_trip(self):
+        hed_cache.cache_all_hed_xml_versions(self.source_dir, self.cache_dir)
+        bundle_file = os.path.join(self.temp_directory, 'hed_cache.tar.gz')
+        self.assertEqual(hed_cache.export_cache_bundle(bundle_file, self.cache_dir), self.hed_versions)
+        with tarfile.open(bundle_file, 'r:gz') as bundle:
+            self.assertEqual(bundle.getnames()[0], hed_cache.BUNDLE_MANIFEST_FILENAME)
+        import_dir = os.path.join(self.temp_directory, 'imported')
+        self.assertEqual(hed_cache.import_cache_bundle(bundle_file, import_dir), self.hed_versions)
+        self.assertEqual(hed_cache.get_version_index(import_dir), hed_cache.get_version_index(self.cache_dir))
+        for hed_version in self.hed_versions:
+            hed_xml_file = hed_cache.get_path_from_hed_version(hed_version, import_dir)
+            self.assertIsNotNone(schema_snapshot.load_snapshot(hed_xml_file))
+        with mock.patch.object(os, 'walk') as walk:
+            self.assertEqual(hed_cache.get_all_hed_versions(import_dir), self.hed_versions)
+            self.assertEqual(hed_cache.get_local_file(import_dir),
+                             hed_cache.get_path_from_hed_version(self.hed_versions[0], import_dir))
+        walk.assert_not_called()
+
+    def test_files_predating_index(self):
+        os.makedirs(self.cache_dir)
+        shutil.copy(os.path.join(self.source_dir, 'HED7.1.1.xml'), self.cache_dir)
+        hed_xml_url = pathlib.Path(os.path.join(self.source_dir, 'HED7.0.4.xml')).as_uri()
+        hed_cache.cache_specific_url(hed_xml_url, cache_folder=self.cache_dir)
+        self.assertEqual(list(hed_cache.get_version_index(self.cache_dir)), ['7.0.4'])
+        self.assertEqual(hed_cache.get_all_hed_versions(self.cache_dir), self.hed_versions)
+        self.assertEqual(hed_cache.get_latest_hed_version_path(self.cache_dir),
+                         os.path.join(self.cache_dir, 'HED7.1.1.xml'))
+        os.remove(os.path.join(self.cache_dir, 'HED7.1.1.xml'))
+        self.assertEqual(hed_cache.get_all_hed_versions(self.cache_dir), ['7.0.4'])
+
+    def test_bundle_import_keeps_existing_files(self):
+        hed_cache.cache_all_hed_xml_versions(self.source_dir, self.cache_dir)
+        os.remove(os.path.join(self.cache_dir, 'HED7.0.4.xml'))
+        bundle_file = os.path.join(self.temp_directory, 'hed_cache.tar.gz')
+        self.assertEqual(hed_cache.export_cache_bundle(bundle_file, self.cache_dir), ['7.1.1'])
+        import_dir = os.path.join(self.temp_directory, 'imported')
+        os.makedirs(import_dir)
+        shutil.copy(os.path.join(self.source_dir, 'HED7.0.4.xml'), import_dir)
+        hed_cache.import_cache_bundle(bundle_file, import_dir)
+        self.assertEqual(hed_cache.get_all_hed_versions(import_dir), self.hed_versions)
+
+    def test_bundle_snapshots_compiled_locally(self):
+        hed_cache.cache_all_hed_xml_versions(self.source_dir, self.cache_dir)
+        bundle_file = os.path.join(self.temp_directory, 'hed_cache.tar.gz')
+        hed_cache.export_cache_bundle(bundle_file, self.cache_dir)
+        replaced_bundle_file = os.path.join(self.temp_directory, 'replaced.tar.gz')
+        replaced_snapshot = b'not a snapshot'
+        with tarfile.open(bundle_file, 'r:gz') as bundle, tarfile.open(replaced_bundle_file, 'w:gz') as replaced:
+            for member in bundle.getmembers():
+                contents = bundle.extractfile(member).read()
+                if member.name == hed_cache.BUNDLE_MANIFEST_FILENAME:
+                    manifest = json.loads(contents)
+                    for version_entry in manifest[hed_cache.BUNDLE_VERSIONS_KEY].values():
+                        version_entry[hed_cache.BUNDLE_SNAPSHOT_SHA_KEY] = \
+                            hed_cache.sha1(b'blob %d\0' % len(replaced_snapshot) + replaced_snapshot).hexdigest()
+                    contents = json.dumps(manifest).encode('utf-8')
+                elif member.name.endswith(schema_snapshot.SNAPSHOT_EXTENSION):
+                    contents = replaced_snapshot
+                member.size = len(contents)
+                replaced.addfile(member, io.BytesIO(contents))
+        import_dir = os.path.join(self.temp_directory, 'imported')
+        imported_hed_xml = os.path.join(import_dir, 'HED7.1.1.xml')
+        hed_cache.import_cache_bundle(replaced_bundle_file, import_dir)
+        self.assertIsNotNone(schema_snapshot.load_snapshot(imported_hed_xml))
+        hed_cache.import_cache_bundle(replaced_bundle_file, import_dir, trust_snapshots=True)
+        snapshot_file = schema_snapshot.get_snapshot_path(imported_hed_xml)
+        with open(snapshot_file, 'rb') as f:
+            self.assertEqual(f.read(), replaced_snapshot)
+
+    def test_bundle_hash_mismatch(self):
+        hed_cache.cache_all_hed_xml_versions(self.source_dir, self.cache_dir)
+        bundle_file = os.path.join(self.temp_directory, 'hed_cache.tar.gz')
+        hed_cache.export_cache_bundle(bundle_file, self.cache_dir)
+        hed_xml_file = hed_cache.get_path_from_hed_version(self.hed_versions[0], self.cache_dir)
+        tampered_bundle_file = os.path.join(self.temp_directory, 'tampered.tar.gz')
+        with tarfile.open(bundle_file, 'r:gz') as bundle, tarfile.open(tampered_bundle_file, 'w:gz') as tampered:
+            for member in bundle.getmembers():
+                if member.name == os.path.basename(hed_xml_file):
+                    with open(hed_xml_file, 'a') as f:
+                        f.write(' ')
+                    tampered.add(hed_xml_file, arcname=member.name)
+                else:
+                    tampered.addfile(member, bundle.extractfile(member))
+        import_dir = os.path.join(self.temp_directory, 'imported')
+        with self.assertRaises(ValueError):
+            hed_cache.import_cache_bundle(tampered_bundle_file, import_dir)
+        self.assertEqual(hed_cache.get_version_index(import_dir), {})
+        self.assertFalse(os.path.exists(os.path.join(import_dir, os.path.basename(hed_xml_file))))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 import os
 
-from hed.util.hed_dictionary import HedDictionary
+from hed.util.hed_dictionary import HedDictionary, find_prefixes
 
 
 class TestHedDictionary(unittest.TestCase):
@@ -157,3 +157,27 @@ class TestHedDictionary(unittest.TestCase):
             for attribute, expected_value in expected_dict.items():
                 self.assertEqual(self.hed_dictionary.tag_has_attribute(test_string, attribute), expected_value,
                                  'Test string: %s. Attribute: %s.' % (test_string, attribute))
+
+    def test_tag_records(self):
+        tag_records = self.hed_dictionary.tag_records
+        self.assertEqual(len(tag_records), len(self.hed_dictionary_dictionaries['tags']) + 1)
+        azimuth_record = tag_records['attribute/location/reference frame/relative to participant/azimuth']
+        self.assertTrue(azimuth_record.extension_allowed)
+        self.assertTrue(azimuth_record.takes_value_child)
+        self.assertEqual(azimuth_record.unit_classes, ('angle',))
+        self.assertEqual(azimuth_record.unit_class_units, ('radian', 'rad', 'degree'))
+        self.assertEqual(azimuth_record.default_unit, 'radian')
+        time_shut_record = tag_records['attribute/blink/time shut']
+        self.assertEqual(time_shut_record.default_unit, 's')
+        label_record = tag_records['event/label']
+        self.assertFalse(label_record.extension_allowed)
+        self.assertTrue(label_record.takes_value_child)
+        self.assertIsNone(label_record.unit_classes)
+        self.assertEqual(label_record.default_unit, '')
+
+    def test_prefix_tries(self):
+        self.assertEqual(find_prefixes(self.hed_dictionary.required_prefix_trie, 'event/label/a'), ['event/label'])
+        self.assertEqual(find_prefixes(self.hed_dictionary.unique_prefix_trie, 'event/long name/b'),
+                         ['event/long name'])
+        self.assertEqual(find_prefixes(self.hed_dictionary.unique_prefix_trie, 'event/category/c'), [])
+        self.assertEqual(find_prefixes(self.hed_dictionary.unique_prefix_trie, 'event/labe'), [])
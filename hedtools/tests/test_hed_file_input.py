@@ -1,5 +1,7 @@
 import unittest
 import os
+import shutil
+import tempfile
 
 from hed.util.hed_file_input import HedFileInput
 
@@ -21,6 +23,11 @@ class Test(unittest.TestCase):
         cls.category_tags = 'Participant response, Stimulus'
         cls.row_with_hed_tags = ['event1', 'tag1', 'tag2']
 
+    def test_legacy_excel_workbook_rejected(self):
+        with self.assertRaises(ValueError) as context:
+            HedFileInput(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data/ExcelMultipleSheets.xls'))
+        self.assertIn('.xlsx', str(context.exception))
+
     def test_all(self):
         hed_input = self.default_test_file_name
         has_column_names = True
@@ -81,6 +88,63 @@ class Test(unittest.TestCase):
         self.assertIsInstance(processing_tag_columns, list)
         self.assertEqual(processing_tag_columns, self.zero_based_tag_columns_less_than_row_column_count)
 
+    def test_read_only_text_file(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            text_file_path = os.path.join(temp_dir, 'events.tsv')
+            with open(text_file_path, 'w', encoding='utf-8') as text_file:
+                text_file.write('onset\tlabel\tHED\n')
+                text_file.write('1.0\tGo\tEvent/Category/Stimulus\n')
+                text_file.write('2.0\tStop\tEvent/Category/Participant response\n')
+            column_prefix_dictionary = {2: 'Event/Label/'}
+            in_memory_input = HedFileInput(text_file_path, tag_columns=[3],
+                                           column_prefix_dictionary=column_prefix_dictionary)
+            read_only_input = HedFileInput(text_file_path, tag_columns=[3],
+                                           column_prefix_dictionary=column_prefix_dictionary, read_only=True)
+            self.assertIsNone(read_only_input._text_file)
+            self.assertEqual(list(read_only_input), list(in_memory_input))
+            self.assertRaises(ValueError, read_only_input.set_cell, 1, 2, 'Label')
+            self.assertRaises(ValueError, read_only_input.save, os.path.join(temp_dir, 'saved'))
+
+            def rename_row(row_number, row_hed_string, column_to_hed_tags_dictionary):
+                return {column: text.replace('Go', 'Start').replace('Stimulus', 'Sensory')
+                        for column, text in column_to_hed_tags_dictionary.items()}
+
+            output_path = read_only_input.stream_to_file(os.path.join(temp_dir, 'streamed'), rename_row)
+            self.assertEqual(output_path, os.path.join(temp_dir, 'streamed.tsv'))
+            with open(output_path, 'r', encoding='utf-8') as output_file:
+                self.assertEqual(output_file.read(),
+                                 'onset\tlabel\tHED\n'
+                                 '1.0\tStart\tEvent/Category/Sensory\n'
+                                 '2.0\tStop\tEvent/Category/Participant response\n')
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_excel_read_only_workbook(self):
+        with HedFileInput(self.default_test_file_name, worksheet_name='PVT Events', tag_columns=[4],
+                          read_only=True) as file_input:
+            read_only_workbook = file_input._workbook
+            self.assertTrue(read_only_workbook.read_only)
+            self.assertFalse(file_input._workbook_is_editable)
+            self.assertEqual(file_input.get_worksheet_names(), ['LKT Events', 'PVT Events', 'DAS Events'])
+            self.assertEqual(file_input.get_column_names(),
+                             ['Event code', 'Short label', 'Description in text', 'HED tags'])
+            rows = list(file_input)
+            self.assertTrue(rows)
+            self.assertFalse(file_input._workbook_is_editable)
+            row_number, row_hed_string, column_to_hed_tags_dictionary = rows[0]
+            file_input.set_cell(row_number, 3, 'Event/Label/Test')
+            self.assertTrue(file_input._workbook_is_editable)
+            self.assertEqual(file_input._worksheet.cell(row_number + 1, 4).value, 'Event/Label/Test')
+            self.assertIsNotNone(read_only_workbook._archive.fp)
+        self.assertIsNone(read_only_workbook._archive.fp)
+
+    def test_excel_editable_workbook(self):
+        file_input = HedFileInput(self.default_test_file_name, worksheet_name='PVT Events', tag_columns=[4])
+        self.assertFalse(file_input._workbook.read_only)
+        self.assertTrue(file_input._workbook_is_editable)
+        self.assertTrue(list(file_input))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+from hed.util.hed_parse_tree import HedParseTree, scan_hed_string
+from hed.util.hed_string_delimiter import HedStringDelimiter
+
+
+class TestHedParseTree(unittest.TestCase):
+    def test_nodes(self):
+        hed_string = 'Event/Label/A, (Item/Object, (Attribute/Red ~ Action/Move)), "Event/Description/B"'
+        parse_tree = HedParseTree(hed_string)
+        self.assertEqual([node.text for node in parse_tree.children],
+                         ['Event/Label/A', '(Item/Object, (Attribute/Red ~ Action/Move))', 'Event/Description/B'])
+        self.assertEqual([tag.text for tag in parse_tree.top_level_tags], ['Event/Label/A', 'Event/Description/B'])
+        self.assertEqual([group.text for group in parse_tree.groups],
+                         ['(Attribute/Red ~ Action/Move)', '(Item/Object, (Attribute/Red ~ Action/Move))'])
+        self.assertEqual([tag.text for tag in parse_tree.tags],
+                         ['Event/Label/A', 'Event/Description/B', 'Item/Object', 'Attribute/Red', '~', 'Action/Move'])
+        self.assertEqual([tag.depth for tag in parse_tree.tags], [0, 0, 1, 2, 2, 2])
+        self.assertEqual([group.depth for group in parse_tree.groups], [1, 0])
+
+    def test_spans(self):
+        hed_string = ' A/B , (C, "D/E") ,F'
+        parse_tree = HedParseTree(hed_string)
+        for node in parse_tree.children:
+            start, end = node.span
+            self.assertEqual(hed_string[start:end].replace('"', ''), node.text)
+        self.assertEqual(parse_tree.groups[0].children[1].span, (12, 15))
+
+    def test_formatted_tag(self):
+        parse_tree = HedParseTree('/Event/Label/A\nB/')
+        tag = parse_tree.tags[0]
+        self.assertEqual(tag.original_tag, '/Event/Label/A B/')
+        self.assertEqual(tag.formatted_tag, 'event/label/a b')
+        self.assertIs(tag.formatted_tag, tag.formatted_tag)
+
+    def test_immutable(self):
+        parse_tree = HedParseTree('A, (B, C)')
+        with self.assertRaises(AttributeError):
+            parse_tree.tags[0].text = 'D'
+        with self.assertRaises(AttributeError):
+            parse_tree.groups[0].children = ()
+        self.assertIsInstance(parse_tree.groups[0].children, tuple)
+
+    def test_unbalanced_parentheses(self):
+        hed_strings = ['A), (B, C', '((A) B), C', '(A)(B), C', 'A (B, C)', '(A, (B)']
+        for hed_string in hed_strings:
+            parse_tree = HedParseTree(hed_string)
+            split_hed_string = HedStringDelimiter.split_hed_string_into_list(hed_string)
+            self.assertEqual([node.text for node in parse_tree.children], split_hed_string)
+            for node in parse_tree.children:
+                start, end = node.span
+                self.assertEqual(hed_string[start:end], node.text)
+
+    def test_scan_hed_string(self):
+        hed_string = 'A/[B], , (C ~ D) E, F(G),'
+        hed_string_scan = scan_hed_string(hed_string)
+        self.assertEqual(hed_string_scan.invalid_characters, [('[', 2), (']', 4)])
+        self.assertEqual(hed_string_scan.opening_parentheses_count, 2)
+        self.assertEqual(hed_string_scan.closing_parentheses_count, 2)
+        self.assertEqual(hed_string_scan.delimiter_issues,
+                         [('extraDelimiter', {'character': ',', 'index': 7, 'hed_string': hed_string}),
+                          ('commaMissing', {'tag': ' D) '})])
+        self.assertFalse(hed_string_scan.tokenizable)
+        hed_string_scan = scan_hed_string('A, F(G), H,')
+        self.assertEqual(hed_string_scan.delimiter_issues,
+                         [('invalidTag', {'tag': ' F('}),
+                          ('extraDelimiter', {'character': ',', 'index': 10, 'hed_string': 'A, F(G), H,'})])
+
+    def test_tree_from_scan(self):
+        hed_string = 'A, ("B" ~ C), D'
+        hed_string_scan = scan_hed_string(hed_string)
+        self.assertTrue(hed_string_scan.tokenizable)
+        parse_tree = HedParseTree(hed_string, hed_string_scan)
+        self.assertEqual([node.text for node in parse_tree.children], ['A', '(B ~ C)', 'D'])
+        self.assertEqual([tag.text for tag in parse_tree.tags], ['A', 'D', 'B', '~', 'C'])
+
+
+if __name__ == '__main__':
+    unittest.main()
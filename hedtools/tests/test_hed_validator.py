@@ -1,6 +1,10 @@
+import os
 import random
 import unittest
+from concurrent.futures import Future
+from unittest import mock
 
+from hed.util.hed_file_input import HedFileInput
 from hed.util.hed_string_delimiter import HedStringDelimiter
 from hed.validator.hed_validator import HedValidator
 
@@ -104,6 +108,146 @@ class Test(unittest.TestCase):
         validation_issues = self.generic_hed_input_reader.get_validation_issues()
         self.assertIsInstance(validation_issues, list)
 
+    def test_validate_hed_tags_in_file_in_parallel(self):
+        data_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+        hed_xml_file = os.path.join(data_directory, 'HED7.1.1.xml')
+        spreadsheet_file = os.path.join(data_directory, 'ExcelMultipleSheets.xlsx')
+        for worksheet_name in ['LKT Events', 'PVT Events', 'DAS Events']:
+            file_input_arguments = {'worksheet_name': worksheet_name, 'tag_columns': [4],
+                                    'column_prefix_dictionary': {2: 'Event/Label/', 3: 'Event/Description/'}}
+            serial_validator = HedValidator(HedFileInput(spreadsheet_file, **file_input_arguments),
+                                            check_for_warnings=True, hed_xml_file=hed_xml_file)
+            with mock.patch.object(HedValidator, 'ROWS_PER_WORKER_CHUNK', 2):
+                parallel_progress = []
+                parallel_validator = HedValidator(HedFileInput(spreadsheet_file, **file_input_arguments),
+                                                  check_for_warnings=True, hed_xml_file=hed_xml_file, workers=2,
+                                                  progress_callback=lambda *progress: parallel_progress.append(progress))
+            self.assertEqual(parallel_validator.get_validation_issues(), serial_validator.get_validation_issues())
+            self.assertEqual(parallel_progress[-1], (len(list(HedFileInput(spreadsheet_file, **file_input_arguments))),
+                                                     serial_validator.get_tag_validator().get_issue_count()))
+            serial_tag_validator = serial_validator.get_tag_validator()
+            parallel_tag_validator = parallel_validator.get_tag_validator()
+            self.assertEqual(parallel_tag_validator.get_error_count(), serial_tag_validator.get_error_count())
+            self.assertEqual(parallel_tag_validator.get_warning_count(), serial_tag_validator.get_warning_count())
+
+    def test_map_row_chunks(self):
+        submitted_chunks = []
+        collected_chunks = []
+        chunks_in_flight = []
+
+        class RecordingExecutor:
+            def submit(self, function, row_chunk):
+                submitted_chunks.append(row_chunk)
+                chunks_in_flight.append(len(submitted_chunks) - len(collected_chunks))
+                future = Future()
+                future.set_result(row_chunk)
+                return future
+
+        validator = HedValidator(run_semantic_validation=False, workers=2)
+        with mock.patch.object(HedValidator, '_get_row_chunks', return_value=iter(range(10))):
+            for row_chunk in validator._map_row_chunks(RecordingExecutor()):
+                collected_chunks.append(row_chunk)
+        self.assertEqual(collected_chunks, list(range(10)))
+        self.assertEqual(max(chunks_in_flight), 2 * HedValidator.CHUNKS_IN_FLIGHT_PER_WORKER)
+
+    def test_progress_callback(self):
+        data_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+        hed_xml_file = os.path.join(data_directory, 'HED7.1.1.xml')
+        spreadsheet_file = os.path.join(data_directory, 'ExcelMultipleSheets.xlsx')
+        progress = []
+        validator = HedValidator(HedFileInput(spreadsheet_file, worksheet_name='DAS Events', tag_columns=[4]),
+                                 hed_xml_file=hed_xml_file,
+                                 progress_callback=lambda *row_progress: progress.append(row_progress))
+        self.assertEqual([rows_processed for rows_processed, _ in progress], list(range(1, len(progress) + 1)))
+        self.assertEqual(progress[-1][1], validator.get_tag_validator().get_issue_count())
+
+    def test_validate_many(self):
+        data_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+        hed_xml_file = os.path.join(data_directory, 'HED7.1.1.xml')
+        hed_strings = [self.attribute_onset_tag, self.hed_string_with_invalid_tags,
+                       self.hed_string_with_multiple_unique_tags, self.hed_string_with_too_many_tildes]
+        validator = HedValidator(hed_strings, hed_xml_file=hed_xml_file)
+        issue_table = HedValidator([], hed_xml_file=hed_xml_file).validate_many(iter(hed_strings))
+        expected_issues = [issue for string_issues in validator.get_validation_issues() for issue in string_issues]
+        self.assertEqual([{'code': issue['code'], 'message': issue['message']} for issue in issue_table],
+                         expected_issues)
+        self.assertEqual(list(issue_table.rows), [1, 1, 2, 3, 3, 3, 3, 3])
+        self.assertEqual(issue_table.get_code_counts(), {'invalidTag': 6, 'multipleUniqueTags': 1, 'tooManyTildes': 1})
+        first_invalid_tag = issue_table.get_issue(0)
+        self.assertEqual(first_invalid_tag['tag_index'], 0)
+        self.assertEqual((first_invalid_tag['span_start'], first_invalid_tag['span_end']), (0, 24))
+
+        spreadsheet_file = os.path.join(data_directory, 'ExcelMultipleSheets.xlsx')
+        file_input_arguments = {'worksheet_name': 'DAS Events', 'tag_columns': [4],
+                                'column_prefix_dictionary': {2: 'Event/Label/', 3: 'Event/Description/'}}
+        file_validator = HedValidator(HedFileInput(spreadsheet_file, **file_input_arguments),
+                                      check_for_warnings=True, hed_xml_file=hed_xml_file)
+        issue_table = file_validator.validate_many(HedFileInput(spreadsheet_file, **file_input_arguments))
+        self.assertEqual(issue_table.to_issue_list(), file_validator.get_validation_issues())
+
+    def test_validate_column(self):
+        hed_strings = ['Event/Category/Experimental stimulus', 'This/Is/Not/A/Valid/Tag',
+                       'Event/Category/Experimental stimulus', 'This/Is/Not/A/Valid/Tag', None]
+        hed_xml_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'HED7.1.1.xml')
+        column_validator = HedValidator([], hed_xml_file=hed_xml_file)
+        column_issues = column_validator.validate_column(hed_strings)
+        string_validator = HedValidator(hed_strings[:4], hed_xml_file=hed_xml_file)
+        self.assertEqual(column_issues, string_validator.get_validation_issues() + [[]])
+        self.assertEqual(column_validator.get_tag_validator().get_error_count(),
+                         string_validator.get_tag_validator().get_error_count())
+
+    def test_iter_validation_issues(self):
+        data_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+        hed_xml_file = os.path.join(data_directory, 'HED7.1.1.xml')
+        spreadsheet_file = os.path.join(data_directory, 'ExcelMultipleSheets.xlsx')
+        file_input_arguments = {'worksheet_name': 'DAS Events', 'tag_columns': [4],
+                                'column_prefix_dictionary': {2: 'Event/Label/', 3: 'Event/Description/'}}
+        file_validator = HedValidator(HedFileInput(spreadsheet_file, **file_input_arguments),
+                                      check_for_warnings=True, hed_xml_file=hed_xml_file)
+        validation_issues = HedValidator([], check_for_warnings=True, hed_xml_file=hed_xml_file).iter_validation_issues(
+            HedFileInput(spreadsheet_file, **file_input_arguments))
+        self.assertNotIsInstance(validation_issues, list)
+        self.assertEqual(list(validation_issues), file_validator.get_validation_issues())
+
+    def test_iter_row_issues(self):
+        data_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+        hed_xml_file = os.path.join(data_directory, 'HED7.1.1.xml')
+        spreadsheet_file = os.path.join(data_directory, 'ExcelMultipleSheets.xlsx')
+        file_input_arguments = {'worksheet_name': 'DAS Events', 'tag_columns': [4],
+                                'column_prefix_dictionary': {2: 'Event/Label/', 3: 'Event/Description/'}}
+        hed_validator = HedValidator(hed_xml_file=hed_xml_file)
+        self.assertEqual(hed_validator.get_validation_issues(), [])
+        row_issues = list(hed_validator.iter_row_issues(HedFileInput(spreadsheet_file, **file_input_arguments)))
+        self.assertTrue(row_issues)
+        self.assertEqual(len(row_issues[0]), 3)
+        hed_file_input = HedFileInput(spreadsheet_file, **file_input_arguments)
+        first_error_issues = list(hed_validator.iter_row_issues(hed_file_input, max_errors=1))
+        self.assertEqual(first_error_issues, row_issues[:len(first_error_issues)])
+        self.assertLess(len(first_error_issues), len(row_issues))
+        self.assertGreaterEqual(HedValidator.count_errors(first_error_issues[-1][2]), 1)
+        hed_strings = ['Event/Label/Test', 'Invalid/Tag1', 'Event/Category/Participant response', 'Invalid/Tag2']
+        string_issues = list(hed_validator.iter_row_issues(hed_strings))
+        self.assertEqual([row for row, _, _ in string_issues], [1, 3])
+        self.assertEqual([column for _, column, _ in string_issues], [None, None])
+        self.assertEqual(len(list(hed_validator.iter_row_issues(hed_strings, max_errors=1))), 1)
+
+    def test_validate_reuses_validator(self):
+        hed_xml_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'HED7.1.1.xml')
+        hed_strings = ['Event/Label/Test', 'Invalid/Tag1', 'Event/Category/Participant response', 'Invalid/Tag2']
+        hed_validator = HedValidator(hed_xml_file=hed_xml_file)
+        tag_validator = hed_validator.get_tag_validator()
+        string_validator = HedValidator(hed_strings, hed_xml_file=hed_xml_file)
+        self.assertEqual(hed_validator.validate(hed_strings), string_validator.get_validation_issues())
+        self.assertEqual(hed_validator.validate(hed_strings, max_errors=1), hed_validator.get_validation_issues())
+        self.assertEqual(len(hed_validator.get_validation_issues()), 2)
+        self.assertEqual(hed_validator.validate(hed_strings, max_errors=10), hed_validator.validate(hed_strings))
+        string_validator = HedValidator('Invalid/Tag1', hed_xml_file=hed_xml_file)
+        self.assertEqual(hed_validator.validate('Invalid/Tag1'), string_validator.get_validation_issues())
+        self.assertIs(hed_validator.get_tag_validator(), tag_validator)
+        self.assertTrue(hed_validator.is_valid(hed_strings[:1]))
+        self.assertFalse(hed_validator.is_valid(hed_strings))
+        self.assertFalse(hed_validator.is_valid('Invalid/Tag1'))
+
 
     def test_get_previous_original_and_formatted_tag(self):
         loop_index = 1
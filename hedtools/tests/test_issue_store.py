@@ -0,0 +1,72 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from hed.util.hed_file_input import HedFileInput
+from hed.validator.hed_validator import HedValidator
+from hed.validator.issue_store import IssueStore, ROW_ISSUES_COLUMN
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        data_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+        cls.hed_xml_file = os.path.join(data_directory, 'HED7.1.1.xml')
+        cls.spreadsheet_file = os.path.join(data_directory, 'ExcelMultipleSheets.xlsx')
+        cls.file_input_arguments = {'worksheet_name': 'DAS Events', 'tag_columns': [4],
+                                    'column_prefix_dictionary': {2: 'Event/Label/', 3: 'Event/Description/'}}
+
+    def setUp(self):
+        self.temporary_directory = tempfile.mkdtemp()
+        self.issue_store = IssueStore(os.path.join(self.temporary_directory, 'issues.sqlite'))
+
+    def tearDown(self):
+        self.issue_store.close()
+        shutil.rmtree(self.temporary_directory)
+
+    def _validate(self, spreadsheet_file, issue_store=None, **file_input_arguments):
+        return HedValidator(HedFileInput(spreadsheet_file, **file_input_arguments), check_for_warnings=True,
+                            hed_xml_file=self.hed_xml_file, issue_store=issue_store)
+
+    def test_row_issues(self):
+        row_key = IssueStore.get_row_key('validator', 'Event/Label/Test', {2: 'Event/Label/Test'})
+        self.assertIsNone(self.issue_store.get_row_issues(row_key))
+        row_issues = [(ROW_ISSUES_COLUMN, [{'code': 'invalidTag', 'message': 'Invalid'}])]
+        self.issue_store.set_row_issues(row_key, row_issues, 1, 0)
+        self.assertEqual(self.issue_store.get_row_issues(row_key), (row_issues, 1, 0))
+        self.assertNotEqual(IssueStore.get_row_key('other validator', 'Event/Label/Test', {2: 'Event/Label/Test'}),
+                            row_key)
+
+    def test_incremental_validation(self):
+        full_validator = self._validate(self.spreadsheet_file, **self.file_input_arguments)
+        first_validator = self._validate(self.spreadsheet_file, self.issue_store, **self.file_input_arguments)
+        second_validator = self._validate(self.spreadsheet_file, self.issue_store, **self.file_input_arguments)
+        for validator in [first_validator, second_validator]:
+            self.assertEqual(validator.get_validation_issues(), full_validator.get_validation_issues())
+            self.assertEqual(validator.get_tag_validator().get_error_count(),
+                             full_validator.get_tag_validator().get_error_count())
+            self.assertEqual(validator.get_tag_validator().get_warning_count(),
+                             full_validator.get_tag_validator().get_warning_count())
+        self.assertGreater(first_validator.get_recomputed_row_count(), 0)
+        self.assertEqual(first_validator.get_reused_row_count(), 0)
+        self.assertEqual(second_validator.get_recomputed_row_count(), 0)
+        self.assertEqual(second_validator.get_reused_row_count(), first_validator.get_recomputed_row_count())
+
+    def test_incremental_validation_of_edited_file(self):
+        text_file = os.path.join(self.temporary_directory, 'events.tsv')
+        rows = ['Event/Category/Experimental stimulus', 'This/Is/Not/A/Valid/Tag', 'Event/Label/Start']
+        for edited_rows in [rows, ['Event/Label/Moved'] + rows[1:] + ['Another/Invalid/Tag']]:
+            with open(text_file, 'w', encoding='utf-8') as opened_file:
+                opened_file.write('Event code\tHED tags\n')
+                for row_index, row in enumerate(edited_rows):
+                    opened_file.write('%d\t%s\n' % (row_index, row))
+            validator = self._validate(text_file, self.issue_store)
+            self.assertEqual(validator.get_validation_issues(),
+                             self._validate(text_file).get_validation_issues())
+        self.assertEqual(validator.get_recomputed_row_count(), 2)
+        self.assertEqual(validator.get_reused_row_count(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
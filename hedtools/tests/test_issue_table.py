@@ -0,0 +1,37 @@
+import unittest
+
+from hed.validator.issue_table import IssueTable, NO_VALUE
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.issue_table = IssueTable()
+        self.invalid_tag_issue = {'code': 'invalidTag', 'message': '\tERROR: Invalid tag - "Bad/Tag"\n'}
+        self.duplicate_tag_issue = {'code': 'duplicateTag', 'message': '\tERROR: Duplicate tag - "Event"\n'}
+
+    def test_add_issues(self):
+        self.issue_table.add_issues([self.invalid_tag_issue], 1, NO_VALUE, (0, 7), 0)
+        self.issue_table.add_issues([self.invalid_tag_issue, self.duplicate_tag_issue], 3, 4, (8, 13))
+        self.assertEqual(len(self.issue_table), 3)
+        self.assertEqual(self.issue_table.codes, ['invalidTag', 'invalidTag', 'duplicateTag'])
+        self.assertEqual(list(self.issue_table.rows), [1, 3, 3])
+        self.assertEqual(list(self.issue_table.columns), [NO_VALUE, 4, 4])
+        self.assertEqual(list(self.issue_table.span_starts), [0, 8, 8])
+        self.assertEqual(list(self.issue_table.tag_indices), [0, NO_VALUE, NO_VALUE])
+        self.assertEqual(self.issue_table.get_message(2), self.duplicate_tag_issue['message'])
+        self.assertEqual(len(self.issue_table._messages), 2)
+        self.assertEqual(self.issue_table.get_code_counts(), {'invalidTag': 2, 'duplicateTag': 1})
+
+    def test_to_issue_list(self):
+        self.issue_table.add_issues([self.invalid_tag_issue], 1)
+        self.issue_table.add_issues([self.invalid_tag_issue, self.duplicate_tag_issue], 3, 4)
+        issue_list = self.issue_table.to_issue_list()
+        self.assertEqual([issue['code'] for issue in issue_list],
+                         ['row', 'invalidTag', 'column', 'invalidTag', 'duplicateTag'])
+        self.assertEqual(issue_list[0]['message'], 'Issues in row 2:\n')
+        self.assertEqual(issue_list[2]['message'], 'Issues in row 4 column 5:\n')
+        self.assertEqual(self.issue_table.to_issue_list(has_headers=False)[0]['message'], 'Issues in row 1:\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+from defusedxml.lxml import parse
+
+from hed.util import schema_loader
+from hed.util.errors import SchemaError
+from hed.util.hed_dictionary import HedDictionary
+from hed.util.schema_node_map import SchemaNodeMap
+
+
+class TestSchemaLoader(unittest.TestCase):
+    schema_file = 'data/HED7.1.1.xml'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.hed_xml = os.path.join(os.path.dirname(os.path.abspath(__file__)), cls.schema_file)
+        cls.schema_contents = schema_loader.read_schema(cls.hed_xml)
+
+    def test_read_schema(self):
+        self.assertEqual(self.schema_contents.version, '7.1.1')
+        tag_paths = [schema_node.tag_path for schema_node in self.schema_contents.nodes]
+        self.assertIn(('Event', 'Category', 'Experimental stimulus'), tag_paths)
+        self.assertIn(('Event', 'Duration', '#'), tag_paths)
+        duration_node = self.schema_contents.nodes[tag_paths.index(('Event', 'Duration', '#'))]
+        self.assertEqual(duration_node.attributes['unitClass'], 'time')
+        unit_class_names = [unit_class.name for unit_class in self.schema_contents.unit_classes]
+        self.assertIn('time', unit_class_names)
+        self.assertTrue(self.schema_contents.unit_modifiers)
+
+    def test_populate_hed_dictionary(self):
+        hed_dictionary = HedDictionary(self.hed_xml, use_snapshot=False, schema_contents=self.schema_contents)
+        for attribute_name in ['isNumeric', 'position', 'predicateType', 'recommended', 'required', 'requireChild',
+                               'takesValue', 'unique']:
+            tags = hed_dictionary.get_tags_by_attribute(attribute_name)[0]
+            self.assertEqual(hed_dictionary.dictionaries[attribute_name], {tag.lower(): tag for tag in tags})
+        all_tags = hed_dictionary.get_all_tags()[0]
+        self.assertEqual(hed_dictionary.dictionaries['tags'], {tag.lower(): tag for tag in all_tags})
+        tags, tag_elements = hed_dictionary.get_tags_by_attribute('unitClass')
+        self.assertEqual(hed_dictionary.dictionaries['unitClass'],
+                         {tag.lower(): tag_element.get('unitClass') for tag, tag_element in zip(tags, tag_elements)})
+        self.assertTrue(hed_dictionary.has_unit_classes)
+        self.assertTrue(hed_dictionary.has_unit_modifiers)
+
+    def test_populate_schema_node_map(self):
+        tree_map = SchemaNodeMap(hed_tree=parse(self.hed_xml).getroot(), use_full_name_as_key=True)
+        streamed_map = SchemaNodeMap(schema_contents=self.schema_contents, use_full_name_as_key=True)
+        self.assertEqual(list(streamed_map.tag_dict), list(tree_map.tag_dict))
+        for tag_name, tag_entry in tree_map.tag_dict.items():
+            self.assertEqual(streamed_map.tag_dict[tag_name].long_org_tag, tag_entry.long_org_tag)
+            self.assertEqual(streamed_map.tag_dict[tag_name].short_org_tag, tag_entry.short_org_tag)
+
+    def test_invalid_xml(self):
+        temp_directory = tempfile.mkdtemp()
+        try:
+            invalid_xml = os.path.join(temp_directory, 'invalid.xml')
+            with open(invalid_xml, 'w') as invalid_xml_file:
+                invalid_xml_file.write('<HED version="7.1.1"><node><name>Event</name></HED>')
+            with self.assertRaises(SchemaError):
+                schema_loader.read_schema(invalid_xml)
+            with self.assertRaises(SchemaError):
+                SchemaNodeMap(invalid_xml)
+        finally:
+            shutil.rmtree(temp_directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import os
+import shutil
+import tempfile
+import threading
+
+from hed.util.hed_dictionary import HedDictionary
+from hed.util.schema_node_map import SchemaNodeMap
+from hed.util.schema_registry import SchemaRegistry
+
+
+class TestSchemaRegistry(unittest.TestCase):
+    schema_file = 'data/HED7.1.1.xml'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.source_hed_xml = os.path.join(os.path.dirname(os.path.abspath(__file__)), cls.schema_file)
+
+    def setUp(self):
+        self.temp_directory = tempfile.mkdtemp()
+        self.hed_xml = os.path.join(self.temp_directory, 'HED7.1.1.xml')
+        shutil.copyfile(self.source_hed_xml, self.hed_xml)
+        self.registry = SchemaRegistry(max_size=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_directory)
+
+    def test_get_hed_dictionary(self):
+        hed_dictionary = self.registry.get_hed_dictionary(self.hed_xml)
+        self.assertIsInstance(hed_dictionary, HedDictionary)
+        self.assertIs(self.registry.get_hed_dictionary(self.hed_xml), hed_dictionary)
+        cache_info = self.registry.get_cache_info()
+        self.assertEqual(cache_info['hits'], 1)
+        self.assertEqual(cache_info['misses'], 1)
+        self.assertEqual(cache_info['size'], 1)
+
+    def test_get_schema_node_map(self):
+        schema_node_map = self.registry.get_schema_node_map(self.hed_xml)
+        self.assertIsInstance(schema_node_map, SchemaNodeMap)
+        self.assertIs(self.registry.get_schema_node_map(self.hed_xml), schema_node_map)
+        self.assertIsNot(self.registry.get_hed_dictionary(self.hed_xml), schema_node_map)
+
+    def test_modified_file_rebuilt(self):
+        hed_dictionary = self.registry.get_hed_dictionary(self.hed_xml)
+        stat_result = os.stat(self.hed_xml)
+        os.utime(self.hed_xml, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1000000000))
+        self.assertIsNot(self.registry.get_hed_dictionary(self.hed_xml), hed_dictionary)
+        self.assertEqual(self.registry.get_cache_info()['misses'], 2)
+
+    def test_lru_eviction(self):
+        hed_dictionary = self.registry.get_hed_dictionary(self.hed_xml)
+        self.registry.get_schema_node_map(self.hed_xml)
+        self.registry.get_hed_dictionary(self.hed_xml)
+        self.registry.get_schema_node_map(self.source_hed_xml)
+        cache_info = self.registry.get_cache_info()
+        self.assertEqual(cache_info['evictions'], 1)
+        self.assertEqual(cache_info['size'], 2)
+        self.assertIs(self.registry.get_hed_dictionary(self.hed_xml), hed_dictionary)
+
+    def test_concurrent_build(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.registry.get_hed_dictionary(self.hed_xml)))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 4)
+        for hed_dictionary in results:
+            self.assertIs(hed_dictionary, results[0])
+        self.assertEqual(self.registry.get_cache_info()['misses'], 1)
+
+    def test_failed_build_not_cached(self):
+        bad_xml = os.path.join(self.temp_directory, 'bad.xml')
+        with open(bad_xml, 'w') as bad_xml_file:
+            bad_xml_file.write('<HED>')
+        self.assertRaises(Exception, self.registry.get_schema_node_map, bad_xml)
+        self.assertEqual(self.registry.get_cache_info()['size'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import os
+import pickle
+import shutil
+import tempfile
+from unittest import mock
+
+from hed.util import hed_cache
+from hed.util import schema_loader
+from hed.util import schema_snapshot
+from hed.util.hed_dictionary import HedDictionary
+
+
+class TestSchemaSnapshot(unittest.TestCase):
+    schema_file = 'data/HED7.1.1.xml'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.source_hed_xml = os.path.join(os.path.dirname(os.path.abspath(__file__)), cls.schema_file)
+
+    def setUp(self):
+        self.temp_directory = tempfile.mkdtemp()
+        self.hed_xml = os.path.join(self.temp_directory, 'HED7.1.1.xml')
+        shutil.copyfile(self.source_hed_xml, self.hed_xml)
+        self.snapshot_path = schema_snapshot.get_snapshot_path(self.hed_xml)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_directory)
+
+    def _use_temp_directory_as_cache(self):
+        saved_cache_directory = hed_cache.HED_CACHE_DIRECTORY
+        hed_cache.set_cache_directory(self.temp_directory)
+        self.addCleanup(hed_cache.set_cache_directory, saved_cache_directory)
+
+    def test_get_snapshot_path(self):
+        self.assertEqual(self.snapshot_path, os.path.join(self.temp_directory, 'HED7.1.1.snapshot'))
+
+    def test_no_snapshot_written_outside_cache(self):
+        HedDictionary(self.hed_xml)
+        self.assertFalse(os.path.exists(self.snapshot_path))
+
+    def test_snapshot_written_in_cache(self):
+        saved_cache_directory = hed_cache.HED_CACHE_DIRECTORY
+        hed_cache.set_cache_directory(self.temp_directory)
+        try:
+            HedDictionary(self.hed_xml)
+        finally:
+            hed_cache.set_cache_directory(saved_cache_directory)
+        self.assertTrue(os.path.exists(self.snapshot_path))
+        self.assertEqual(hed_cache.get_all_hed_versions(self.temp_directory), ['7.1.1'])
+
+    def test_snapshot_not_loaded_outside_cache(self):
+        HedDictionary(self.hed_xml).save_snapshot()
+        with mock.patch.object(schema_snapshot, 'load_snapshot') as load_snapshot:
+            HedDictionary(self.hed_xml)
+        load_snapshot.assert_not_called()
+
+    def test_load_snapshot(self):
+        self._use_temp_directory_as_cache()
+        xml_dictionary = HedDictionary(self.hed_xml)
+        self.assertEqual(xml_dictionary.save_snapshot(), self.snapshot_path)
+        with mock.patch.object(schema_loader, 'read_schema', wraps=schema_loader.read_schema) as read_schema:
+            snapshot_dictionary = HedDictionary(self.hed_xml)
+        read_schema.assert_not_called()
+        self.assertIsNone(snapshot_dictionary._root_element)
+        self.assertEqual(snapshot_dictionary.dictionaries, xml_dictionary.dictionaries)
+        self.assertEqual(snapshot_dictionary.has_unit_classes, xml_dictionary.has_unit_classes)
+        self.assertEqual(snapshot_dictionary.has_unit_modifiers, xml_dictionary.has_unit_modifiers)
+        self.assertEqual(snapshot_dictionary.root_element.tag, xml_dictionary.root_element.tag)
+
+    def test_stale_snapshot_ignored(self):
+        self._use_temp_directory_as_cache()
+        HedDictionary(self.hed_xml).save_snapshot()
+        with open(self.hed_xml, 'a') as hed_xml_file:
+            hed_xml_file.write('\n')
+        self.assertIsNone(schema_snapshot.load_snapshot(self.hed_xml))
+        with mock.patch.object(schema_loader, 'read_schema', wraps=schema_loader.read_schema) as read_schema:
+            HedDictionary(self.hed_xml)
+        read_schema.assert_called_once_with(self.hed_xml)
+
+    def test_use_snapshot_false(self):
+        self._use_temp_directory_as_cache()
+        HedDictionary(self.hed_xml).save_snapshot()
+        with mock.patch.object(schema_loader, 'read_schema', wraps=schema_loader.read_schema) as read_schema:
+            HedDictionary(self.hed_xml, use_snapshot=False)
+        read_schema.assert_called_once_with(self.hed_xml)
+
+    def test_pickle_hed_dictionary(self):
+        hed_dictionary = HedDictionary(self.hed_xml)
+        unpickled_dictionary = pickle.loads(pickle.dumps(hed_dictionary))
+        self.assertEqual(unpickled_dictionary.dictionaries, hed_dictionary.dictionaries)
+        self.assertEqual(unpickled_dictionary.xml_hash, hed_dictionary.xml_hash)
+
+
+if __name__ == '__main__':
+    unittest.main()
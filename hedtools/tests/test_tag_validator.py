@@ -564,6 +564,59 @@ class TestHedTags(TestHed):
         self.assertCountEqual(issues, [])
 
 
+class TestTagCache(TestHed):
+    def test_cached_issues_and_counts(self):
+        tag_validator = TagValidator(self.hed_dictionary, check_for_warnings=True, run_semantic_validation=True)
+        original_tag = 'Attribute/Visual/Color/purple'
+        formatted_tag = original_tag.lower()
+        first_issues = tag_validator.run_individual_tag_validators(original_tag, formatted_tag)
+        first_issue_count = tag_validator.get_issue_count()
+        second_issues = tag_validator.run_individual_tag_validators(original_tag, formatted_tag)
+        self.assertTrue(first_issues)
+        self.assertEqual(second_issues, first_issues)
+        self.assertEqual(tag_validator.get_issue_count(), 2 * first_issue_count)
+        self.assertEqual(tag_validator.get_warning_count(), 2 * len(first_issues))
+        cache_info = tag_validator.get_tag_cache_info()
+        self.assertEqual(cache_info['hits'], 1)
+        self.assertEqual(cache_info['misses'], 1)
+        self.assertEqual(cache_info['hit_rate'], 0.5)
+
+    def test_previous_tag_not_cached(self):
+        tag_validator = TagValidator(self.hed_dictionary, check_for_warnings=False, run_semantic_validation=True)
+        original_tag = 'This/Is/Invalid'
+        formatted_tag = original_tag.lower()
+        invalid_issues = tag_validator.run_individual_tag_validators(original_tag, formatted_tag)
+        comma_issues = tag_validator.run_individual_tag_validators(
+            original_tag, formatted_tag, previous_original_tag='Attribute/Size/Width/3',
+            previous_formatted_tag='attribute/size/width/3')
+        self.assertCountEqual(invalid_issues, report_error_type('invalidTag', tag=original_tag))
+        self.assertCountEqual(comma_issues, report_error_type('extraCommaOrInvalid', tag=original_tag,
+                                                              previous_tag='Attribute/Size/Width/3'))
+        self.assertEqual(tag_validator.get_error_count(), 2)
+
+    def test_cache_size(self):
+        tag_validator = TagValidator(self.hed_dictionary, run_semantic_validation=True, tag_cache_size=1)
+        tag_validator.run_individual_tag_validators('Event/Category', 'event/category')
+        tag_validator.run_individual_tag_validators('Event/Label', 'event/label')
+        tag_validator.run_individual_tag_validators('Event/Category', 'event/category')
+        cache_info = tag_validator.get_tag_cache_info()
+        self.assertEqual(cache_info['hits'], 0)
+        self.assertEqual(cache_info['size'], 1)
+
+    def test_large_group_checks(self):
+        tag_validator = TagValidator(self.hed_dictionary, check_for_warnings=True, run_semantic_validation=True)
+        formatted_tags = ['item/object/%d' % index for index in range(500)] + \
+                         ['event/label/a', 'event/label/b', '~', '~', 'item/object/7', 'item/object/7']
+        original_tags = [formatted_tag.title() for formatted_tag in formatted_tags]
+        self.assertEqual(tag_validator.check_if_duplicate_tags_exist(original_tags, formatted_tags),
+                         report_error_type('duplicateTag', tag='Item/Object/7'))
+        self.assertEqual(tag_validator.check_if_multiple_unique_tags_exist(original_tags, formatted_tags),
+                         report_error_type('multipleUniqueTags', tag_prefix='Event/Label'))
+        self.assertEqual(tag_validator.check_for_required_tags(formatted_tags),
+                         report_warning_type('requiredPrefixMissing', tag_prefix='Event/Category') +
+                         report_warning_type('requiredPrefixMissing', tag_prefix='Event/Description'))
+
+
 class TestOldHed(TestHed):
     schema_file = 'data/HED7.0.4.xml'
 
@@ -0,0 +1,40 @@
+import unittest
+from unittest import mock
+
+from hed.util import unit_matcher
+from hed.util.unit_matcher import UnitMatcher
+
+
+class TestUnitMatcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.unit_symbols = {'second': None, 's': 'true', 'day': None, 'minute': None, 'hour': None}
+        cls.unit_modifiers = ['kilo', 'k', 'milli', 'm', 'micro', 'u']
+        cls.time_matcher = UnitMatcher(['second', 's', 'day', 'minute', 'hour'], cls.unit_symbols,
+                                       cls.unit_modifiers, cls.unit_modifiers)
+
+    def test_match_units(self):
+        self.assertEqual(self.time_matcher.match_units('3 ms', '3 ms'), ('s', '3'))
+        self.assertEqual(self.time_matcher.match_units('3 seconds', '3 seconds'), ('seconds', '3'))
+        self.assertEqual(self.time_matcher.match_units('second 3', 'second 3'), ('second', '3'))
+        self.assertEqual(self.time_matcher.match_units('3 millisecond', '3 millisecond'), ('second', '3'))
+        self.assertEqual(self.time_matcher.match_units('3 Hours', '3 hours'), ('hours', '3'))
+        self.assertEqual(self.time_matcher.match_units('3 fortnights', '3 fortnights'), ('s', '3 fortnight'))
+        self.assertEqual(self.time_matcher.match_units('3', '3'), (None, '3'))
+
+    def test_symbols_keep_case(self):
+        self.assertEqual(self.time_matcher.strip_units('3 S', '3 s'), '3 s')
+
+    def test_no_unit_modifiers(self):
+        matcher = UnitMatcher(['second', 's'])
+        self.assertEqual(matcher.strip_units('3 seconds', '3 seconds'), '3 second')
+        self.assertEqual(matcher.strip_units('3 ms', '3 ms'), '3 m')
+
+    def test_no_pluralization_when_matching(self):
+        with mock.patch.object(unit_matcher.pluralize, 'plural') as plural:
+            self.time_matcher.match_units('3 seconds', '3 seconds')
+            plural.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -631,6 +631,43 @@ class Test(unittest.TestCase):
         ]
         self.compare_base_new(self.tag_compare.convert_hed_string_to_long, test_strings, expected_results, errors_list)
 
+    def test_tag_parent_is_matched_by_whole_name(self):
+        test_strings = [
+            'Action/Association',
+            'Color/Red',
+        ]
+        for test_function in [self.tag_compare._convert_to_short_tag, self.tag_compare._convert_to_long_tag]:
+            for test_string in test_strings:
+                converted_tag, error = test_function(test_string)
+                self.assertEqual(test_string, converted_tag)
+                self.assertEqual(error_reporter.INVALID_PARENT_NODE, error['code'])
+
+    def test_convert_many(self):
+        test_strings = [
+            'Sensory event, Item/Object/Geometric',
+            'Event/Sensory event/Extension',
+            'Sensory event, Item/Object/Geometric',
+            'Nonexistent/Extension'
+        ]
+        for to_short, test_function in [(True, self.tag_compare.convert_hed_string_to_short),
+                                        (False, self.tag_compare.convert_hed_string_to_long)]:
+            converted_strings = self.tag_compare.convert_many(test_strings, to_short=to_short)
+            self.assertEqual([test_function(test_string) for test_string in test_strings], converted_strings)
+        converted_strings[3][1][0]['message'] = 'Changed'
+        self.assertNotEqual('Changed', self.tag_compare.convert_many(test_strings)[3][1][0]['message'])
+
+    def test_convert_column(self):
+        test_strings = [
+            'Event/Sensory event',
+            'Nonexistent/Extension',
+            'Event/Sensory event',
+            None
+        ]
+        converted_strings, errors = self.tag_compare.convert_column(test_strings)
+        self.assertEqual(['Sensory event', 'Nonexistent/Extension', 'Sensory event', None], converted_strings)
+        self.assertEqual([[], errors[1], [], []], errors)
+        self.assertEqual(error_reporter.NO_VALID_TAG_FOUND, errors[1][0]['code'])
+
     def test_split_hed_string(self):
         test_strings = [
             'Event',
@@ -21,6 +21,13 @@ class Config(object):
     UPLOAD_FOLDER = os.path.join(tempfile.gettempdir(), 'hedtools3_uploads')
     URL_PREFIX = None
     HED_CACHE_FOLDER = None
+    # A bundle written by hed_cache.export_cache_bundle to import into HED_CACHE_FOLDER at startup. Its snapshots are
+    # compiled again locally unless HED_CACHE_BUNDLE_TRUSTED is True, as loading a snapshot unpickles it.
+    HED_CACHE_BUNDLE = None
+    HED_CACHE_BUNDLE_TRUSTED = False
+    VALIDATION_JOB_WORKERS = 2
+    COMPRESS_VALIDATION_STREAM = True
+    UPLOADED_SCHEMA_POOL_SIZE = 8
 
 
 class DevelopmentConfig(Config):
@@ -3,3 +3,6 @@ NOT_FOUND_ERROR = 404
 NO_CONTENT_SUCCESS = 204
 ERROR_KEY = 'error'
 FILE_DOES_NOT_EXIST = "File doesn't exist"
+JOB_DOES_NOT_EXIST = "Job doesn't exist"
+INVALID_SPREADSHEET_EXTENSION = "Please upload an Excel or text spreadsheet (.xlsx, .tsv, .txt). Legacy .xls " \
+                                "workbooks are not supported, save them as .xlsx instead."
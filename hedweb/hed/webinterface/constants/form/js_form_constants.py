@@ -5,7 +5,10 @@ HED_FILE = 'hed'
 HED_MAJOR_VERSIONS = 'major_versions'
 HED_VERSION = 'version'
 ISSUE_COUNT = 'issueCount'
+JOB_ID = 'jobId'
+JOB_STATUS = 'jobStatus'
 REQUIRED_TAG_COLUMN_INDICES = 'requiredTagColumnIndices'
+ROWS_PROCESSED = 'rowsProcessed'
 SPREADSHEET_FILE = 'spreadsheet'
 TAG_COLUMN_INDICES = 'tagColumnIndices'
 WARNING_COUNT = 'warningCount'
@@ -1,4 +1,4 @@
-SPREADSHEET_FILE_EXTENSIONS = ['.xls', '.xlsx', '.txt', '.tsv']
+SPREADSHEET_FILE_EXTENSIONS = ['.xlsx', '.txt', '.tsv']
 HED_FILE_EXTENSIONS = ['.xml']
 OTHER_TAG_COLUMN_NAMES = ['Event Details', 'Multiple Tags', 'HED tag', 'HED tags', 'Tag', 'Tags']
 SPECIFIC_TAG_COLUMN_NAMES = ['Category', 'Description', 'Label', 'Long']
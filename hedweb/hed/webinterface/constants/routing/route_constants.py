@@ -6,9 +6,12 @@ DOWNLOAD_FILE_ROUTE = '/download/<filename>'
 HED_VERSION_ROUTE = '/get-hed-version'
 HELP_ROUTE = '/help'
 HOME_ROUTE = '/'
+JOB_STATUS_ROUTE = '/job-status/<job_id>'
 MAJOR_HED_VERSION_ROUTE = '/get-major-hed-versions'
+SCHEMA_POOL_INFO_ROUTE = '/diagnostics/schema-pool'
 SPREADSHEET_COLUMN_INFO_ROUTE = '/get-spreadsheet-columns-info'
 SUBMIT_ROUTE = '/submit'
+SUBMIT_JOB_ROUTE = '/submit-job'
 EEG_SUBMIT_ROUTE = '/eegsubmit'
 VALIDATION_ROUTE = '/validation'
 EEG_VALIDATION_ROUTE = '/eegvalidation'
@@ -210,22 +210,79 @@ def render_additional_examples_page():
 
 @route_blueprint.route(route_constants.SUBMIT_ROUTE, strict_slashes=False, methods=['POST'])
 def get_validation_results():
-    """Validate the spreadsheet in the form after submission and return an attachment other containing the output.
+    """Validate the spreadsheet in the form after submission and stream an attachment containing the output.
 
     Parameters
     ----------
 
     Returns
     -------
-        string
-        A serialized JSON string containing information related to the worksheet columns. If the validation fails then a
-        500 error message is returned.
+        Response object
+        A response streaming the validation issues as they are found. If the validation cannot be started then a 500
+        error message is returned.
     """
-    validation_status = utils.report_spreadsheet_validation_status(request)
-    if error_constants.ERROR_KEY in validation_status:
+    validation_response = utils.generate_spreadsheet_validation_response(request)
+    if isinstance(validation_response, dict):
         return handle_http_error(error_constants.INTERNAL_SERVER_ERROR,
-                                       validation_status[error_constants.ERROR_KEY])
-    return json.dumps(validation_status)
+                                       validation_response[error_constants.ERROR_KEY])
+    return validation_response
+
+
+@route_blueprint.route(route_constants.SUBMIT_JOB_ROUTE, strict_slashes=False, methods=['POST'])
+def submit_validation_job():
+    """Queue a job that validates the spreadsheet in the form and return the id of the job.
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+        string
+        A serialized JSON string containing the id of the job. If the job cannot be queued then a 500 error message is
+        returned.
+    """
+    job_info = utils.submit_spreadsheet_validation_job(request)
+    if error_constants.ERROR_KEY in job_info:
+        return handle_http_error(error_constants.INTERNAL_SERVER_ERROR, job_info[error_constants.ERROR_KEY])
+    return json.dumps(job_info)
+
+
+@route_blueprint.route(route_constants.JOB_STATUS_ROUTE, strict_slashes=False, methods=['GET'])
+def get_validation_job_status(job_id):
+    """Get the status of a spreadsheet validation job.
+
+    Parameters
+    ----------
+    job_id: string
+        The id of the job.
+
+    Returns
+    -------
+        string
+        A serialized JSON string containing the job status, the number of rows validated, and the number of issues
+        found so far. When the job is completed it also contains the name of the file to download from the download
+        route. If there is no job with the id then a 404 error message is returned.
+    """
+    job_status = utils.find_validation_job_status(job_id)
+    if job_status is None:
+        return handle_http_error(error_constants.NOT_FOUND_ERROR, error_constants.JOB_DOES_NOT_EXIST)
+    return json.dumps(job_status)
+
+
+@route_blueprint.route(route_constants.SCHEMA_POOL_INFO_ROUTE, strict_slashes=False, methods=['GET'])
+def get_schema_pool_info():
+    """Get the statistics of the schema pool used by the EEG events validation.
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+        string
+        A serialized JSON string containing the number of preloaded HED versions and uploaded schemas in the pool and
+        their hit and miss counters.
+    """
+    return json.dumps(utils.find_schema_pool_info())
 
 
 @route_blueprint.route(route_constants.EEG_SUBMIT_ROUTE, strict_slashes=False, methods=['POST'])
@@ -30,12 +30,16 @@ def configure_app():
 
 app = configure_app()
 with app.app_context():
-    from hed.webinterface import web_utils
+    from hed.webinterface import utils, web_utils
     from hed.webinterface.routes import route_blueprint
 
     app.register_blueprint(route_blueprint, url_prefix=app.config['URL_PREFIX'])
     web_utils.create_upload_directory(app.config['UPLOAD_FOLDER'])
     hed_cache.set_cache_directory(app.config['HED_CACHE_FOLDER'])
+    if app.config.get('HED_CACHE_BUNDLE'):
+        hed_cache.import_cache_bundle(app.config['HED_CACHE_BUNDLE'], app.config['HED_CACHE_FOLDER'],
+                                      trust_snapshots=app.config.get('HED_CACHE_BUNDLE_TRUSTED', False))
+    utils.get_schema_pool().preload_hed_versions()
     setup_logging()
 
 if __name__ == '__main__':
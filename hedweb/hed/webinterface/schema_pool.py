@@ -0,0 +1,202 @@
+"""
+This module contains the SchemaPool class which keeps HedDictionary objects loaded for the lifetime of the web process
+so that validation requests do not rebuild them from XML. Every HED version in the HED cache is loaded once when the
+pool is preloaded. Uploaded HED XML files are identified by a hash of their content and kept in a least recently used
+pool, so repeated uploads of the same schema are only parsed the first time.
+
+The HedDictionary objects returned by the pool are shared and must be treated as read-only.
+
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from hed.util import hed_cache
+from hed.util.file_util import delete_file_if_it_exist
+from hed.util.hed_dictionary import HedDictionary
+
+DEFAULT_MAX_UPLOADED_SCHEMAS = 8
+
+
+class SchemaPool:
+    def __init__(self, max_uploaded_schemas=DEFAULT_MAX_UPLOADED_SCHEMAS):
+        """Constructor for the SchemaPool class.
+
+        Parameters
+        ----------
+        max_uploaded_schemas: int
+            The maximum number of uploaded schemas to keep. The least recently used one is removed when there are
+            more.
+
+        Returns
+        -------
+        SchemaPool
+            A SchemaPool object.
+
+        """
+        self.max_uploaded_schemas = max_uploaded_schemas
+        self.version_hits = 0
+        self.version_misses = 0
+        self.uploaded_hits = 0
+        self.uploaded_misses = 0
+        self.uploaded_evictions = 0
+        self._version_dictionaries = {}
+        self._uploaded_dictionaries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def preload_hed_versions(self, local_hed_directory=None):
+        """Loads every HED version in the HED cache.
+
+        Parameters
+        ----------
+        local_hed_directory: str
+            The directory containing the HED XML files. Defaults to the HED cache directory.
+
+        Returns
+        -------
+        list
+            The HED versions that were loaded.
+
+        """
+        hed_versions = hed_cache.get_all_hed_versions(local_hed_directory)
+        for hed_version in hed_versions:
+            self.get_version_hed_dictionary(hed_version, local_hed_directory)
+        return hed_versions
+
+    def get_version_hed_dictionary(self, hed_version=None, local_hed_directory=None):
+        """Gets the HedDictionary of a HED version in the HED cache.
+
+        Parameters
+        ----------
+        hed_version: str
+            The HED version. The latest version in the HED cache is used if not given.
+        local_hed_directory: str
+            The directory containing the HED XML files. Defaults to the HED cache directory.
+
+        Returns
+        -------
+        HedDictionary
+            The shared HedDictionary of the HED version.
+
+        """
+        if hed_version:
+            hed_xml_file_path = hed_cache.get_path_from_hed_version(hed_version, local_hed_directory)
+        else:
+            hed_xml_file_path = hed_cache.get_latest_hed_version_path(local_hed_directory)
+        key = os.path.realpath(hed_xml_file_path)
+        with self._lock:
+            hed_dictionary = self._version_dictionaries.get(key)
+            if hed_dictionary is not None:
+                self.version_hits += 1
+                return hed_dictionary
+            self.version_misses += 1
+        hed_dictionary = HedDictionary(hed_xml_file_path)
+        with self._lock:
+            return self._version_dictionaries.setdefault(key, hed_dictionary)
+
+    def get_uploaded_hed_dictionary(self, hed_file_object, upload_folder=None):
+        """Gets the HedDictionary of an uploaded HED XML file.
+
+        The file is only saved to disk and parsed if a file with the same content has not been uploaded recently.
+
+        Parameters
+        ----------
+        hed_file_object: File object
+            A file object that points to the uploaded HED XML file.
+        upload_folder: str
+            The folder that the file is saved to while it is parsed. Defaults to the temporary directory.
+
+        Returns
+        -------
+        HedDictionary
+            The shared HedDictionary of the HED XML file.
+
+        """
+        hed_xml_content = hed_file_object.read()
+        if isinstance(hed_xml_content, str):
+            hed_xml_content = hed_xml_content.encode('utf-8')
+        key = hashlib.sha256(hed_xml_content).hexdigest()
+        with self._lock:
+            hed_dictionary = self._uploaded_dictionaries.get(key)
+            if hed_dictionary is not None:
+                self._uploaded_dictionaries.move_to_end(key)
+                self.uploaded_hits += 1
+                return hed_dictionary
+            self.uploaded_misses += 1
+        hed_dictionary = self._build_hed_dictionary_from_content(hed_xml_content, upload_folder)
+        with self._lock:
+            hed_dictionary = self._uploaded_dictionaries.setdefault(key, hed_dictionary)
+            self._uploaded_dictionaries.move_to_end(key)
+            while len(self._uploaded_dictionaries) > self.max_uploaded_schemas:
+                self._uploaded_dictionaries.popitem(last=False)
+                self.uploaded_evictions += 1
+        return hed_dictionary
+
+    def get_cache_info(self):
+        """Gets the contents and hit and miss counters of the pool.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the number of loaded HED versions and uploaded schemas and the counters for each.
+
+        """
+        with self._lock:
+            return {'versions': {'size': len(self._version_dictionaries), 'hits': self.version_hits,
+                                 'misses': self.version_misses},
+                    'uploaded': {'size': len(self._uploaded_dictionaries), 'max_size': self.max_uploaded_schemas,
+                                 'hits': self.uploaded_hits, 'misses': self.uploaded_misses,
+                                 'evictions': self.uploaded_evictions}}
+
+    @staticmethod
+    def _build_hed_dictionary_from_content(hed_xml_content, upload_folder=None):
+        """Builds a HedDictionary from the content of a HED XML file.
+
+        Parameters
+        ----------
+        hed_xml_content: bytes
+            The content of the HED XML file.
+        upload_folder: str
+            The folder that the content is saved to while it is parsed.
+
+        Returns
+        -------
+        HedDictionary
+            The HedDictionary built from the content.
+
+        """
+        hed_xml_file = tempfile.NamedTemporaryFile(suffix='.xml', delete=False, dir=upload_folder)
+        try:
+            with hed_xml_file:
+                hed_xml_file.write(hed_xml_content)
+            return HedDictionary(hed_xml_file.name)
+        finally:
+            delete_file_if_it_exist(hed_xml_file.name)
+
+
+_schema_pool = None
+_schema_pool_lock = threading.Lock()
+
+
+def get_schema_pool(max_uploaded_schemas=DEFAULT_MAX_UPLOADED_SCHEMAS):
+    """Gets the schema pool shared by the web process, creating it the first time it is needed.
+
+    Parameters
+    ----------
+    max_uploaded_schemas: int
+        The maximum number of uploaded schemas to keep. Only used when the schema pool is created.
+
+    Returns
+    -------
+    SchemaPool
+        The shared SchemaPool object.
+
+    """
+    global _schema_pool
+    with _schema_pool_lock:
+        if _schema_pool is None:
+            _schema_pool = SchemaPool(max_uploaded_schemas=max_uploaded_schemas)
+        return _schema_pool
@@ -1,4 +1,4 @@
-const EXCEL_FILE_EXTENSIONS = ['xlsx', 'xls'];
+const EXCEL_FILE_EXTENSIONS = ['xlsx'];
 const XML_FILE_EXTENSIONS = ['xml'];
 const TEXT_FILE_EXTENSIONS = ['tsv', 'txt'];
 const OTHER_HED_VERSION_OPTION = 'Other';
@@ -134,7 +134,7 @@ function updateHEDFileLabel(hedPath) {
  * Flash message when Excel workbook file extension is invalid.
  */
 function flashInvalidExcelExtensionMessage() {
-    flashMessageOnScreen('Please upload a excel or text spreadsheet (.xlsx, .xls, .tsv, .txt)',
+    flashMessageOnScreen('Please upload an excel or text spreadsheet (.xlsx, .tsv, .txt)',
         'error', 'spreadsheet-flash');
 }
 
@@ -296,17 +296,22 @@ function submitForm() {
             data: formData,
             contentType: false,
             processData: false,
-            dataType: 'json',
-            success: function (validationStatus) {
-                if (checkIssueCount(validationStatus['issueCount'], validationStatus['errorCount'],
-                    validationStatus['warningCount'])) {
-                    downloadValidationOutputFile(validationStatus['downloadFile']);
-                } else {
-                    deleteUploadedSpreadsheet(validationStatus['downloadFile']);
-                }
+            xhrFields: {
+                responseType: 'blob'
             },
-            error: function (jqXHR) {
-                console.log(jqXHR.responseJSON.message);
+            success: function (validationIssues, status, jqXHR) {
+                validationIssues.text().then(function (validationIssuesText) {
+                    var summary = getValidationSummary(validationIssuesText);
+                    if (summary === null) {
+                        flashMessageOnScreen('Spreadsheet could not be processed', 'error', 'submit-flash');
+                    } else if (checkIssueCount(summary.errorCount + summary.warningCount, summary.errorCount,
+                        summary.warningCount)) {
+                        downloadValidationOutputFile(validationIssues,
+                            getAttachmentFilename(jqXHR.getResponseHeader('Content-Disposition')));
+                    }
+                });
+            },
+            error: function () {
                 flashMessageOnScreen('Spreadsheet could not be processed', 'error',
                     'submit-flash');
             }
@@ -316,34 +321,43 @@ function submitForm() {
 }
 
 /**
- * Downloads the validation output file.
+ * Gets the issue counts from the summary line that ends the validation issues streamed back by the server.
+ * @param {string} validationIssuesText - The validation issues.
+ * @returns {Object} - The errorCount and warningCount of the summary, or null if the stream has no summary.
+ */
+function getValidationSummary(validationIssuesText) {
+    var summary = validationIssuesText.match(/Validation summary: (\d+) errors, (\d+) warnings\n$/);
+    if (summary === null) {
+        return null;
+    }
+    return {errorCount: parseInt(summary[1], 10), warningCount: parseInt(summary[2], 10)};
+}
+
+/**
+ * Saves the validation issues streamed back by the server as a file.
+ * @param {Blob} validationIssues - The validation issues.
  * @param {string} downloadFile - The name of the download file.
  */
-function downloadValidationOutputFile(downloadFile) {
-    window.location = "{{url_for('route_blueprint.download_file_in_upload_directory', filename='')}}" + downloadFile;
+function downloadValidationOutputFile(validationIssues, downloadFile) {
+    var downloadUrl = URL.createObjectURL(validationIssues);
+    var downloadLink = document.createElement('a');
+    downloadLink.href = downloadUrl;
+    downloadLink.download = downloadFile;
+    document.body.appendChild(downloadLink);
+    downloadLink.click();
+    document.body.removeChild(downloadLink);
+    URL.revokeObjectURL(downloadUrl);
 }
 
 
 /**
- * Deletes the uploaded spreadsheet after the validation is done.
- * @param {string} uploadedSpreadsheetFile - The name of the uploaded spreadsheet.
+ * Gets the name of an attachment from the Content-Disposition header of a response.
+ * @param {string} contentDisposition - The Content-Disposition header.
+ * @returns {string} - The name of the attachment.
  */
-function deleteUploadedSpreadsheet(uploadedSpreadsheetFile) {
-    $.ajax({
-            type: 'GET',
-            url: "{{url_for('route_blueprint.delete_file_in_upload_directory', filename='')}}" + uploadedSpreadsheetFile,
-            data: {},
-            contentType: false,
-            processData: false,
-            dataType: 'json',
-            success: function () {
-            },
-            error: function (jqXHR) {
-                console.log(jqXHR.responseJSON.message);
-            }
-        }
-    )
-    ;
+function getAttachmentFilename(contentDisposition) {
+    var match = /filename=([^;]+)/.exec(contentDisposition || '');
+    return match ? match[1].trim() : 'validation_issues.txt';
 }
 
 
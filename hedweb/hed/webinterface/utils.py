@@ -1,7 +1,7 @@
 import os
 import json
-import xlrd
 import traceback
+import zlib
 from flask import Response
 from werkzeug.utils import secure_filename
 from flask import current_app
@@ -12,6 +12,7 @@ from hed.validator.hed_validator import HedValidator
 from hed.util import hed_cache
 from hed.util.hed_dictionary import HedDictionary
 from hed.util.hed_file_input import HedFileInput
+from hed.webinterface import schema_pool, validation_jobs
 from hed.webinterface.constants.other import file_extension_constants, spreadsheet_constants, type_constants
 from hed.webinterface.constants.error import error_constants
 from hed.webinterface.constants.form import python_form_constants, validation_arg_constants, js_form_constants, \
@@ -20,6 +21,14 @@ from hed.webinterface.web_utils import _save_hed_to_upload_folder_if_present, _f
     UPLOAD_DIRECTORY_KEY, _save_file_to_upload_folder
 
 app_config = current_app.config
+VALIDATION_JOB_WORKERS_KEY = 'VALIDATION_JOB_WORKERS'
+UPLOADED_SCHEMA_POOL_SIZE_KEY = 'UPLOADED_SCHEMA_POOL_SIZE'
+COMPRESS_VALIDATION_STREAM_KEY = 'COMPRESS_VALIDATION_STREAM'
+VALIDATION_STREAM_CHUNK_SIZE = 8192
+VALIDATION_STREAM_ERROR_CODE = 'validationFailed'
+VALIDATION_STREAM_ERROR_MESSAGE = 'ERROR: Validation failed before the whole file was validated.\n'
+VALIDATION_STREAM_SUMMARY_CODE = 'validationSummary'
+VALIDATION_STREAM_SUMMARY_MESSAGE = 'Validation summary: %(error_count)d errors, %(warning_count)d warnings\n'
 
 
 def find_hed_version_in_file(form_request_object):
@@ -136,8 +145,14 @@ def find_spreadsheet_columns_info(form_request_object):
     return spreadsheet_columns_info
 
 
-def report_spreadsheet_validation_status(form_request_object):
-    """Reports the spreadsheet validation status.
+def generate_spreadsheet_validation_response(form_request_object):
+    """Validates the spreadsheet in the validation form and streams the validation issues back as an attachment.
+
+    The issues of each row are sent as soon as the row is validated, so no issues file is written to the upload
+    folder. The stream is gzip compressed when the application is configured to compress it and the client accepts
+    gzip. If the validation fails after the stream has started, an error line reports the failure. The stream always
+    ends with a summary line giving the number of errors and warnings, which the validation form reads. The uploaded
+    files are deleted when the stream ends.
 
     Parameters
     ----------
@@ -146,11 +161,151 @@ def report_spreadsheet_validation_status(form_request_object):
 
     Returns
     -------
-    string
-        A serialized JSON string containing information related to the worksheet columns. If the validation fails then a
-        500 error message is returned.
+    Response object or dictionary
+        A response object streaming the validation issues. If the validation cannot be started then a dictionary
+        containing the error is returned.
     """
-    validation_status = {}
+    spreadsheet_file_path = ''
+    hed_file_path = ''
+    try:
+        spreadsheet_file_path, hed_file_path = _get_uploaded_file_paths_from_forms(form_request_object)
+        original_spreadsheet_filename = _get_original_spreadsheet_filename(form_request_object)
+        validation_arguments = _generate_input_arguments_from_validation_form(
+            form_request_object, spreadsheet_file_path, hed_file_path)
+        hed_validator = HedValidator([],
+                                     check_for_warnings=validation_arguments[validation_arg_constants.CHECK_FOR_WARNINGS],
+                                     hed_xml_file=validation_arguments[validation_arg_constants.HED_XML_PATH])
+        file_input_object = _get_file_input_object(validation_arguments, read_only=True)
+    except:
+        delete_file_if_it_exist(spreadsheet_file_path)
+        delete_file_if_it_exist(hed_file_path)
+        return {error_constants.ERROR_KEY: traceback.format_exc()}
+    validation_issues_filename = _generate_spreadsheet_validation_filename(
+        original_spreadsheet_filename, validation_arguments[validation_arg_constants.WORKSHEET_NAME])
+    headers = {'Content-Disposition': "attachment; filename=%s" % validation_issues_filename}
+    compress = app_config.get(COMPRESS_VALIDATION_STREAM_KEY, False) and \
+        'gzip' in form_request_object.accept_encodings
+    if compress:
+        headers['Content-Encoding'] = 'gzip'
+        headers['Vary'] = 'Accept-Encoding'
+
+    def generate():
+        try:
+            with file_input_object:
+                validation_issues = _append_validation_summary(_end_validation_issues_on_error(
+                    hed_validator.iter_validation_issues(file_input_object)))
+                yield from _generate_validation_stream_chunks(validation_issues, compress=compress)
+        finally:
+            delete_file_if_it_exist(spreadsheet_file_path)
+            delete_file_if_it_exist(hed_file_path)
+
+    return Response(generate(), mimetype='text/plain', headers=headers)
+
+
+def _end_validation_issues_on_error(validation_issues):
+    """Passes the validation issues through and ends them with an error issue if the validation fails.
+
+    The response status has already been sent when the validation issues are streamed, so an exception raised during
+    the validation is reported as the last line of the stream instead of ending the download early.
+
+    Parameters
+    ----------
+    validation_issues: iterable
+        The validation issues. Each issue is a dictionary containing the code and message of the issue.
+
+    Yields
+    -------
+    dictionary
+        The next validation issue. If the validation fails, the last issue contains the error and its traceback.
+    """
+    try:
+        yield from validation_issues
+    except Exception:
+        yield {'code': VALIDATION_STREAM_ERROR_CODE,
+               'message': VALIDATION_STREAM_ERROR_MESSAGE + traceback.format_exc()}
+
+
+def _append_validation_summary(validation_issues):
+    """Passes the validation issues through, counting them, and ends them with a summary issue.
+
+    Parameters
+    ----------
+    validation_issues: iterable
+        The validation issues. Each issue is a dictionary containing the code and message of the issue.
+
+    Yields
+    -------
+    dictionary
+        The next validation issue. The last issue is the summary, whose message gives the number of errors and
+        warnings.
+    """
+    error_count = 0
+    warning_count = 0
+    for validation_issue in validation_issues:
+        if HedValidator.count_errors((validation_issue,)):
+            error_count += 1
+        elif validation_issue['code'] not in HedValidator.ISSUE_LOCATION_CODES:
+            warning_count += 1
+        yield validation_issue
+    yield {'code': VALIDATION_STREAM_SUMMARY_CODE,
+           'message': VALIDATION_STREAM_SUMMARY_MESSAGE % {'error_count': error_count,
+                                                           'warning_count': warning_count}}
+
+
+def _generate_validation_stream_chunks(validation_issues, compress=False):
+    """Generates the chunks of a stream containing the messages of the validation issues.
+
+    Messages are buffered until a chunk is large enough to send, so a file with many small issues is not sent one
+    message at a time.
+
+    Parameters
+    ----------
+    validation_issues: iterable
+        The validation issues. Each issue is a dictionary containing the code and message of the issue.
+    compress: bool
+        True if the chunks should form a gzip stream. Each compressed chunk is flushed so the client can decompress it
+        as soon as it arrives.
+
+    Yields
+    -------
+    bytes
+        The next chunk of the stream.
+    """
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS) if compress else None
+    buffered_messages = []
+    buffered_size = 0
+    for validation_issue in validation_issues:
+        buffered_messages.append(validation_issue['message'])
+        buffered_size += len(validation_issue['message'])
+        if buffered_size >= VALIDATION_STREAM_CHUNK_SIZE:
+            chunk = ''.join(buffered_messages).encode('utf-8')
+            buffered_messages = []
+            buffered_size = 0
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH) if compressor else chunk
+    chunk = ''.join(buffered_messages).encode('utf-8')
+    if compressor:
+        yield compressor.compress(chunk) + compressor.flush()
+    elif chunk:
+        yield chunk
+
+
+def submit_spreadsheet_validation_job(form_request_object):
+    """Queues a job that validates the spreadsheet in the validation form.
+
+    The uploaded files are saved to the upload folder and deleted when the job finishes. The job status is reported by
+    find_validation_job_status and the validation issues are downloaded from the upload folder when it completes.
+
+    Parameters
+    ----------
+    form_request_object: Request object
+        A Request object containing user data from the validation form.
+
+    Returns
+    -------
+    dictionary
+        A dictionary containing the id of the job.
+    """
+    job_info = {}
     spreadsheet_file_path = ''
     hed_file_path = ''
     try:
@@ -158,26 +313,112 @@ def report_spreadsheet_validation_status(form_request_object):
         original_spreadsheet_filename = _get_original_spreadsheet_filename(form_request_object)
         validation_input_arguments = _generate_input_arguments_from_validation_form(
             form_request_object, spreadsheet_file_path, hed_file_path)
-        hed_input_reader = validate_spreadsheet(validation_input_arguments)
-        tag_validator = hed_input_reader.get_tag_validator()
-        validation_issues = hed_input_reader.get_validation_issues()
-        validation_status[js_form_constants.DOWNLOAD_FILE] = _save_validation_issues_to_file_in_upload_folder(
-            original_spreadsheet_filename, validation_issues,
-            validation_input_arguments[validation_arg_constants.WORKSHEET_NAME])
-        validation_status[js_form_constants.ISSUE_COUNT] = tag_validator.get_issue_count()
-        validation_status[js_form_constants.ERROR_COUNT] = tag_validator.get_error_count()
-        validation_status[js_form_constants.WARNING_COUNT] = tag_validator.get_warning_count()
+        job_manager = validation_jobs.get_job_manager(
+            app_config.get(VALIDATION_JOB_WORKERS_KEY, validation_jobs.DEFAULT_MAX_WORKERS))
+        job_info[js_form_constants.JOB_ID] = job_manager.submit(
+            _run_spreadsheet_validation_job, validation_input_arguments, original_spreadsheet_filename,
+            app_config[UPLOAD_DIRECTORY_KEY], [spreadsheet_file_path, hed_file_path])
     except:
-        validation_status[error_constants.ERROR_KEY] = traceback.format_exc()
-    finally:
+        job_info[error_constants.ERROR_KEY] = traceback.format_exc()
         delete_file_if_it_exist(spreadsheet_file_path)
         delete_file_if_it_exist(hed_file_path)
+    return job_info
+
+
+def find_validation_job_status(job_id):
+    """Finds the status of a spreadsheet validation job.
+
+    Parameters
+    ----------
+    job_id: string
+        The id of the job.
+
+    Returns
+    -------
+    dictionary
+        A dictionary containing the job status, the number of rows validated, and the number of issues found so far.
+        When the job is completed it also contains the validation status. None if there is no job with the id.
+    """
+    return validation_jobs.get_job_manager(
+        app_config.get(VALIDATION_JOB_WORKERS_KEY, validation_jobs.DEFAULT_MAX_WORKERS)).get_job(job_id)
+
+
+def _run_spreadsheet_validation_job(job_id, report_progress, validation_arguments, spreadsheet_filename,
+                                    upload_folder, uploaded_file_paths):
+    """Validates a spreadsheet in a job worker thread.
+
+    Parameters
+    ----------
+    job_id: string
+        The id of the job. It is part of the name of the validation issues file, so jobs for spreadsheets with the same
+        name do not overwrite each other's issues.
+    report_progress: function
+        A function that stores the progress of the job in the job record.
+    validation_arguments: dictionary
+        A dictionary containing the arguments for the validation function.
+    spreadsheet_filename: string
+        The name of the spreadsheet.
+    upload_folder: string
+        The path to the upload folder.
+    uploaded_file_paths: list
+        The paths of the uploaded files, which are deleted when the validation finishes.
+
+    Returns
+    -------
+    dictionary
+        A dictionary containing the validation status.
+    """
+    def report_row_progress(rows_processed, issue_count):
+        report_progress(**{js_form_constants.ROWS_PROCESSED: rows_processed,
+                           js_form_constants.ISSUE_COUNT: issue_count})
+
+    try:
+        return _validate_spreadsheet_and_save_issues(validation_arguments, spreadsheet_filename, upload_folder,
+                                                     progress_callback=report_row_progress, job_id=job_id)
+    finally:
+        for uploaded_file_path in uploaded_file_paths:
+            delete_file_if_it_exist(uploaded_file_path)
+
+
+def _validate_spreadsheet_and_save_issues(validation_arguments, spreadsheet_filename, upload_folder,
+                                          progress_callback=None, job_id=''):
+    """Validates the spreadsheet and saves the validation issues to a file in the upload folder.
+
+    Parameters
+    ----------
+    validation_arguments: dictionary
+        A dictionary containing the arguments for the validation function.
+    spreadsheet_filename: string
+        The name of the spreadsheet.
+    upload_folder: string
+        The path to the upload folder.
+    progress_callback: function
+        A function that is passed the number of rows validated and the number of issues found so far.
+    job_id: string
+        The id of the job that validates the spreadsheet, which is added to the name of the validation issues file.
+
+    Returns
+    -------
+    dictionary
+        A dictionary containing the name of the validation issues file and the issue counts.
+    """
+    validation_status = {}
+    hed_input_reader = validate_spreadsheet(validation_arguments, progress_callback=progress_callback)
+    tag_validator = hed_input_reader.get_tag_validator()
+    validation_issues = hed_input_reader.get_validation_issues()
+    validation_status[js_form_constants.DOWNLOAD_FILE] = _save_validation_issues_to_file_in_upload_folder(
+        spreadsheet_filename, validation_issues, validation_arguments[validation_arg_constants.WORKSHEET_NAME],
+        upload_folder=upload_folder, job_id=job_id)
+    validation_status[js_form_constants.ISSUE_COUNT] = tag_validator.get_issue_count()
+    validation_status[js_form_constants.ERROR_COUNT] = tag_validator.get_error_count()
+    validation_status[js_form_constants.WARNING_COUNT] = tag_validator.get_warning_count()
     return validation_status
 
 
 def report_eeg_events_validation_status(request):
     """Reports validation status of hed strings associated with EEG events
-       received from EEGLAB plugin HEDTools
+       received from EEGLAB plugin HEDTools. The HED schema is taken from the schema pool, so it is only parsed the
+       first time it is used.
 
     Parameters
     ----------
@@ -196,17 +437,19 @@ def report_eeg_events_validation_status(request):
     # Parse uploaded data
     form_data = request.form
     check_for_warnings = form_data["check_for_warnings"] == '1' if "check_for_warnings" in form_data else False
-    # if hed_xml_file was submitted, it's accessed by request.files, otherwise empty
-    if "hed_xml_file" in request.files and get_file_extension(request.files["hed_xml_file"].filename) == "xml":
-        hed_xml_file = _save_hed_to_upload_folder_if_present(request.files["hed_xml_file"])
-    else:
-        hed_xml_file = ''
 
     try:
+        # if hed_xml_file was submitted, it's accessed by request.files, otherwise the latest version is used
+        if "hed_xml_file" in request.files and get_file_extension(request.files["hed_xml_file"].filename) == ".xml":
+            hed_dictionary = get_schema_pool().get_uploaded_hed_dictionary(request.files["hed_xml_file"],
+                                                                           app_config[UPLOAD_DIRECTORY_KEY])
+        else:
+            hed_dictionary = get_schema_pool().get_version_hed_dictionary()
         # parse hed_strings from json
         hed_strings = json.loads(form_data["hed_strings"])
         # hed_strings is a list of HED strings associated with events in EEG.event (order preserved)
-        hed_input_reader = HedValidator(hed_strings, check_for_warnings=check_for_warnings, hed_xml_file=hed_xml_file)
+        hed_input_reader = HedValidator(hed_strings, check_for_warnings=check_for_warnings,
+                                        hed_dictionary=hed_dictionary)
         # issues is a list of lists. Element list is empty if no error,
         # else is a list of dictionaries, each dictionary contains an error-message key-value pair
         issues = hed_input_reader.get_validation_issues()
@@ -215,12 +458,33 @@ def report_eeg_events_validation_status(request):
         validation_status["issues"] = issues
     except:
         validation_status[error_constants.ERROR_KEY] = traceback.format_exc()
-    finally:
-        delete_file_if_it_exist(hed_xml_file)
 
     return validation_status
 
 
+def get_schema_pool():
+    """Gets the schema pool shared by the web process.
+
+    Returns
+    -------
+    SchemaPool object
+        The shared SchemaPool object.
+    """
+    return schema_pool.get_schema_pool(
+        app_config.get(UPLOADED_SCHEMA_POOL_SIZE_KEY, schema_pool.DEFAULT_MAX_UPLOADED_SCHEMAS))
+
+
+def find_schema_pool_info():
+    """Gets the number of schemas in the schema pool and its hit and miss counters.
+
+    Returns
+    -------
+    dictionary
+        A dictionary containing the schema pool statistics.
+    """
+    return get_schema_pool().get_cache_info()
+
+
 def _get_uploaded_file_paths_from_forms(form_request_object):
     """Gets the other paths of the uploaded files in the form.
 
@@ -233,12 +497,18 @@ def _get_uploaded_file_paths_from_forms(form_request_object):
     -------
     tuple
         A tuple containing the other paths. The two other paths are for the spreadsheet and a optional HED XML other.
+
+    Raises
+    ------
+    ValueError
+        If the spreadsheet does not have an accepted extension, such as a legacy .xls workbook.
     """
     spreadsheet_file_path = ''
     hed_file_path = ''
-    if spreadsheet_present_in_form(form_request_object) and _file_has_valid_extension(
-            form_request_object.files[js_form_constants.SPREADSHEET_FILE],
-            spreadsheet_constants.SPREADSHEET_FILE_EXTENSIONS):
+    if spreadsheet_present_in_form(form_request_object):
+        if not _file_has_valid_extension(form_request_object.files[js_form_constants.SPREADSHEET_FILE],
+                                         spreadsheet_constants.SPREADSHEET_FILE_EXTENSIONS):
+            raise ValueError(error_constants.INVALID_SPREADSHEET_EXTENSION)
         spreadsheet_file_path = save_spreadsheet_to_upload_folder(
             form_request_object.files[js_form_constants.SPREADSHEET_FILE])
     if hed_present_in_form(form_request_object) and _file_has_valid_extension(
@@ -306,7 +576,8 @@ def setup_logging():
         current_app.logger.addHandler(file_handler)
 
 
-def _save_validation_issues_to_file_in_upload_folder(spreadsheet_filename, validation_issues, worksheet_name=''):
+def _save_validation_issues_to_file_in_upload_folder(spreadsheet_filename, validation_issues, worksheet_name='',
+                                                     upload_folder=None, job_id=''):
     """Saves the validation issues found to a other in the upload folder.
 
     Parameters
@@ -317,6 +588,11 @@ def _save_validation_issues_to_file_in_upload_folder(spreadsheet_filename, valid
         The name of the spreadsheet worksheet.
     validation_issues: string
         A string containing the validation issues.
+    upload_folder: string
+        The path to the upload folder. The upload folder of the current application is used if not given.
+    job_id: string
+        The id of the job that validated the spreadsheet. If given, it is added to the name of the output other so the
+        issues of spreadsheets with the same name do not overwrite each other.
 
     Returns
     -------
@@ -325,7 +601,12 @@ def _save_validation_issues_to_file_in_upload_folder(spreadsheet_filename, valid
 
     """
     validation_issues_filename = _generate_spreadsheet_validation_filename(spreadsheet_filename, worksheet_name)
-    validation_issues_file_path = os.path.join(current_app.config[UPLOAD_DIRECTORY_KEY], validation_issues_filename)
+    if job_id:
+        validation_issues_filename, extension = os.path.splitext(validation_issues_filename)
+        validation_issues_filename += '_' + secure_filename(job_id) + extension
+    if upload_folder is None:
+        upload_folder = current_app.config[UPLOAD_DIRECTORY_KEY]
+    validation_issues_file_path = os.path.join(upload_folder, validation_issues_filename)
     with open(validation_issues_file_path, 'w', encoding='utf-8') as validation_issues_file:
         for val_issue in validation_issues:
             validation_issues_file.write(val_issue['message'])
@@ -503,28 +784,50 @@ def _get_optional_validation_form_field(validation_form_request_object, form_fie
     return form_field_value
 
 
-def validate_spreadsheet(validation_arguments):
+def validate_spreadsheet(validation_arguments, progress_callback=None):
     """Validates the spreadsheet.
 
     Parameters
     ----------
     validation_arguments: dictionary
         A dictionary containing the arguments for the validation function.
+    progress_callback: function
+        A function that is passed the number of rows validated and the number of issues found so far.
 
     Returns
     -------
     HedValidator object
         A HedValidator object containing the validation results.
     """
-    file_input_object = HedFileInput(validation_arguments[validation_arg_constants.SPREADSHEET_PATH],
-                                     worksheet_name=validation_arguments[validation_arg_constants.WORKSHEET_NAME],
-                                     tag_columns=validation_arguments[validation_arg_constants.TAG_COLUMNS],
-                                     has_column_names=validation_arguments[validation_arg_constants.HAS_COLUMN_NAMES],
-                                     column_prefix_dictionary=validation_arguments[validation_arg_constants.COLUMN_PREFIX_DICTIONARY]
-                                     )
-    return HedValidator(file_input_object,
-                        check_for_warnings=validation_arguments[validation_arg_constants.CHECK_FOR_WARNINGS],
-                        hed_xml_file=validation_arguments[validation_arg_constants.HED_XML_PATH])
+    file_input_object = _get_file_input_object(validation_arguments)
+    with file_input_object:
+        return HedValidator(file_input_object,
+                            check_for_warnings=validation_arguments[validation_arg_constants.CHECK_FOR_WARNINGS],
+                            hed_xml_file=validation_arguments[validation_arg_constants.HED_XML_PATH],
+                            progress_callback=progress_callback)
+
+
+def _get_file_input_object(validation_arguments, read_only=False):
+    """Opens the spreadsheet in the validation arguments.
+
+    Parameters
+    ----------
+    validation_arguments: dictionary
+        A dictionary containing the arguments for the validation function.
+    read_only: bool
+        True if the spreadsheet will only be read.
+
+    Returns
+    -------
+    HedFileInput object
+        A HedFileInput object for the spreadsheet.
+    """
+    return HedFileInput(validation_arguments[validation_arg_constants.SPREADSHEET_PATH],
+                        worksheet_name=validation_arguments[validation_arg_constants.WORKSHEET_NAME],
+                        tag_columns=validation_arguments[validation_arg_constants.TAG_COLUMNS],
+                        has_column_names=validation_arguments[validation_arg_constants.HAS_COLUMN_NAMES],
+                        column_prefix_dictionary=validation_arguments[validation_arg_constants.COLUMN_PREFIX_DICTIONARY],
+                        read_only=read_only)
 
 
 def spreadsheet_present_in_form(validation_form_request_object):
@@ -635,9 +938,10 @@ def _populate_worksheets_info_dictionary(worksheets_info, spreadsheet_file_path)
         A dictionary populated with information related to the Excel worksheets.
 
     """
-    worksheets_info[js_form_constants.WORKSHEET_NAMES] = _get_excel_worksheet_names(spreadsheet_file_path)
-    worksheets_info[js_form_constants.COLUMN_NAMES] = \
-        _get_worksheet_column_names(spreadsheet_file_path, worksheets_info[js_form_constants.WORKSHEET_NAMES][0])
+    with HedFileInput(spreadsheet_file_path, read_only=True) as spreadsheet_input:
+        worksheets_info[js_form_constants.WORKSHEET_NAMES] = _get_excel_worksheet_names(spreadsheet_input)
+        worksheets_info[js_form_constants.COLUMN_NAMES] = \
+            _get_worksheet_column_names(spreadsheet_input, worksheets_info[js_form_constants.WORKSHEET_NAMES][0])
     worksheets_info[js_form_constants.TAG_COLUMN_INDICES] = _get_spreadsheet_other_tag_column_indices(
         worksheets_info[js_form_constants.COLUMN_NAMES])
     worksheets_info[js_form_constants.REQUIRED_TAG_COLUMN_INDICES] = \
@@ -667,9 +971,10 @@ def _populate_spreadsheet_columns_info_dictionary(spreadsheet_columns_info, spre
 
     """
     if worksheet_name:
-        spreadsheet_columns_info[js_form_constants.COLUMN_NAMES] = _get_worksheet_column_names(
-            spreadsheet_file_path,
-            worksheet_name)
+        with HedFileInput(spreadsheet_file_path, worksheet_name=worksheet_name, read_only=True) as spreadsheet_input:
+            spreadsheet_columns_info[js_form_constants.COLUMN_NAMES] = _get_worksheet_column_names(
+                spreadsheet_input,
+                worksheet_name)
     else:
         column_delimiter = _get_column_delimiter_based_on_file_extension(spreadsheet_file_path)
         spreadsheet_columns_info[js_form_constants.COLUMN_NAMES] = _get_text_file_column_names(
@@ -780,13 +1085,13 @@ def save_hed_to_upload_folder(hed_file_object):
     return hed_file_path
 
 
-def _get_excel_worksheet_names(workbook_file_path):
+def _get_excel_worksheet_names(spreadsheet_input):
     """Gets the worksheet names in an Excel workbook.
 
     Parameters
     ----------
-    workbook_file_path: string
-        The full path to an Excel workbook other.
+    spreadsheet_input: HedFileInput
+        A HedFileInput object with the Excel workbook opened.
 
     Returns
     -------
@@ -794,9 +1099,7 @@ def _get_excel_worksheet_names(workbook_file_path):
         A list containing the worksheet names in an Excel workbook.
 
     """
-    opened_workbook_file = xlrd.open_workbook(workbook_file_path)
-    worksheet_names = opened_workbook_file.sheet_names()
-    return worksheet_names
+    return spreadsheet_input.get_worksheet_names()
 
 
 def _get_spreadsheet_other_tag_column_indices(column_names):
@@ -890,13 +1193,13 @@ def _find_str_index_in_list(list_of_strs, str_value):
         return -1
 
 
-def _get_worksheet_column_names(workbook_file_path, worksheet_name):
+def _get_worksheet_column_names(spreadsheet_input, worksheet_name):
     """Get the worksheet columns in a Excel workbook.
 
     Parameters
     ----------
-    workbook_file_path : string
-        The full path to an Excel workbook other.
+    spreadsheet_input : HedFileInput
+        A HedFileInput object with the Excel workbook opened.
     worksheet_name : string
         The name of an Excel worksheet.
 
@@ -906,7 +1209,4 @@ def _get_worksheet_column_names(workbook_file_path, worksheet_name):
         A list containing the worksheet columns in an Excel workbook.
 
     """
-    opened_workbook_file = xlrd.open_workbook(workbook_file_path)
-    opened_worksheet = opened_workbook_file.sheet_by_name(worksheet_name)
-    worksheet_column_names = [opened_worksheet.cell(0, col_index).value for col_index in range(opened_worksheet.ncols)]
-    return worksheet_column_names
+    return spreadsheet_input.get_column_names(worksheet_name)
@@ -0,0 +1,244 @@
+"""
+This module contains the JobManager class which runs validation jobs in a bounded pool of worker threads so that a
+large upload does not hold on to the HTTP request that submitted it. Job records are kept in a pluggable backend. The
+InMemoryJobBackend keeps them in the web process and needs no external broker.
+
+"""
+
+import threading
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from hed.webinterface.constants.error import error_constants
+from hed.webinterface.constants.form import js_form_constants
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_MAX_FINISHED_JOBS = 1000
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_COMPLETED = 'completed'
+JOB_FAILED = 'failed'
+FINISHED_JOB_STATUSES = (JOB_COMPLETED, JOB_FAILED)
+
+
+class InMemoryJobBackend:
+    def __init__(self, max_finished_jobs=DEFAULT_MAX_FINISHED_JOBS):
+        """Constructor for the InMemoryJobBackend class.
+
+        Parameters
+        ----------
+        max_finished_jobs: int
+            The maximum number of completed or failed jobs to keep. The oldest finished job is removed when there are
+            more.
+
+        Returns
+        -------
+        InMemoryJobBackend
+            An InMemoryJobBackend object.
+
+        """
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create_job(self, job_id, job):
+        """Adds a job record.
+
+        Parameters
+        ----------
+        job_id: str
+            The id of the job.
+        job: dict
+            The job record.
+
+        Returns
+        -------
+
+        """
+        with self._lock:
+            self._jobs[job_id] = dict(job)
+
+    def update_job(self, job_id, **fields):
+        """Updates the fields of a job record.
+
+        Parameters
+        ----------
+        job_id: str
+            The id of the job.
+        fields: dict
+            The fields to update.
+
+        Returns
+        -------
+
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(fields)
+            if job[js_form_constants.JOB_STATUS] in FINISHED_JOB_STATUSES:
+                self._jobs.move_to_end(job_id)
+                self._remove_old_finished_jobs()
+
+    def get_job(self, job_id):
+        """Gets a copy of a job record.
+
+        Parameters
+        ----------
+        job_id: str
+            The id of the job.
+
+        Returns
+        -------
+        dict
+            A copy of the job record. None if there is no job with the id.
+
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return dict(job)
+
+    def _remove_old_finished_jobs(self):
+        """Removes the oldest finished jobs while there are more than max_finished_jobs of them."""
+        finished_job_ids = [job_id for job_id, job in self._jobs.items()
+                            if job[js_form_constants.JOB_STATUS] in FINISHED_JOB_STATUSES]
+        for job_id in finished_job_ids[:max(len(finished_job_ids) - self.max_finished_jobs, 0)]:
+            del self._jobs[job_id]
+
+
+class JobManager:
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, backend=None):
+        """Constructor for the JobManager class.
+
+        Parameters
+        ----------
+        max_workers: int
+            The number of jobs that can run at the same time. Other jobs wait in the queue.
+        backend: object
+            The object that stores the job records. It needs create_job, update_job, and get_job methods like the
+            InMemoryJobBackend, which is used by default.
+
+        Returns
+        -------
+        JobManager
+            A JobManager object.
+
+        """
+        self._backend = backend if backend is not None else InMemoryJobBackend()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit(self, job_function, *job_arguments):
+        """Queues a job.
+
+        Parameters
+        ----------
+        job_function: function
+            The function that runs the job. It is called with the id of the job and a progress function followed by
+            the job arguments.
+            The progress function takes keyword arguments that are stored in the job record. The dictionary returned
+            by the job function is stored in the job record when it completes.
+        job_arguments: list
+            The arguments passed to the job function.
+
+        Returns
+        -------
+        str
+            The id of the job.
+
+        """
+        job_id = uuid.uuid4().hex
+        self._backend.create_job(job_id, {js_form_constants.JOB_ID: job_id,
+                                          js_form_constants.JOB_STATUS: JOB_QUEUED,
+                                          js_form_constants.ROWS_PROCESSED: 0,
+                                          js_form_constants.ISSUE_COUNT: 0})
+        self._executor.submit(self._run_job, job_id, job_function, job_arguments)
+        return job_id
+
+    def get_job(self, job_id):
+        """Gets the record of a job.
+
+        Parameters
+        ----------
+        job_id: str
+            The id of the job.
+
+        Returns
+        -------
+        dict
+            The job record. None if there is no job with the id.
+
+        """
+        return self._backend.get_job(job_id)
+
+    def shutdown(self, wait=True):
+        """Stops the worker threads.
+
+        Parameters
+        ----------
+        wait: bool
+            True if queued and running jobs should finish first.
+
+        Returns
+        -------
+
+        """
+        self._executor.shutdown(wait=wait)
+
+    def _run_job(self, job_id, job_function, job_arguments):
+        """Runs a job in a worker thread and stores its result or error in the job record.
+
+        Parameters
+        ----------
+        job_id: str
+            The id of the job.
+        job_function: function
+            The function that runs the job.
+        job_arguments: tuple
+            The arguments passed to the job function.
+
+        Returns
+        -------
+
+        """
+        self._backend.update_job(job_id, **{js_form_constants.JOB_STATUS: JOB_RUNNING})
+
+        def report_progress(**progress):
+            self._backend.update_job(job_id, **progress)
+
+        try:
+            job_result = job_function(job_id, report_progress, *job_arguments) or {}
+        except Exception:
+            self._backend.update_job(job_id, **{js_form_constants.JOB_STATUS: JOB_FAILED,
+                                                error_constants.ERROR_KEY: traceback.format_exc()})
+            return
+        self._backend.update_job(job_id, **dict(job_result, **{js_form_constants.JOB_STATUS: JOB_COMPLETED}))
+
+
+_job_manager = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager(max_workers=DEFAULT_MAX_WORKERS):
+    """Gets the job manager shared by the web process, creating it the first time it is needed.
+
+    Parameters
+    ----------
+    max_workers: int
+        The number of jobs that can run at the same time. Only used when the job manager is created.
+
+    Returns
+    -------
+    JobManager
+        The shared JobManager object.
+
+    """
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager(max_workers=max_workers)
+        return _job_manager
@@ -0,0 +1,53 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from hed.webinterface.app_factory import AppFactory
+from hed.webinterface.schema_pool import SchemaPool
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.hed_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data/HED.xml')
+        with open(cls.hed_file, 'rb') as opened_hed_file:
+            cls.hed_xml_content = opened_hed_file.read()
+        cls.hed_directory = tempfile.mkdtemp()
+        shutil.copy(cls.hed_file, os.path.join(cls.hed_directory, 'HED7.1.1.xml'))
+        app = AppFactory.create_app('config.TestConfig')
+        with app.app_context():
+            from hed.webinterface.routes import route_blueprint
+            app.register_blueprint(route_blueprint)
+            cls.app = app.test_client()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.hed_directory)
+
+    def test_get_uploaded_hed_dictionary(self):
+        schema_pool = SchemaPool(max_uploaded_schemas=1)
+        hed_dictionary = schema_pool.get_uploaded_hed_dictionary(io.BytesIO(self.hed_xml_content))
+        self.assertIs(schema_pool.get_uploaded_hed_dictionary(io.BytesIO(self.hed_xml_content)), hed_dictionary)
+        changed_hed_dictionary = schema_pool.get_uploaded_hed_dictionary(io.BytesIO(self.hed_xml_content + b'\n'))
+        self.assertIsNot(changed_hed_dictionary, hed_dictionary)
+        self.assertEqual(schema_pool.get_cache_info()['uploaded'],
+                         {'size': 1, 'max_size': 1, 'hits': 1, 'misses': 2, 'evictions': 1})
+
+    def test_preload_hed_versions(self):
+        schema_pool = SchemaPool()
+        self.assertEqual(schema_pool.preload_hed_versions(self.hed_directory), ['7.1.1'])
+        hed_dictionary = schema_pool.get_version_hed_dictionary(local_hed_directory=self.hed_directory)
+        self.assertIs(schema_pool.get_version_hed_dictionary('7.1.1', self.hed_directory), hed_dictionary)
+        self.assertEqual(schema_pool.get_cache_info()['versions'], {'size': 1, 'hits': 2, 'misses': 1})
+
+    def test_get_schema_pool_info(self):
+        response = self.app.get('/diagnostics/schema-pool')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('uploaded', json.loads(response.data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,15 @@
+import gzip
+import io
+import types
 import unittest
 
+from werkzeug.datastructures import FileStorage
+
 from hed.webinterface import web_utils
 from hed import webinterface
 from hed.webinterface.app_factory import AppFactory
+from hed.webinterface.constants.error import error_constants
+from hed.webinterface.constants.form import js_form_constants
 from hed.webinterface.constants.other import file_extension_constants, spreadsheet_constants, type_constants
 import os
 
@@ -31,6 +38,13 @@ class Test(unittest.TestCase):
                                                                  spreadsheet_constants.SPREADSHEET_FILE_EXTENSIONS)
         self.assertTrue(is_valid)
 
+    def test_legacy_excel_workbook_rejected(self):
+        legacy_workbook = FileStorage(stream=io.BytesIO(b''), filename='abc.xls')
+        form_request_object = types.SimpleNamespace(files={js_form_constants.SPREADSHEET_FILE: legacy_workbook})
+        with self.assertRaises(ValueError) as context:
+            webinterface.utils._get_uploaded_file_paths_from_forms(form_request_object)
+        self.assertEqual(str(context.exception), error_constants.INVALID_SPREADSHEET_EXTENSION)
+
     def test_generate_spreadsheet_validation_filename(self):
         spreadsheet_filename = 'abc.xls'
         expected_spreadsheet_filename = 'validated_' + spreadsheet_filename.rsplit('.')[0] + '.txt'
@@ -39,6 +53,45 @@ class Test(unittest.TestCase):
         self.assertTrue(validation_file_name)
         self.assertEqual(expected_spreadsheet_filename, validation_file_name)
 
+    def test_generate_validation_stream_chunks(self):
+        validation_issues = [{'code': 'row', 'message': 'Issues in row 2:\n'},
+                             {'code': 'invalidTag', 'message': '\tERROR: Invalid tag - "Bad/Tag"\n'}]
+        expected_text = ''.join(validation_issue['message'] for validation_issue in validation_issues)
+        chunks = list(webinterface.utils._generate_validation_stream_chunks(validation_issues))
+        self.assertEqual(b''.join(chunks).decode('utf-8'), expected_text)
+        compressed_chunks = list(webinterface.utils._generate_validation_stream_chunks(validation_issues * 1000,
+                                                                                      compress=True))
+        self.assertGreater(len(compressed_chunks), 1)
+        self.assertEqual(gzip.decompress(b''.join(compressed_chunks)).decode('utf-8'), expected_text * 1000)
+        self.assertFalse(list(webinterface.utils._generate_validation_stream_chunks([])))
+
+    def test_end_validation_issues_on_error(self):
+        def failing_validation_issues():
+            yield {'code': 'row', 'message': 'Issues in row 2:\n'}
+            raise RuntimeError('Worksheet could not be read')
+
+        validation_issues = list(webinterface.utils._end_validation_issues_on_error(failing_validation_issues()))
+        self.assertEqual(len(validation_issues), 2)
+        self.assertEqual(validation_issues[-1]['code'], webinterface.utils.VALIDATION_STREAM_ERROR_CODE)
+        self.assertTrue(validation_issues[-1]['message'].startswith(webinterface.utils.VALIDATION_STREAM_ERROR_MESSAGE))
+        self.assertIn('Worksheet could not be read', validation_issues[-1]['message'])
+        chunks = webinterface.utils._generate_validation_stream_chunks(
+            webinterface.utils._end_validation_issues_on_error(failing_validation_issues()), compress=True)
+        self.assertIn(webinterface.utils.VALIDATION_STREAM_ERROR_MESSAGE, gzip.decompress(b''.join(chunks)).decode())
+
+    def test_append_validation_summary(self):
+        validation_issues = [{'code': 'row', 'message': 'Issues in row 2:\n'},
+                             {'code': 'extraDelimiter', 'message': '\tERROR: Extra delimiter "," at index 4'},
+                             {'code': 'invalidTag', 'message': '\tERROR: Invalid tag - "Bad/Tag"\n'},
+                             {'code': 'capitalization', 'message': '\tWARNING: First word not capitalized\n'},
+                             {'code': webinterface.utils.VALIDATION_STREAM_ERROR_CODE,
+                              'message': webinterface.utils.VALIDATION_STREAM_ERROR_MESSAGE}]
+        summarized_issues = list(webinterface.utils._append_validation_summary(validation_issues))
+        self.assertEqual(summarized_issues[:-1], validation_issues)
+        self.assertEqual(summarized_issues[-1]['message'], 'Validation summary: 3 errors, 1 warnings\n')
+        summary, = webinterface.utils._append_validation_summary([])
+        self.assertEqual(summary['message'], 'Validation summary: 0 errors, 0 warnings\n')
+
     def test_convert_other_tag_columns_to_list(self):
         other_tag_columns_str = '1,2,3'
         expected_other_columns = [1, 2, 3]
@@ -0,0 +1,99 @@
+import os
+import shutil
+import threading
+import unittest
+
+from hed.webinterface.app_factory import AppFactory
+from hed.webinterface import web_utils
+from hed.webinterface.constants.error import error_constants
+from hed.webinterface.constants.form import js_form_constants, validation_arg_constants
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.upload_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data/job_upload')
+        cls.hed_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data/HED.xml')
+        app = AppFactory.create_app('config.TestConfig')
+        with app.app_context():
+            from hed.webinterface import utils, validation_jobs
+            from hed.webinterface.routes import route_blueprint
+            app.register_blueprint(route_blueprint)
+            web_utils.create_upload_directory(cls.upload_directory)
+            app.config['UPLOAD_FOLDER'] = cls.upload_directory
+            cls.app = app.test_client()
+            cls.utils = utils
+            cls.validation_jobs = validation_jobs
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.upload_directory)
+
+    def test_job_manager(self):
+        job_manager = self.validation_jobs.JobManager(max_workers=1)
+        job_can_finish = threading.Event()
+
+        def count_rows(job_id, report_progress, row_count):
+            report_progress(**{js_form_constants.ROWS_PROCESSED: 1})
+            job_can_finish.wait()
+            return {js_form_constants.ROWS_PROCESSED: row_count}
+
+        def fail(job_id, report_progress):
+            raise ValueError('Job failed')
+
+        job_id = job_manager.submit(count_rows, 3)
+        failed_job_id = job_manager.submit(fail)
+        self.assertIn(job_manager.get_job(failed_job_id)[js_form_constants.JOB_STATUS],
+                      [self.validation_jobs.JOB_QUEUED])
+        job_can_finish.set()
+        job_manager.shutdown()
+        job = job_manager.get_job(job_id)
+        self.assertEqual(job[js_form_constants.JOB_STATUS], self.validation_jobs.JOB_COMPLETED)
+        self.assertEqual(job[js_form_constants.ROWS_PROCESSED], 3)
+        failed_job = job_manager.get_job(failed_job_id)
+        self.assertEqual(failed_job[js_form_constants.JOB_STATUS], self.validation_jobs.JOB_FAILED)
+        self.assertIn('Job failed', failed_job[error_constants.ERROR_KEY])
+        self.assertIsNone(job_manager.get_job('job_that_does_not_exist'))
+
+    def test_in_memory_job_backend_removes_old_finished_jobs(self):
+        backend = self.validation_jobs.InMemoryJobBackend(max_finished_jobs=1)
+        for job_id in ['job1', 'job2', 'job3']:
+            backend.create_job(job_id, {js_form_constants.JOB_STATUS: self.validation_jobs.JOB_QUEUED})
+        backend.update_job('job1', **{js_form_constants.JOB_STATUS: self.validation_jobs.JOB_COMPLETED})
+        backend.update_job('job2', **{js_form_constants.JOB_STATUS: self.validation_jobs.JOB_FAILED})
+        self.assertIsNone(backend.get_job('job1'))
+        self.assertIsNotNone(backend.get_job('job2'))
+        self.assertIsNotNone(backend.get_job('job3'))
+
+    def test_run_spreadsheet_validation_job(self):
+        spreadsheet_file = os.path.join(self.upload_directory, 'spreadsheet.tsv')
+        with open(spreadsheet_file, 'w', encoding='utf-8') as opened_spreadsheet_file:
+            opened_spreadsheet_file.write('Event code\tHED tags\n')
+            opened_spreadsheet_file.write('1\tEvent/Category/Experimental stimulus\n')
+            opened_spreadsheet_file.write('2\tThis/Is/Not/A/Valid/Tag\n')
+        validation_arguments = {validation_arg_constants.SPREADSHEET_PATH: spreadsheet_file,
+                                validation_arg_constants.HED_XML_PATH: self.hed_file,
+                                validation_arg_constants.TAG_COLUMNS: [2],
+                                validation_arg_constants.COLUMN_PREFIX_DICTIONARY: {},
+                                validation_arg_constants.WORKSHEET_NAME: '',
+                                validation_arg_constants.HAS_COLUMN_NAMES: True,
+                                validation_arg_constants.CHECK_FOR_WARNINGS: False}
+        progress = []
+        validation_status = self.utils._run_spreadsheet_validation_job(
+            'job1', lambda **job_progress: progress.append(job_progress), validation_arguments, 'spreadsheet.tsv',
+            self.upload_directory, [spreadsheet_file])
+        self.assertFalse(os.path.exists(spreadsheet_file))
+        self.assertEqual(progress[-1], {js_form_constants.ROWS_PROCESSED: 2,
+                                        js_form_constants.ISSUE_COUNT: validation_status[js_form_constants.ISSUE_COUNT]})
+        self.assertTrue(validation_status[js_form_constants.ERROR_COUNT])
+        self.assertEqual(validation_status[js_form_constants.DOWNLOAD_FILE], 'validated_spreadsheet_job1.txt')
+        self.assertTrue(os.path.exists(os.path.join(self.upload_directory,
+                                                    validation_status[js_form_constants.DOWNLOAD_FILE])))
+
+    def test_get_validation_job_status(self):
+        response = self.app.get('/job-status/job_that_does_not_exist')
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()